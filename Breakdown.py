@@ -0,0 +1,312 @@
+# ==============================================================================
+#
+#     Breakdown.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+"""
+Hierarchy of the mean times of the network step:
+
+    network step
+        network function, e.g. psp
+            function of each population or projection, e.g. proj0 psp
+            overhead
+        overhead
+
+Each network function measured besides the step is a part of it, the
+functions of the objects are assigned to the parts by STEP_PARTS or else by
+their name. So timers added to ANNarchy appear without changes here. The
+overhead is the time span of a node which is not measured by its children.
+
+The hierarchy is built once per DataContainer with the inclusive and
+exclusive times of all nodes and tests as arrays, so navigating it is a
+lookup only.
+"""
+import warnings
+
+import numpy as np
+
+# Parts of the network step which are measured per population or projection as well:
+# (function of the network, object type, function of the objects)
+STEP_PARTS = [
+    ("neur_step", "pop", "step"),
+    ("proj_step", "proj", "step"),
+    ("psp", "proj", "psp"),
+    ("rng", "pop", "rng"),
+]
+
+# order of the parts of the network step in stacked charts, other parts follow and the overhead is last
+STACK_ORDER = ["psp", "neur_step", "proj_step", "rng", "record"]
+
+# function of the network which contains all others
+STEP_FUNCTION = "step"
+
+# label of the time span not measured by the children of a node
+OVERHEAD = "overhead"
+
+
+class Breakdown(object):
+    """
+    Hierarchy of the mean times of the network step of one DataContainer.
+    The nodes are numbered in depth-first order, node 0 is the network step.
+    The attributes are:
+
+        * labels -- name of each node
+        * series -- (obj_type, name, func) of each node, None for overheads
+        * parent -- index of the parent of each node, -1 for the root
+        * depth -- depth of each node, 0 for the root
+        * inclusive -- mean time of each node (tests x nodes)
+        * exclusive -- time not measured by the children (tests x nodes)
+    """
+    def __init__(self, data):
+        """
+        Build the hierarchy. It is empty if the network step was not measured.
+
+        Arguments:
+            * data (DataContainer) -- the measurement
+        """
+        self.labels = []
+        self.series = []
+        self._parent = []
+        self._children = []
+        self._columns = []
+
+        series = data.series()
+        try:
+            root = self._add(STEP_FUNCTION, ("net", "network", STEP_FUNCTION), -1, data.column("net", "network", STEP_FUNCTION))
+        except KeyError:
+            root = None
+
+        if root is not None:
+            parts = dict((net_func, (obj_type, func)) for net_func, obj_type, func in STEP_PARTS)
+            for col, (obj_type, name, func) in enumerate(series):
+                if obj_type != "net" or func == STEP_FUNCTION:
+                    continue
+
+                part = self._add(func, series[col], root, col)
+                part_type, part_func = parts.get(func, (None, func))
+                for child, (child_type, child_name, child_func) in enumerate(series):
+                    if child_type != "net" and child_func == part_func and part_type in (None, child_type):
+                        self._add(child_name, series[child], part, child)
+
+        self.parent = np.array(self._parent, dtype=np.int64)
+        self.depth = np.zeros(len(self._parent), dtype=np.int64)
+        for node in range(1, len(self._parent)):
+            self.depth[node] = self.depth[self._parent[node]] + 1
+
+        self._compute_times(data)
+
+    def _add(self, label, series, parent, col):
+        """
+        Append a node and return its index.
+        """
+        self.labels.append(label)
+        self.series.append(series)
+        self._parent.append(parent)
+        self._children.append([])
+        self._columns.append(col)
+        if parent >= 0:
+            self._children[parent].append(len(self._parent) - 1)
+        return len(self._parent) - 1
+
+    def _compute_times(self, data):
+        """
+        Gather the inclusive times of the measured nodes and append the overheads.
+        """
+        measured = np.array(self._columns, dtype=np.int64)
+        inclusive = data.mean_values()[:, measured] if len(measured) != 0 else np.zeros((data.num_tests(), 0))
+
+        # exclusive time = inclusive time - inclusive times of the children, missing children count as 0
+        children_sum = np.zeros_like(inclusive)
+        np.add.at(children_sum.T, self.parent[1:], np.nan_to_num(inclusive[:, 1:]).T)
+        exclusive = inclusive - children_sum
+
+        # each node with children gets an overhead leaf with its exclusive time
+        with_children = [node for node in range(len(self._children)) if len(self._children[node]) != 0]
+        for node in with_children:
+            self._add(OVERHEAD, None, node, -1)
+
+        self.inclusive = np.concatenate([inclusive, exclusive[:, with_children]], axis=1)
+        self.exclusive = np.concatenate([exclusive, exclusive[:, with_children]], axis=1)
+        self.parent = np.array(self._parent, dtype=np.int64)
+        self.depth = np.concatenate([self.depth, self.depth[with_children] + 1])
+        self._order()
+
+    def _order(self):
+        """
+        Number the nodes in depth-first order, the overhead last among its siblings.
+        """
+        order = []
+        stack = [0] if len(self._parent) != 0 else []
+        while len(stack) != 0:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(reversed(self._children[node]))
+
+        position = np.empty(len(order), dtype=np.int64)
+        position[order] = np.arange(len(order))
+
+        self.labels = [self.labels[node] for node in order]
+        self.series = [self.series[node] for node in order]
+        self.inclusive = self.inclusive[:, order]
+        self.exclusive = self.exclusive[:, order]
+        self.depth = self.depth[order]
+        self.parent = np.where(self.parent[order] >= 0, position[self.parent[order]], -1)
+        self._children = [[int(position[child]) for child in self._children[node]] for node in order]
+        self._index = dict((s, node) for node, s in enumerate(self.series) if s is not None)
+
+    def __len__(self):
+        """
+        Return the number of nodes.
+        """
+        return len(self.labels)
+
+    def children(self, node):
+        """
+        Return the indices of the children of a node.
+        """
+        return self._children[node]
+
+    def node(self, obj_type, name, func):
+        """
+        Return the index of the node of a function. Raises a KeyError if it is not part of the step.
+        """
+        return self._index[(obj_type, name, func)]
+
+    def path(self, node):
+        """
+        Return the labels from the root to a node.
+        """
+        labels = []
+        while node >= 0:
+            labels.append(self.labels[node])
+            node = self.parent[node]
+        return labels[::-1]
+
+    def parts(self, index, node):
+        """
+        Return the (label, inclusive time) pairs of the children of a node in one test,
+        the overhead is the last one.
+
+        Arguments:
+            * index -- number of the test
+            * node -- index of the node
+        """
+        return [(self.labels[child], float(self.inclusive[index, child])) for child in self._children[node]]
+
+    def subtree(self, node):
+        """
+        Return the indices of a node and all its descendants, they are contiguous
+        in depth-first order.
+        """
+        end = node + 1
+        while end < len(self) and self.depth[end] > self.depth[node]:
+            end += 1
+        return np.arange(node, end)
+
+    def find(self, path):
+        """
+        Return the index of the node with the given labels from the root, see path().
+        Raises a KeyError if there is no such node.
+        """
+        if len(self) == 0 or len(path) == 0 or path[0] != self.labels[0]:
+            raise KeyError(path)
+
+        node = 0
+        for label in path[1:]:
+            for child in self._children[node]:
+                if self.labels[child] == label:
+                    node = child
+                    break
+            else:
+                raise KeyError(path)
+        return node
+
+    def spans(self, node, values):
+        """
+        Place a node and its descendants side by side on a line: the node spans
+        its value, the children share the span of their parent in proportion to
+        their values. Negative and missing values count as 0. Returns the arrays
+        (nodes, start, width, depth) of the subtree, the depth relative to node.
+
+        Arguments:
+            * node -- index of the node
+            * values -- value of each node, e.g. a row of inclusive
+        """
+        nodes = self.subtree(node)
+        values = np.maximum(np.nan_to_num(values[nodes]), 0.0)
+        depth = self.depth[nodes] - self.depth[node]
+        parent = self.parent[nodes] - node
+
+        start = np.zeros(len(nodes))
+        width = np.zeros(len(nodes))
+        width[0] = values[0]
+        for d in range(1, depth.max() + 1 if len(nodes) != 0 else 0):
+            # in depth-first order the children of each parent are contiguous on their level
+            level = np.flatnonzero(depth == d)
+            p = parent[level]
+            total = np.bincount(p, weights=values[level], minlength=len(nodes))[p]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                width[level] = np.where(total > 0, width[p] * values[level] / total, 0.0)
+
+            before = np.cumsum(width[level]) - width[level]
+            first = np.flatnonzero(np.concatenate(([True], p[1:] != p[:-1])))
+            group = np.repeat(first, np.diff(np.concatenate((first, [len(level)]))))
+            start[level] = start[p] + before - before[group]
+
+        return nodes, start, width, depth
+
+    def mean_inclusive(self):
+        """
+        Return the inclusive times of the nodes averaged over the tests.
+        """
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            return np.nanmean(self.inclusive, axis=0)
+
+
+def stack_parts(breakdowns):
+    """
+    Return the parts of the network step of several measurements as (parts, values):
+    the labels of the parts ordered by STACK_ORDER with the overhead last, and their
+    mean times as (parts x measurements) array, 0 if a part was not measured.
+
+    Arguments:
+        * breakdowns -- list of Breakdowns
+    """
+    parts = list(STACK_ORDER)
+    for breakdown in breakdowns:
+        for node in (breakdown.children(0) if len(breakdown) != 0 else []):
+            if not breakdown.labels[node] in parts and breakdown.labels[node] != OVERHEAD:
+                parts.append(breakdown.labels[node])
+    parts.append(OVERHEAD)
+
+    row = dict((part, i) for i, part in enumerate(parts))
+    values = np.zeros((len(parts), len(breakdowns)))
+    for k, breakdown in enumerate(breakdowns):
+        if len(breakdown) == 0:
+            continue
+        children = np.array(breakdown.children(0), dtype=np.int64)
+        rows = [row[breakdown.labels[node]] for node in children]
+        values[rows, k] = np.nan_to_num(breakdown.mean_inclusive()[children])
+
+    # parts measured in none of the measurements are dropped
+    measured = [i for i, part in enumerate(parts) if part == OVERHEAD or values[i].any()]
+    return [parts[i] for i in measured], values[measured]
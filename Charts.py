@@ -21,14 +21,54 @@
 #     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
 # ==============================================================================
+import datetime
+from collections import OrderedDict
+
 from PyQt5 import QtCore, QtGui
 from PyQt5.QtWidgets import QWidget, QVBoxLayout
 
-from matplotlib.backends.backend_qt4agg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.pyplot as plt
-
 import numpy as np
 
+from Throughput import plot_roofline
+
+# number of rendered charts kept by each widget, see MatplotlibWidget.present(),
+# a render of a chart of 800 x 600 pixels takes about 2 MB
+RENDER_CACHE_SIZE = 32
+
+# bars of the icicle chart narrower than this part of the axis get no label
+ICICLE_LABEL_WIDTH = 0.08
+
+
+def _part_colors(breakdown, nodes, depth, parts=None):
+    """
+    Return the colors (RGBA array) of the nodes of Breakdown.spans(): each child of the
+    first node and its descendants get the color of the child's label, overheads are
+    grey and the first node is white.
+
+    Arguments:
+        * breakdown (Breakdown) -- the hierarchy
+        * nodes, depth -- see Breakdown.spans()
+        * parts -- color number by label, new labels are added, so several charts can
+          share the colors -- default = None
+    """
+    from matplotlib.colors import to_rgba
+
+    if parts is None:
+        parts = {}
+
+    # index of the child of the first node each node belongs to, parents come first in depth-first order
+    top = np.arange(len(nodes))
+    parent = breakdown.parent[nodes] - nodes[0]
+    for i in np.flatnonzero(depth > 1):
+        top[i] = top[parent[i]]
+
+    colors = np.empty((len(nodes), 4))
+    for i in np.flatnonzero(depth == 1):
+        colors[top == i] = to_rgba("C" + str(parts.setdefault(breakdown.labels[nodes[i]], len(parts)) % 10))
+    colors[np.array([breakdown.series[n] is None for n in nodes], dtype=bool)] = (0.8, 0.8, 0.8, 1.0)
+    colors[0] = (1.0, 1.0, 1.0, 1.0)
+    return colors
+
 
 class MatplotlibWidget(QWidget):
     """
@@ -43,25 +83,94 @@ class MatplotlibWidget(QWidget):
         """
         super(MatplotlibWidget, self).__init__(parent)
 
-        self._figure = plt.figure(facecolor='white')
-        self._canvas = FigureCanvas(self._figure)
+        # figure and canvas are created when the widget is shown the first time
+        self._figure = None
+        self._canvas = None
+
+        # rendered charts by key, the least recently shown is dropped first
+        self._renders = OrderedDict()
+        self._pending_key = None
 
         self._layoutVertical = QVBoxLayout(self)
+
+    def _create_canvas(self):
+        """
+        Create figure and canvas. matplotlib is imported on first use, so the charts
+        of not yet opened tabs do not slow down the start of the application.
+        """
+        if self._figure is not None:
+            return
+
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+
+        self._figure = Figure(facecolor='white')
+        self._canvas = FigureCanvas(self._figure)
+        self._canvas.mpl_connect("draw_event", self._drawn)
         self._layoutVertical.addWidget(self._canvas)
 
+    def showEvent(self, event):
+        """
+        Create the canvas when the widget is shown the first time.
+        """
+        self._create_canvas()
+        super(MatplotlibWidget, self).showEvent(event)
+
     def figure(self):
         """
         Return matplotlib-figure of the widget.
         """
+        self._create_canvas()
         return self._figure
     
+    def present(self, key=None):
+        """
+        Show the chart after its artists were changed. If the chart was rendered
+        before under the same key (and size), the cached pixels are copied onto
+        the canvas (blitting). Otherwise the canvas is redrawn when Qt is idle and
+        the result is cached under key.
+
+        Arguments:
+            * key -- identifies the data and options shown, None to skip the cache -- default = None
+        """
+        if key is not None:
+            entry = self._renders.get(key)
+            if entry is not None and entry[0] == self._canvas.get_width_height():
+                self._renders.move_to_end(key)
+                self._pending_key = None
+                self._canvas.restore_region(entry[1])
+                self._canvas.blit(self._figure.bbox)
+                return
+
+        self._pending_key = key
+        self._canvas.draw_idle()
+
+    def _drawn(self, event):
+        """
+        Cache the chart rendered for present().
+        """
+        if self._pending_key is None:
+            return
+        self._renders[self._pending_key] = (self._canvas.get_width_height(), self._canvas.copy_from_bbox(self._figure.bbox))
+        self._renders.move_to_end(self._pending_key)
+        while len(self._renders) > RENDER_CACHE_SIZE:
+            self._renders.popitem(last=False)
+        self._pending_key = None
+
+    def forget(self):
+        """
+        Drop the cached renders, e.g. if the data changed.
+        """
+        self._renders.clear()
+        self._pending_key = None
+
     def clear(self):
         """
         Clear the chart.
         """
         # create an axis
-        self._figure.clf()
-        self._canvas.draw()
+        self.figure().clf()
+        self.present()
 
 class PieChartWidget(MatplotlibWidget):
     """
@@ -77,7 +186,7 @@ class PieChartWidget(MatplotlibWidget):
         super(PieChartWidget, self).__init__(parent)
 
     @QtCore.pyqtSlot()
-    def draw(self, data, title, percentage):
+    def draw(self, data, title, percentage, key=None):
         """
         Draw pie chart from given data.
 
@@ -85,6 +194,7 @@ class PieChartWidget(MatplotlibWidget):
             * data (array) -- values to draw
             * title (str) -- text shown over the chart
             * percentage (boolean) -- data shown as percentages?
+            * key -- identifies data and options of the chart, see present() -- default = None
 
         Signals:
             * drawPieChart(PyQt_PyObject) emited from PieChartTree.current_item_changed()
@@ -102,9 +212,7 @@ class PieChartWidget(MatplotlibWidget):
         else:
             form = lambda p: "{:.4f}".format(p * total / 100)
             
-        # create an axis
-        ax = self._figure.gca()
-        ax.clear()
+        ax = self._axes(polar=False)
 
         # draw chart
         ax.pie(values, labels=labels,
@@ -121,7 +229,61 @@ class PieChartWidget(MatplotlibWidget):
         ax.set_aspect('equal')
 
         # refresh canvas
-        self._canvas.draw()
+        self.present(key)
+
+    def _axes(self, polar):
+        """
+        Return the cleared axis of the figure, it is created again if the projection changed.
+        """
+        figure = self.figure()
+        if len(figure.axes) == 0 or (figure.axes[0].name == "polar") != polar:
+            figure.clf()
+            return figure.add_subplot(111, projection="polar" if polar else None)
+
+        ax = figure.axes[0]
+        ax.clear()
+        return ax
+
+    def draw_sunburst(self, breakdown, index, node, title, key=None):
+        """
+        Draw a node of a Breakdown and all its descendants as rings around each
+        other, the angle of a segment is its share of the time of the node. All
+        segments are drawn by one bar call.
+
+        Arguments:
+            * breakdown (Breakdown) -- the hierarchy
+            * index -- number of the test
+            * node -- index of the node in the center
+            * title (str) -- text shown over the chart
+            * key -- identifies data and options of the chart, see present() -- default = None
+        """
+        # the angle of a segment is its share of the time of the node in the center
+        nodes, start, width, depth = breakdown.spans(node, breakdown.inclusive[index])
+        values = width
+        if width[0] > 0:
+            start, width = start * 2.0 * np.pi / width[0], width * 2.0 * np.pi / width[0]
+
+        colors = _part_colors(breakdown, nodes, depth)
+
+        ax = self._axes(polar=True)
+        ax.bar(start + width / 2.0, np.ones(len(nodes)), width=width, bottom=depth, color=colors,
+               edgecolor="white", linewidth=0.5, align="center")
+
+        # labels of the segments with enough space, i.e. arc length
+        total = values[0]
+        ax.text(0.0, 0.0, "%s\n(%.4f)" % (breakdown.labels[node], total), ha="center", va="center")
+        for i in np.flatnonzero((width * (depth + 0.5) > 0.45) & (depth > 0)):
+            percent = 100.0 * values[i] / total if total > 0 else 0.0
+            ax.text(start[i] + width[i] / 2.0, depth[i] + 0.5, "%s\n%.1f%%" % (breakdown.labels[nodes[i]], percent),
+                    ha="center", va="center", fontsize="small")
+
+        ax.set_axis_off()
+        ax.set_theta_zero_location("N")
+        ax.set_ylim(0, depth.max() + 1)
+        ax.set_title(title)
+
+        # refresh canvas
+        self.present(key)
 
 class ErrorbarChartWidget(MatplotlibWidget):
     """
@@ -136,58 +298,476 @@ class ErrorbarChartWidget(MatplotlibWidget):
         """
         super(ErrorbarChartWidget, self).__init__(parent)
 
+        # artists of the shown chart, reused if the next chart has the same layout
+        self._containers = []
+        self._layout = None
+
     def draw(self, values, std_values=0, labels=[], xlabel="test nr.", ylabel="mean_value (in ms)",
-             yscale="linear"):
+             yscale="linear", key=None):
         """
-        Draw errorbar chart from given data.
+        Draw errorbar chart from given data. If the number of graphs and values, the
+        labels and the use of errorbars are the same as in the shown chart, only the
+        data of the existing artists is changed.
 
         Arguments:
             * values (array) -- data values to draw
-            * std_values (array) -- values of the errorbar
+            * std_values (array) -- values of the errorbar, symmetric or (2 x n) arrays of lower and upper errors
             * label (array) -- values to identify each graph
             * xlabel (text) -- text shown at x-axis
             * ylabel (text) -- text shown at y-axis
             * yscale (text) -- type of y-axis scale (linear/log)
+            * key -- identifies data and options of the chart, see present() -- default = None
 
         Signals:
             * drawErrorbarChart(PyQt_PyObject,PyQt_PyObject) emited from
                 ErrorbarChartTree.current_item_changed()
         """
+        ax = self.figure().gca()
+        with_errors = not (isinstance(std_values, int) and std_values == 0)
+        layout = (tuple(len(v) for v in values), with_errors, tuple(labels), xlabel, ylabel)
+
+        if layout == self._layout:
+            # same layout, move the existing artists
+            ax.ignore_existing_data_limits = True
+            for i, container in enumerate(self._containers):
+                self._update_errorbar(ax, container, values[i], std_values[i] if with_errors else None)
+            ax.autoscale_view()
+        else:
+            # create an axis
+            ax.clear()
+            self._containers = []
+
+            # draw errorbar chart
+            for i in range(len(values)):
+                lbl = ''
+                if len(labels) != 0:
+                    lbl = labels[i]
+
+                x = np.arange(0.0, len(values[i]), 1.0)
+                y = values[i]
+
+                if not with_errors:
+                    self._containers.append(ax.errorbar(x, y, fmt='-o', label=lbl))
+                else:
+                    self._containers.append(ax.errorbar(x, y, yerr=std_values[i], fmt='-o', label=lbl))
+
+            # add options to the chart
+            # ax.set_title('variable, symmetric error')
+            ax.set_xlabel(xlabel, fontsize=18)
+            ax.set_ylabel(ylabel, fontsize=18)
+            ax.set_xticks(np.arange(min(x), max(x) + 1, np.ceil(len(values[0]) / 20.0)))
+            ax.grid(True)
+            if len(labels) != 0:
+                ax.legend()
+            self._layout = layout
 
-        # create an axis
-        ax = self._figure.gca()
+        ax.set_yscale(yscale)
+
+        # show graph
+        self.present(key)
+
+    @staticmethod
+    def _update_errorbar(ax, container, values, errors):
+        """
+        Set new values and errors of the artists of one ax.errorbar() call and
+        extend the data limits of ax by them.
+        """
+        y = np.asarray(values, dtype=np.float64)
+        x = np.arange(0.0, len(y), 1.0)
+        line, caps, bars = container.lines
+        line.set_data(x, y)
+        ax.update_datalim(np.column_stack((x, y)))
+
+        if errors is not None:
+            errors = np.asarray(errors, dtype=np.float64)
+            lower, upper = (errors, errors) if errors.ndim == 1 else (errors[0], errors[1])
+            low = np.column_stack((x, y - lower))
+            high = np.column_stack((x, y + upper))
+            bars[0].set_segments(np.stack((low, high), axis=1))
+            if len(caps) == 2:
+                caps[0].set_data(low.T)
+                caps[1].set_data(high.T)
+            ax.update_datalim(low[np.isfinite(low[:, 1])])
+            ax.update_datalim(high[np.isfinite(high[:, 1])])
+
+class SpeedupChartWidget(MatplotlibWidget):
+    """
+     Draws the speedup over the number of threads and the fitted scaling models as Qt-Widget
+    """
+    def __init__(self, parent=None):
+        """
+        Init function.
+
+        Arguments:
+            * parent -- parent element of this widget -- default = None
+        """
+        super(SpeedupChartWidget, self).__init__(parent)
+
+    def draw(self, measured, models=[], ylabel="1 Thread / x Threads", yscale="linear", key=None):
+        """
+        Draw the measured speedups as points and the models as lines.
+
+        Arguments:
+            * measured -- list of (label, threads, speedups, std) of the measurements
+            * models -- list of (label, threads, speedups, peak) of the fitted models, peak is marked if not None
+            * ylabel (text) -- text shown at y-axis
+            * yscale (text) -- type of y-axis scale (linear/log)
+            * key -- identifies data and options of the chart, see present() -- default = None
+        """
+        ax = self.figure().gca()
         ax.clear()
 
-        # draw errorbar chart
-        for i in range(len(values)):
-            lbl = ''
-            if len(labels) != 0:
-                lbl = labels[i]
+        max_threads = 1
+        for label, threads, speedups, std in measured:
+            ax.errorbar(threads, speedups, yerr=std, fmt='o', label=label, zorder=3)
+            max_threads = max(max_threads, max(threads))
 
-            x = np.arange(0.0, len(values[i]), 1.0)
-            y = values[i]
+        for label, threads, speedups, peak in models:
+            line, = ax.plot(threads, speedups, '-', label=label)
+            if peak is not None:
+                ax.axvline(peak, color=line.get_color(), linestyle=':')
+            max_threads = max(max_threads, max(threads))
 
-            if std_values == 0:
-                ax.errorbar(x, y, fmt='-o', label=lbl)
-            else:
-                ax.errorbar(x, y, yerr=std_values[i], fmt='-o', label=lbl)
+        # linear speedup as reference
+        ax.plot([1, max_threads], [1, max_threads], '--', color='gray', label="linear")
+
+        ax.set_xlabel("threads", fontsize=18)
+        ax.set_ylabel(ylabel, fontsize=18)
+        ax.set_yscale(yscale)
+        if max_threads >= 16:
+            ax.set_xscale("log", base=2)
+        ax.grid(True)
+        ax.legend()
+
+        # show graph
+        self.present(key)
+
+
+class HistoryChartWidget(MatplotlibWidget):
+    """
+     Draws the mean time of a function over the date of the runs as Qt-Widget
+    """
+    def __init__(self, parent=None):
+        """
+        Init function.
+
+        Arguments:
+            * parent -- parent element of this widget -- default = None
+        """
+        super(HistoryChartWidget, self).__init__(parent)
+
+    def draw(self, dates, mean_values, std_values, labels=[], title="", ylabel="mean_value (in ms)"):
+        """
+        Draw the mean values with their std as band over the dates.
+
+        Arguments:
+            * dates -- dates of the runs in seconds since the epoch
+            * mean_values -- mean value of each run
+            * std_values -- std value of each run
+            * labels -- text shown at each point, e.g. the commit -- default = []
+            * title (str) -- text shown over the chart
+            * ylabel (str) -- text shown at y-axis
+        """
+        ax = self.figure().gca()
+        ax.clear()
+
+        x = [datetime.datetime.fromtimestamp(d) for d in dates]
+        mean_values = np.asarray(mean_values)
+        std_values = np.nan_to_num(np.asarray(std_values))
+        ax.plot(x, mean_values, 'o-', zorder=3)
+        ax.fill_between(x, mean_values - std_values, mean_values + std_values, alpha=0.3)
+
+        # label the points only as long as they are readable
+        if len(labels) <= 30:
+            for xi, yi, label in zip(x, mean_values, labels):
+                if label:
+                    ax.annotate(label, (xi, yi), textcoords="offset points", xytext=(0, 6), ha="center", fontsize=8)
+
+        ax.set_title(title)
+        ax.set_ylabel(ylabel, fontsize=18)
+        ax.grid(True)
+        self.figure().autofmt_xdate()
+
+        # show graph
+        self.present()
+
+
+class TimelineChartWidget(MatplotlibWidget):
+    """
+     Draws long traces of raw data over the step as Qt-Widget. Only the min/max
+     envelope of the visible range is drawn (see Timeline.MinMaxPyramid), it is
+     recomputed when the chart is zoomed or panned.
+    """
+    def __init__(self, parent=None):
+        """
+        Init function.
+
+        Arguments:
+            * parent -- parent element of this widget -- default = None
+        """
+        super(TimelineChartWidget, self).__init__(parent)
+        self._toolbar = None
+        self._traces = []       # (Line2D, MinMaxPyramid) of each trace
+
+    def _create_canvas(self):
+        """
+        Create figure and canvas with a toolbar to zoom and pan, the mouse wheel zooms as well.
+        """
+        if self._figure is not None:
+            return
+        super(TimelineChartWidget, self)._create_canvas()
+
+        from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT
+        self._toolbar = NavigationToolbar2QT(self._canvas, self)
+        self._layoutVertical.insertWidget(0, self._toolbar)
+        self._canvas.mpl_connect("scroll_event", self._scroll)
+        self._canvas.mpl_connect("resize_event", lambda event: self._update_lines())
+
+    def draw(self, traces, boundaries=[], xlabel="step", ylabel="time (in ms)", yscale="linear"):
+        """
+        Draw the traces over the step.
+
+        Arguments:
+            * traces -- list of (label, MinMaxPyramid)
+            * boundaries -- steps where a new test starts, marked by vertical lines -- default = []
+            * xlabel (text) -- text shown at x-axis
+            * ylabel (text) -- text shown at y-axis
+            * yscale (text) -- type of y-axis scale (linear/log)
+        """
+        ax = self.figure().gca()
+        ax.clear()
+
+        self._traces = []
+        length = 1
+        lower, upper = np.inf, -np.inf
+        for label, pyramid in traces:
+            line, = ax.plot([], [], '-', linewidth=0.8, label=label)
+            self._traces.append((line, pyramid))
+            length = max(length, len(pyramid))
+            low, high = pyramid.limits()
+            lower, upper = np.nanmin([lower, low]), np.nanmax([upper, high])
+
+        # too many lines would hide the data
+        if len(boundaries) <= 100:
+            for step in boundaries[1:]:
+                ax.axvline(step, color='gray', linestyle=':', linewidth=0.8)
 
-        # add options to the chart
-        # ax.set_title('variable, symmetric error')
         ax.set_xlabel(xlabel, fontsize=18)
         ax.set_ylabel(ylabel, fontsize=18)
         ax.set_yscale(yscale)
-        ax.set_xticks(np.arange(min(x), max(x) + 1, np.ceil(len(values[0]) / 20.0)))
         ax.grid(True)
-        if len(labels) != 0:
-            ax.legend()
+        if np.isfinite(lower) and np.isfinite(upper):
+            margin = 0.05 * (upper - lower) if upper > lower else 0.5
+            ax.set_ylim(lower - margin if yscale == "linear" else lower / 1.1, upper + margin)
+        ax.set_xlim(0, length)
+        self._update_lines()
+        if len(traces) != 0:
+            ax.legend(loc="upper right")
+
+        # the envelope depends on the visible range, ax.clear() removed the old callbacks
+        ax.callbacks.connect("xlim_changed", lambda ax: self._update_lines())
+        if self._toolbar is not None:
+            self._toolbar.update()
+
+        # show graph
+        self.present()
+
+    def _update_lines(self):
+        """
+        Set the envelope of the visible range of each trace, two points per pixel.
+        """
+        if len(self._traces) == 0:
+            return
+        ax = self.figure().gca()
+        start, stop = ax.get_xlim()
+        width = max(int(ax.bbox.width), 100)
+        for line, pyramid in self._traces:
+            line.set_data(*pyramid.line(start - 1, stop + 1, width))
+
+    def _scroll(self, event):
+        """
+        Zoom the x-axis around the mouse position.
+        """
+        if event.inaxes is None:
+            return
+        ax = event.inaxes
+        start, stop = ax.get_xlim()
+        scale = 0.8 if event.button == "up" else 1.25
+        ax.set_xlim(event.xdata - (event.xdata - start) * scale, event.xdata + (stop - event.xdata) * scale)
+        self._canvas.draw_idle()
+
+
+class RooflineChartWidget(MatplotlibWidget):
+    """
+     Draws the achieved GFLOP/s of functions over their intensity (FLOP / byte) below
+     the roofline of the machine as Qt-Widget, see Throughput.
+    """
+    def __init__(self, parent=None):
+        """
+        Init function.
+
+        Arguments:
+            * parent -- parent element of this widget -- default = None
+        """
+        super(RooflineChartWidget, self).__init__(parent)
+
+    def draw(self, points, roofline=None, key=None):
+        """
+        Draw the roofline chart.
+
+        Arguments:
+            * points -- list of (label, threads, intensity, GFLOP/s) arrays, see Throughput.roofline_points()
+            * roofline (Roofline) -- the machine, only the points are drawn without it -- default = None
+            * key -- identifies data and options of the chart, see present() -- default = None
+        """
+        ax = self.figure().gca()
+        ax.clear()
+        plot_roofline(ax, points, roofline)
+
+        # show graph
+        self.present(key)
+
+
+class IcicleChartWidget(MatplotlibWidget):
+    """
+     Draws the Breakdowns of several measurements as icicle charts below each other:
+     each node is a bar as wide as its time and its parts lie below it. The time
+     axis is shared, so faster measurements have shorter bars. All bars of a
+     measurement are one PolyCollection, so thousands of objects are drawn fast.
+     A click on a bar zooms into it, a click on the top bar or a right click zooms out.
+    """
+    def __init__(self, parent=None):
+        """
+        Init function.
+
+        Arguments:
+            * parent -- parent element of this widget -- default = None
+        """
+        super(IcicleChartWidget, self).__init__(parent)
+        self._variants = []
+        self._path = None
+        self._shown = []        # (axis, breakdown, nodes, start, width, depth) of each drawn measurement
+
+    def _create_canvas(self):
+        """
+        Create figure and canvas, clicks zoom into the chart.
+        """
+        if self._figure is not None:
+            return
+        super(IcicleChartWidget, self)._create_canvas()
+        self._canvas.mpl_connect("button_press_event", self._click)
+
+    def draw(self, variants):
+        """
+        Draw the icicle charts, the zoomed node is kept if it exists in one of them.
+
+        Arguments:
+            * variants -- list of (title, Breakdown) pairs, e.g. one per thread count
+        """
+        self._variants = variants
+        if self._path is not None and not any(self._has_node(breakdown, self._path) for _, breakdown in variants):
+            self._path = None
+        self._draw_variants()
+
+    def path(self):
+        """
+        Return the labels of the zoomed node, None if the network step is shown.
+        """
+        return self._path
+
+    @staticmethod
+    def _has_node(breakdown, path):
+        """
+        Return true if the breakdown has a node with the given path.
+        """
+        try:
+            breakdown.find(path)
+            return True
+        except KeyError:
+            return False
+
+    def _draw_variants(self):
+        """
+        Draw the zoomed node of all measurements.
+        """
+        from matplotlib.collections import PolyCollection
+
+        figure = self.figure()
+        figure.clf()
+        self._shown = []
+
+        spans = []
+        for title, breakdown in self._variants:
+            if len(breakdown) == 0 or (self._path is not None and not self._has_node(breakdown, self._path)):
+                spans.append(None)
+                continue
+            node = breakdown.find(self._path) if self._path is not None else 0
+            spans.append(breakdown.spans(node, breakdown.mean_inclusive()))
+
+        extent = max([s[2][0] for s in spans if s is not None] + [0.0])
+        parts = {}
+        first = None
+        for i, ((title, breakdown), span) in enumerate(zip(self._variants, spans)):
+            ax = figure.add_subplot(len(self._variants), 1, i + 1, sharex=first)
+            first = first or ax
+            if span is None:
+                ax.set_title(title + " (not measured)")
+                ax.set_yticks([])
+                continue
+
+            nodes, start, width, depth = span
+            x0, x1, y0 = start, start + width, depth.astype(np.float64)
+            verts = np.stack([np.stack([x0, y0], axis=1), np.stack([x1, y0], axis=1),
+                              np.stack([x1, y0 + 1.0], axis=1), np.stack([x0, y0 + 1.0], axis=1)], axis=1)
+            colors = _part_colors(breakdown, nodes, depth, parts)
+            colors[0] = (0.9, 0.9, 0.95, 1.0)
+            ax.add_collection(PolyCollection(verts, facecolors=colors, edgecolors="white", linewidths=0.5))
+
+            # labels of the bars which are wide enough
+            for j in np.flatnonzero(width > ICICLE_LABEL_WIDTH * extent):
+                ax.text(start[j] + width[j] / 2.0, depth[j] + 0.5, "%s\n%.4f" % (breakdown.labels[nodes[j]], width[j]),
+                        ha="center", va="center", fontsize="small", clip_on=True)
+
+            ax.set_ylim(depth.max() + 1, 0)
+            ax.set_yticks([])
+            ax.set_title(title + " - " + " / ".join(breakdown.path(nodes[0])) + " (%.4f ms)" % width[0])
+            self._shown.append((ax, breakdown, nodes, start, width, depth))
+
+        if first is not None:
+            first.set_xlim(0, extent if extent > 0 else 1.0)
+            figure.axes[-1].set_xlabel("time (in ms)")
+            figure.tight_layout()
 
         # show graph
-        self._canvas.draw()
-        
+        self.present()
+
+    def _click(self, event):
+        """
+        Zoom into the clicked bar or out of the shown node.
+        """
+        for ax, breakdown, nodes, start, width, depth in self._shown:
+            if event.inaxes is not ax or event.xdata is None:
+                continue
+
+            row = int(np.floor(event.ydata))
+            hit = np.flatnonzero((depth == row) & (start <= event.xdata) & (event.xdata < start + width))
+            if event.button == 3 or row == 0:
+                # zoom out
+                if self._path is not None:
+                    self._path = self._path[:-1] if len(self._path) > 2 else None
+            elif len(hit) != 0 and len(breakdown.children(nodes[hit[0]])) != 0:
+                self._path = breakdown.path(nodes[hit[0]])
+            else:
+                return
+
+            self._draw_variants()
+            return
+
+
 class BarChartWidget(MatplotlibWidget):
     """
-     Draws a errorbar chart as Qt-Widget from data
+     Draws a stacked bar chart as Qt-Widget, e.g. the parts of the network step of
+     several measurements. Each layer of the stack is drawn by one bar call.
     """
     def __init__(self, parent=None):
         """
@@ -198,23 +778,46 @@ class BarChartWidget(MatplotlibWidget):
         """
         super(BarChartWidget, self).__init__(parent)
 
-    def draw(self, data, title, percentage):
+    def draw(self, values, parts, labels, title="", ylabel="mean_value (in ms)", percentage=False, key=None):
         """
-        Draw pie chart from given data.
+        Draw the stacked bars from pre-aggregated values.
 
         Arguments:
-            * data (array) -- values to draw
-            * title (str) -- text shown over the chart
-            * percentage (boolean) -- data shown as percentages?
-
-        Signals:
-            * drawPieChart(PyQt_PyObject) emited from PieChartTree.current_item_changed()
+            * values -- (parts x bars) array, negative and NaN values are drawn as 0
+            * parts (list) -- name of each layer, the layer "overhead" is grey
+            * labels (list) -- name of each bar
+            * title (str) -- text shown over the chart -- default = ""
+            * ylabel (str) -- text shown at y-axis -- default = "mean_value (in ms)"
+            * percentage (boolean) -- show each bar as 100 % -- default = False
+            * key -- identifies data and options of the chart, see present() -- default = None
         """
+        values = np.maximum(np.nan_to_num(np.asarray(values, dtype=np.float64)), 0.0)
+        if percentage:
+            total = values.sum(axis=0)
+            values = 100.0 * values / np.where(total > 0, total, 1.0)
+            ylabel = "share (in %)"
+
         # create an axis
-        ax = self._figure.gca()
+        ax = self.figure().gca()
         ax.clear()
 
-        print("x")
+        x = np.arange(len(labels))
+        bottom = np.zeros(len(labels))
+        for i, part in enumerate(parts):
+            color = (0.8, 0.8, 0.8, 1.0) if part == "overhead" else "C" + str(i % 10)
+            ax.bar(x, values[i], bottom=bottom, label=part, color=color, width=0.6)
+            bottom += values[i]
+
+        ax.set_xticks(x)
+        ax.set_xticklabels(labels, rotation=45 if len(labels) > 6 else 0, ha="right" if len(labels) > 6 else "center")
+        ax.set_ylabel(ylabel, fontsize=18)
+        ax.set_title(title)
+        ax.grid(True, axis="y")
+        if len(parts) != 0:
+            # first layer at the bottom of the legend as in the stack
+            handles, names = ax.get_legend_handles_labels()
+            ax.legend(handles[::-1], names[::-1], loc="upper left", bbox_to_anchor=(1.01, 1.0))
+        self.figure().subplots_adjust(right=0.78)
 
         # show graph
-        self._canvas.draw()
\ No newline at end of file
+        self.present(key)
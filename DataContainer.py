@@ -22,8 +22,19 @@
 #
 # ==============================================================================
 from lxml import etree
-from numpy import zeros, mean, std
+from numpy import array, concatenate, cumsum, float64, fromstring, full, int64, isnan, memmap, nan, where, zeros
+from zlib import crc32
+import json
 import re
+import warnings
+
+from Statistics import masked_mean_std, remove_outliers, split_phases, WARMUP_MAX_FRACTION, WARMUP_PENALTY
+
+# paradigms running on a GPU, their number of threads is the number of threads per block
+GPU_PARADIGMS = ["cuda"]
+
+# threads per block of GPU measurements without <threads_per_block>
+DEFAULT_THREADS_PER_BLOCK = 32
 
 
 class DataContainer(object):
@@ -40,19 +51,61 @@ class DataContainer(object):
         self._num_threads = 0
         self._rank = ''
         self._num_tests = 0
+
+        # number of neurons of the populations and synapses of the projections by (obj_type, name)
+        self._sizes = {}
+
+        # GPU config: name of the device, default threads per block and the
+        # launch configuration (blocks, threads per block) of the kernels by (obj_type, name, func)
+        self._device = ''
+        self._threads_per_block = 0
+        self._kernels = {}
         
-        # performance data
-        # [obj_type][name][func]
-        self._data = {}
+        # performance data, stored column-wise:
+        # one column for each (obj_type, name, func) and one row for each test
+        self._series = []           # (obj_type, name, func) of each column
+        self._series_index = {}     # (obj_type, name, func) -> column
+        self._mean = zeros((0, 0))
+        self._std = zeros((0, 0))
+        self._valid = zeros((0, 0), dtype=bool)
+
+        # raw data of all (test, column) pairs in one buffer
+        self._raw = zeros(0)
+        self._raw_offset = zeros((0, 0), dtype=int64)
+        self._raw_length = zeros((0, 0), dtype=int64)
+
+        # lookup tables for values_by_type()/values_by_function()
+        self._columns_by_type = {}
+
+        # entries collected during load_data(), see _build_arrays()
+        self._entries = []
+        self._raw_chunks = []
+        self._raw_file = None
 
     def _convert_string_to_array(self, strng):
         """
         Converts a string containing multiple float or int values
         to an array of float values.
+
+        The values are converted in one pass by numpy. Only if the string
+        contains tokens which are no numbers, the string is converted token
+        by token and the invalid tokens are skipped.
         
         Arguments:
             * strng -- string to be converted to an array
         """
+        # numpy reads a string of whitespace only as [-1.]
+        if strng.strip() == "":
+            return zeros(0, dtype=float64)
+
+        try:
+            # numpy < 2.0 only warns if the string could not be read to its end
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", DeprecationWarning)
+                return fromstring(strng, dtype=float64, sep=" ")
+        except (ValueError, DeprecationWarning):
+            pass
+
         values = re.split(r'[\s]+', strng)
         ret = []
         for val in values:
@@ -61,73 +114,266 @@ class DataContainer(object):
             except ValueError:
                 continue
 
-        return ret
+        return array(ret, dtype=float64)
+
+    def _load_config(self, config):
+        """
+        Store the configuration entries of a config node.
+
+        Arguments:
+            * config -- config element of the profiling file
+        """
+        for child in config:
+            if child.tag == "paradigm":
+                self._paradigm = (child.text or '').strip()
+
+            if child.tag == "num_threads":
+                self._num_threads = int(child.text)
+
+            if child.tag == "rank":
+                self._rank = (child.text or '').strip()
+
+            # optional, e.g. <object><obj_type>pop</obj_type><name>pop0</name><size>1000</size></object>
+            if child.tag == "sizes":
+                for obj in child:
+                    # incomplete entries are skipped
+                    obj_type, name, size = obj.findtext("obj_type", ""), obj.findtext("name", ""), obj.findtext("size", "")
+                    if obj_type and name and size.strip():
+                        self._sizes[(obj_type, name)] = int(size)
+
+            if child.tag == "device":
+                self._device = (child.text or '').strip()
+
+            if child.tag == "threads_per_block":
+                self._threads_per_block = int(child.text)
+
+            # optional, e.g. <kernel><obj_type>proj</obj_type><name>proj0</name><func>psp</func>
+            # <blocks>80</blocks><threads_per_block>192</threads_per_block></kernel>
+            if child.tag == "kernels":
+                for kernel in child:
+                    series = (kernel.findtext("obj_type"), kernel.findtext("name"), kernel.findtext("func"))
+                    self._kernels[series] = (int(kernel.findtext("blocks", "0")),
+                                             int(kernel.findtext("threads_per_block", "0")))
+
+    def _load_dataset(self, dataset):
+        """
+        Store the values of a dataset node.
+
+        Arguments:
+            * dataset -- dataset element of the profiling file
+        """
+        obj_type = dataset.findtext("obj_type")
+        name = dataset.findtext("name")
+        func = dataset.findtext("func")
+        mean = float(dataset.findtext("mean"))
+        std = float(dataset.findtext("std"))
+        raw = self._convert_string_to_array(dataset.findtext("raw_data", ""))
+
+        if obj_type == "net" and func == "global_op": # Check for first element of network
+            self._num_tests += 1
+
+        if self._num_tests == 0:
+            # entry before the first network, not assignable to a test
+            return
+
+        key = (obj_type, name, func)
+        if not key in self._series_index:
+            self._series_index[key] = len(self._series)
+            self._series.append(key)
+
+        self._entries.append((self._num_tests - 1, self._series_index[key], mean, std, len(raw)))
+        if self._raw_file is not None:
+            raw.tofile(self._raw_file)
+        else:
+            self._raw_chunks.append(raw)
+
+    def _build_arrays(self):
+        """
+        Convert the entries collected by _load_dataset() into the column-wise storage.
+        """
+        shape = (self._num_tests, len(self._series))
+        self._mean = full(shape, nan)
+        self._std = full(shape, nan)
+        self._valid = zeros(shape, dtype=bool)
+        self._raw_offset = zeros(shape, dtype=int64)
+        self._raw_length = zeros(shape, dtype=int64)
+
+        if len(self._entries) > 0:
+            tests, columns, means, stds, lengths = zip(*self._entries)
+            tests = array(tests, dtype=int64)
+            columns = array(columns, dtype=int64)
+            lengths = array(lengths, dtype=int64)
+
+            self._mean[tests, columns] = means
+            self._std[tests, columns] = stds
+            self._valid[tests, columns] = True
+            self._raw_offset[tests, columns] = cumsum(lengths) - lengths
+            self._raw_length[tests, columns] = lengths
+
+        if self._raw_file is not None:
+            size = self._raw_file.tell()
+            self._raw_file.close()
+            if size > 0:
+                self._raw = memmap(self._raw_file.name, dtype=float64, mode="r")
+            else:
+                self._raw = zeros(0)
+        elif len(self._raw_chunks) > 0:
+            self._raw = concatenate(self._raw_chunks)
+        else:
+            self._raw = zeros(0)
+
+        self._entries = []
+        self._raw_chunks = []
+        self._raw_file = None
+        self._build_lookup()
+
+    def _build_lookup(self):
+        """
+        Create the lookup tables for the column-wise storage.
+        """
+        self._series_index = {}
+        self._columns_by_type = {"net": [], "pop": [], "proj": []}
+        for col, (obj_type, name, func) in enumerate(self._series):
+            self._series_index[(obj_type, name, func)] = col
+            self._columns_by_type.setdefault(obj_type, []).append(col)
+
+        # the values are handed out as views, so protect them
+        for values in (self._mean, self._std, self._raw, self._raw_length):
+            values.flags.writeable = False
+
+    def to_arrays(self):
+        """
+        Return configuration and performance data, except the raw data buffer
+        (see raw_buffer()), as dictionary of arrays. The result can be stored
+        with numpy.savez() and restored with from_arrays().
+        """
+        return {
+            "paradigm": array(self._paradigm),
+            "num_threads": array(self._num_threads),
+            "rank": array(self._rank),
+            "num_tests": array(self._num_tests),
+            "series": array(self._series, dtype=str).reshape((len(self._series), 3)),
+            "mean": self._mean,
+            "std": self._std,
+            "valid": self._valid,
+            "raw_offset": self._raw_offset,
+            "raw_length": self._raw_length,
+            "size_names": array(sorted(self._sizes), dtype=str).reshape((len(self._sizes), 2)),
+            "size_values": array([self._sizes[k] for k in sorted(self._sizes)], dtype=int64),
+            "device": array(self._device),
+            "kernel_series": array(sorted(self._kernels), dtype=str).reshape((len(self._kernels), 3)),
+            "kernel_launch": array([self._kernels[k] for k in sorted(self._kernels)], dtype=int64).reshape((len(self._kernels), 2)),
+        }
 
-    def load_data(self, fname):
+    def raw_buffer(self):
+        """
+        Return the buffer containing the raw data of all measurements.
+        """
+        return self._raw
+
+    def from_arrays(self, arrays, raw):
+        """
+        Restore the container from data created by to_arrays() and raw_buffer().
+
+        Arguments:
+            * arrays -- dictionary like object with the arrays of to_arrays()
+            * raw -- the raw data buffer, e.g. a numpy.memmap
+        """
+        self._paradigm = str(arrays["paradigm"])
+        self._num_threads = int(arrays["num_threads"])
+        self._rank = str(arrays["rank"])
+        self._num_tests = int(arrays["num_tests"])
+        self._series = [tuple(str(v) for v in key) for key in arrays["series"]]
+        self._mean = arrays["mean"]
+        self._std = arrays["std"]
+        self._valid = arrays["valid"]
+        self._raw_offset = arrays["raw_offset"]
+        self._raw_length = arrays["raw_length"]
+        self._sizes = dict((tuple(str(v) for v in key), int(value))
+                           for key, value in zip(arrays["size_names"], arrays["size_values"]))
+        self._device = str(arrays["device"])
+        self._kernels = dict((tuple(str(v) for v in key), tuple(int(v) for v in value))
+                             for key, value in zip(arrays["kernel_series"], arrays["kernel_launch"]))
+        self._raw = raw
+        self._build_lookup()
+
+    def load_data(self, fname, raw_file=None):
         """
         Load performance data from provided file. Returns true if successful else false.
- 
+
+        The file is read incrementally, each config and dataset node is
+        released as soon as it is processed. So the memory consumption
+        does not depend on the size of the XML file.
+
+        If raw_file is given, the raw data is not kept in memory. It is written
+        to this file while parsing and accessed as memory map afterwards, so only
+        the raw data which is actually used will be read from disk.
+
         Arguments:
 
             * fname -- absolute path and name of the file.
+            * raw_file -- file to store the raw data -- default = None
         """
-        doc = etree.parse(str(fname))
- 
-        # save configuration from
-        config_nodes = doc.findall('config')
-        if config_nodes == []:
+        # a failed load may have left entries, so start from scratch
+        self._entries = []
+        self._raw_chunks = []
+        self._raw_file = None
+        if raw_file is not None:
+            self._raw_file = open(str(raw_file), "wb")
+
+        self._paradigm = ''
+        self._num_threads = 0
+        self._rank = ''
+        self._series = []
+        self._series_index = {}
+        self._num_tests = 0
+        self._sizes = {}
+        self._device = ''
+        self._threads_per_block = 0
+        self._kernels = {}
+        has_config = False
+
+        # huge_tree: raw_data of long runs exceeds the default text node limit of libxml2
+        context = etree.iterparse(str(fname), events=("end",), tag=("config", "dataset"), huge_tree=True)
+        try:
+            for _, elem in context:
+                if elem.tag == "config":
+                    has_config = True
+                    self._load_config(elem)
+                else:
+                    self._load_dataset(elem)
+
+                # free the processed node and the already handled siblings
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        except:
+            if self._raw_file is not None:
+                self._raw_file.close()
+                self._raw_file = None
+            self._entries = []
+            self._raw_chunks = []
+            raise
+        del context
+
+        self._build_arrays()
+
+        if not has_config:
             print("No configuration entries in XML ...")
 
-        for config in config_nodes:
-            children = config.getchildren()
- 
-            for child in children:
-                if child.tag == "paradigm":
-                    self._paradigm = child.text
- 
-                if child.tag == "num_threads":
-                    self._num_threads = int(child.text)
-                    
-                if child.tag == "rank":
-                    self._rank = child.text
-        
         # Configuration validation
         if self._paradigm == '':
             return False
         if self._paradigm == "openmp" and self._num_threads == 0:
             return False
-        if self._paradigm == "cuda":
-            self._num_threads = 32
-
-        # Scan performance data
-        matches = doc.findall('dataset')
-        
-        self._data = {}
-        num_tests = -1
- 
-        for dataset in matches:
-            obj_type = dataset.find("obj_type").text
-            name = dataset.find("name").text
-            func = dataset.find("func").text
-            mean = float(dataset.find("mean").text)
-            std = float(dataset.find("std").text)
-            raw = self._convert_string_to_array(dataset.find("raw_data").text)
-            
-            if obj_type == "net" and func == "global_op": # Check for first element of network
-                num_tests += 1
-                self._data[num_tests] = {"net" : {}, "pop" : {}, "proj" : {}}
-            
-            if not name in self._data[num_tests][obj_type]:
-                self._data[num_tests][obj_type][name] = {}
-            self._data[num_tests][obj_type][name][func] = {"mean" : mean, "std" : std, "raw" :  raw}
-                
-        self._num_tests = num_tests + 1
+        if self.is_gpu():
+            self._num_threads = self._threads_per_block or DEFAULT_THREADS_PER_BLOCK
 
         return True
     
     def num_threads(self):
         """
-        Return Number of threads
+        Return Number of threads, for GPU paradigms the default number of threads per block
         """
         return self._num_threads
     
@@ -137,11 +383,106 @@ class DataContainer(object):
         """
         return self._paradigm
     
+    def rank(self):
+        """
+        Return rank
+        """
+        return self._rank
+    
+    def sizes(self):
+        """
+        Return the number of neurons of the populations and synapses of the projections
+        by (obj_type, name), as far as they are known.
+        """
+        return dict(self._sizes)
+
+    def set_sizes(self, sizes):
+        """
+        Add or replace sizes of populations and projections.
+
+        Arguments:
+            * sizes -- dictionary of the numbers of neurons or synapses by (obj_type, name)
+        """
+        self._sizes.update(sizes)
+
+    def load_sizes(self, fname):
+        """
+        Read the sizes of populations and projections from a side file, e.g. if they
+        are not part of the profiling file, see read_sizes().
+
+        Arguments:
+            * fname -- path and name of the file
+        """
+        self.set_sizes(read_sizes(fname))
+
+    def is_gpu(self):
+        """
+        Return true if the measurement ran on a GPU, see GPU_PARADIGMS.
+        """
+        return self._paradigm in GPU_PARADIGMS
+
+    def device(self):
+        """
+        Return the name of the GPU, empty if unknown or not a GPU measurement.
+        """
+        return self._device
+
+    def kernels(self):
+        """
+        Return the launch configuration (blocks, threads per block) of the kernels by
+        (obj_type, name, func) as given in the profiling file, 0 if unknown.
+        """
+        return dict(self._kernels)
+
+    def launch_configuration(self, obj_type, name, func):
+        """
+        Return the (blocks, threads per block) of the kernel of a function, the threads
+        per block default to num_threads() and the blocks to 0 (unknown).
+        """
+        blocks, threads = self._kernels.get((obj_type, name, func), (0, 0))
+        return blocks, threads or self._num_threads
+
+    def configuration(self):
+        """
+        Return the configuration of the measurement: the number of threads, for GPU
+        paradigms the device, the threads per block and a checksum of the kernel
+        launch configurations if they are given.
+        """
+        if not self.is_gpu():
+            return str(self._num_threads)
+
+        config = (self._device or "GPU") + "/" + str(self._num_threads)
+        if len(self._kernels) != 0:
+            config += "/" + self._kernels_checksum()
+        return config
+
+    def _kernels_checksum(self):
+        """
+        Return a short checksum of the kernel launch configurations.
+        """
+        return "%08x" % (crc32(repr(sorted(self._kernels.items())).encode("utf-8")) & 0xffffffff)
+
+    def label(self, rank=True):
+        """
+        Return a readable name of the measurement, e.g. "openmp0 - 4 Threads".
+
+        Arguments:
+            * rank -- show the rank after the paradigm -- default = True
+        """
+        text = self._paradigm + (self._rank if rank else '') + " - "
+        if not self.is_gpu():
+            return text + str(self._num_threads) + " Threads"
+
+        text += (self._device or "GPU") + " - " + str(self._num_threads) + " threads per block"
+        if len(self._kernels) != 0:
+            text += " - kernels " + self._kernels_checksum()
+        return text
+
     def key(self):
         """
-        Return unique key for this container consists of paradigm, rank and number of threads
+        Return unique key for this container consists of paradigm, rank and configuration
         """
-        return self._paradigm + self._rank + "-" + str(self._num_threads)
+        return self._paradigm + self._rank + "-" + self.configuration()
     
     def num_tests(self):
         """
@@ -149,6 +490,67 @@ class DataContainer(object):
         """
         return self._num_tests
 
+    def series(self):
+        """
+        Return the (obj_type, name, func) of each column in mean_values() and std_values().
+        """
+        return list(self._series)
+
+    def column(self, obj_type, name, func):
+        """
+        Return the column of a function in mean_values() and std_values().
+        Raises a KeyError if the function was not measured.
+        """
+        return self._series_index[(obj_type, name, func)]
+
+    def columns(self, series):
+        """
+        Return the columns of several functions as array, -1 for not measured functions.
+
+        Arguments:
+            * series -- list of (obj_type, name, func)
+        """
+        return array([self._series_index.get(tuple(s), -1) for s in series], dtype=int64)
+
+    def mean_values(self):
+        """
+        Return the mean values of all functions as read-only array
+        with one row for each test. Not measured values are NaN.
+        """
+        return self._mean
+
+    def std_values(self):
+        """
+        Return the std values of all functions as read-only array
+        with one row for each test. Not measured values are NaN.
+        """
+        return self._std
+
+    def sample_counts(self):
+        """
+        Return the number of raw values of all functions as read-only array
+        with one row for each test.
+        """
+        return self._raw_length
+
+    def raw_values(self, index, col):
+        """
+        Return the raw data of one function in one test as read-only array.
+
+        Arguments:
+            * index -- number of the measurement
+            * col -- column of the function, see column()
+        """
+        start = self._raw_offset[index, col]
+        return self._raw[start:start + self._raw_length[index, col]]
+
+    def _entry(self, index, col):
+        """
+        Return the values of one function in one test as dictionary.
+        """
+        return {"mean" : float(self._mean[index, col]), "std" : float(self._std[index, col]),
+                "raw" : self.raw_values(index, col)}
+
     def values_by_function(self, index, obj_type, func):
         """
         Returns the values of a network filtered by function and object type
@@ -159,9 +561,9 @@ class DataContainer(object):
             * func - name of the function to filter
         """
         values = {}
-        for key, value in self._data[index][obj_type].items():
-            if func in value:
-                values[key] = value[func]
+        for col in self._columns_by_type[obj_type]:
+            if self._series[col][2] == func and self._valid[index, col]:
+                values[self._series[col][1]] = self._entry(index, col)
         return values
     
     def values_by_type(self, index, obj_type):
@@ -172,28 +574,35 @@ class DataContainer(object):
             * index -- number of the measurement
             * obj_type -- name of the object to filter
         """
-        return self._data[index][obj_type]
+        values = {}
+        for col in self._columns_by_type[obj_type]:
+            if self._valid[index, col]:
+                _, name, func = self._series[col]
+                values.setdefault(name, {})[func] = self._entry(index, col)
+        return values
     
     def unique_function_names(self, obj_type):
         """
         Return the names of all defined functions for a object type
         """
         names = []
-        if len(self._data.keys()) == 0:
+        if self._num_tests == 0:
             # HD: 13th Oct 2019:
             #   An unitialized DataContainer was called, this could be a
             #   result of: ProfilerWindow.current_data()
             return names
 
-        for name, name_val in self._data[0][obj_type].items():
-            for func_name in name_val:
-                names.append(name + " - " + func_name)
+        for col in self._columns_by_type[obj_type]:
+            if self._valid[0, col]:
+                names.append(self._series[col][1] + " - " + self._series[col][2])
             
         return names
     
     def values_each_test(self, obj_type, name, func, val_type):
         """
-        Filter values by object type, function and values type
+        Filter values by object type, function and values type.
+        Mean and std values are returned as read-only array, raw data
+        as list of read-only arrays.
         
         Arguments:
             * obj_type -- Network(net), Projection(proj) or Population(pop)
@@ -201,50 +610,88 @@ class DataContainer(object):
             * func -- name of function to filter
             * val_type -- mean, std or raw data
         """
-        values = []
-        
-        #if obj_type == "net":
-        for _, value in self._data.items():
-            values.append(value[obj_type][name][func][val_type])
-        #else:
-            #match = re.match(r"([a-z]+)([0-9]+)", obj_type, re.I).groups()
-            #for _, value in self._data.items():
-                #values.append(value[match[0]][int(match[1])][func][val_type])
-            
-        return values
+        col = self.column(obj_type, name, func)
+
+        if val_type == "mean":
+            return self._mean[:, col]
+        if val_type == "std":
+            return self._std[:, col]
+
+        return [self.raw_values(i, col) for i in range(self._num_tests)]
     
-    def recalc_mean_values(self, obj_type, name, func, factor):
+    def recalc_mean_values(self, obj_type, name, func, factor, method="std"):
         """
         Filter values by object type, function and recalculate the mean values.
+        All tests are processed at once, see Statistics.remove_outliers().
         
         Arguments:
             * obj_type -- Network(net), Projection(proj) or Population(pop)
             * func -- name of function to filter
-            * factor -- 
+            * factor -- width of the accepted range in units of the filter's scale
+            * method -- outlier filter, one of Statistics.OUTLIER_FILTERS -- default = "std"
         """
         
         mean_values = self.values_each_test(obj_type, name, func, "mean")
         std_values = self.values_each_test(obj_type, name, func, "std")
         raw_data = self.values_each_test(obj_type, name, func, "raw")
 
-        # result container
-        new_mean = zeros(len(mean_values))
-        new_std = zeros(len(std_values))
+        without_outlier = remove_outliers(raw_data, factor, method, mean_values, std_values)
+
+        return masked_mean_std(without_outlier)
+
+    def phases(self, penalty=WARMUP_PENALTY, max_fraction=WARMUP_MAX_FRACTION):
+        """
+        Split the raw data of all functions and tests into warm-up and steady state
+        in one pass, see Statistics.split_phases(). Returns its dictionary of
+        (tests x series) arrays.
+
+        Arguments:
+            * penalty -- threshold of a change point -- default = Statistics.WARMUP_PENALTY
+            * max_fraction -- maximal length of the warm-up relative to the test -- default = Statistics.WARMUP_MAX_FRACTION
+        """
+        return split_phases(self._raw, self._raw_offset, self._raw_length, penalty, max_fraction)
+
+    def steady_state(self, penalty=WARMUP_PENALTY, max_fraction=WARMUP_MAX_FRACTION):
+        """
+        Return a new DataContainer without the warm-up of each function and test
+        (see phases()): mean and std are computed over the steady state and the raw
+        data starts after the warm-up. The raw data buffer is shared.
+
+        Arguments:
+            * penalty -- threshold of a change point -- default = Statistics.WARMUP_PENALTY
+            * max_fraction -- maximal length of the warm-up relative to the test -- default = Statistics.WARMUP_MAX_FRACTION
+        """
+        phases = self.phases(penalty, max_fraction)
+
+        # functions without raw data keep the values of the file
+        arrays = self.to_arrays()
+        arrays["mean"] = where(isnan(phases["steady_mean"]), self._mean, phases["steady_mean"])
+        arrays["std"] = where(isnan(phases["steady_std"]), self._std, phases["steady_std"])
+        arrays["raw_offset"] = self._raw_offset + phases["warmup"]
+        arrays["raw_length"] = self._raw_length - phases["warmup"]
+
+        data = DataContainer()
+        data.from_arrays(arrays, self._raw)
+        return data
 
-        # for each trial
-        for i in range(len(mean_values)):
-            without_outlier = []
 
-            # remove outlier iteratively
-            for n in range(len(raw_data[i])):
-                if raw_data[i][n] <= (mean_values[i] + factor * std_values[i]) and raw_data[i][n] >= (mean_values[i] - factor * std_values[i]):
-                    without_outlier.append(raw_data[i][n])
+def read_sizes(fname):
+    """
+    Return the sizes of populations and projections by (obj_type, name) from a
+    JSON file:
 
-            # store result
-            new_mean[i] = mean(without_outlier)
-            new_std[i] = std(without_outlier)
+        {"pop": {"pop0": 1000}, "proj": {"proj0": 250000}}
 
-            # debug
-            #print(mean(without_outlier), std(without_outlier), mean(raw_data[i]), std(raw_data[i]))
+    Raises an OSError if the file can not be read and a ValueError if its content is invalid.
+
+    Arguments:
+        * fname -- path and name of the file
+    """
+    with open(str(fname)) as f:
+        content = json.load(f)
 
-        return new_mean, new_std
+    try:
+        return dict(((obj_type, name), int(size)) for obj_type, objects in content.items()
+                    for name, size in objects.items())
+    except (AttributeError, TypeError):
+        raise ValueError("Invalid sizes file: " + str(fname))
@@ -0,0 +1,325 @@
+# ==============================================================================
+#
+#     History.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+"""
+Append-only database (SQLite) of the mean times of many profiling runs, to
+follow the performance of a model over months.
+
+Each run is stored once with its tags (commit, date, host), identified by
+path, size and modification time of its profiling file, so ingesting a
+directory again only adds the new files. For each function the mean and std
+over the tests are stored, indexed by (function, paradigm, rank, device,
+threads, date), so the ranks of an MPI run and the GPUs are separate series.
+
+A connection must only be used in the thread which opened it, so open a
+History in each background task.
+"""
+import os
+import sqlite3
+import time
+import warnings
+
+import numpy as np
+
+from ParallelLoader import ParallelLoader
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    paradigm TEXT,
+    rank TEXT,
+    device TEXT,
+    num_threads INTEGER,
+    num_tests INTEGER,
+    commit_id TEXT,
+    host TEXT,
+    date REAL NOT NULL,
+    UNIQUE (source, size, mtime_ns)
+);
+CREATE TABLE IF NOT EXISTS functions (
+    id INTEGER PRIMARY KEY,
+    obj_type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    func TEXT NOT NULL,
+    UNIQUE (obj_type, name, func)
+);
+CREATE TABLE IF NOT EXISTS measurements (
+    function_id INTEGER NOT NULL REFERENCES functions (id),
+    paradigm TEXT,
+    rank TEXT,
+    device TEXT,
+    num_threads INTEGER,
+    date REAL NOT NULL,
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    mean REAL,
+    std REAL,
+    samples INTEGER
+);
+CREATE INDEX IF NOT EXISTS measurements_config ON measurements (function_id, paradigm, rank, device, num_threads, date);
+"""
+
+# databases written before rank and device were stored, the rank is known from the run
+MIGRATION = """
+ALTER TABLE runs ADD COLUMN device TEXT DEFAULT '';
+ALTER TABLE measurements ADD COLUMN rank TEXT DEFAULT '';
+ALTER TABLE measurements ADD COLUMN device TEXT DEFAULT '';
+UPDATE measurements SET rank = (SELECT IFNULL(rank, '') FROM runs WHERE runs.id = measurements.run_id);
+DROP INDEX IF EXISTS measurements_series;
+"""
+
+
+def default_path():
+    """
+    Return the path of the database: $ANNARCHY_PROFILER_HISTORY or
+    ~/.local/share/ANNarchyProfiler/history.sqlite
+    """
+    return os.environ.get("ANNARCHY_PROFILER_HISTORY",
+                          os.path.join(os.path.expanduser("~"), ".local", "share", "ANNarchyProfiler", "history.sqlite"))
+
+
+class History(object):
+    """
+    Database of the mean times of many profiling runs.
+    """
+    def __init__(self, fname=None):
+        """
+        Open or create the database.
+
+        Arguments:
+            * fname -- path of the database file -- default = see default_path()
+        """
+        if fname is None:
+            fname = default_path()
+        if fname != ":memory:" and not os.path.isdir(os.path.dirname(os.path.abspath(fname))):
+            os.makedirs(os.path.dirname(os.path.abspath(fname)))
+
+        self._db = sqlite3.connect(fname)
+        columns = [row[1] for row in self._db.execute("PRAGMA table_info(measurements)")]
+        if len(columns) != 0 and not "rank" in columns:
+            self._db.executescript(MIGRATION)
+        self._db.executescript(SCHEMA)
+        self._read_functions()
+
+    def _read_functions(self):
+        """
+        Read the ids of the stored functions.
+        """
+        self._functions = dict(((o, n, f), i) for i, o, n, f in
+                               self._db.execute("SELECT id, obj_type, name, func FROM functions"))
+
+    def close(self):
+        """
+        Close the database.
+        """
+        self._db.close()
+
+    def known(self, fname):
+        """
+        Return true if the current version of a profiling file was ingested already.
+        """
+        stat = os.stat(fname)
+        row = self._db.execute("SELECT 1 FROM runs WHERE source = ? AND size = ? AND mtime_ns = ?",
+                               (os.path.abspath(fname), stat.st_size, stat.st_mtime_ns)).fetchone()
+        return row is not None
+
+    def _function_ids(self, series):
+        """
+        Return the ids of (obj_type, name, func) tuples, new functions are inserted.
+        """
+        for s in series:
+            if not s in self._functions:
+                cursor = self._db.execute("INSERT INTO functions (obj_type, name, func) VALUES (?, ?, ?)", s)
+                self._functions[s] = cursor.lastrowid
+        return [self._functions[s] for s in series]
+
+    def add(self, data, fname, commit=None, host=None, date=None):
+        """
+        Store a DataContainer, returns the id of the run. The caller commits the transaction.
+
+        Arguments:
+            * data (DataContainer) -- the measurement
+            * fname -- its profiling file
+            * commit -- version of the model or simulator, e.g. git commit -- default = None
+            * host -- machine of the run -- default = None
+            * date -- time of the run in seconds since the epoch -- default = modification time of fname
+        """
+        stat = os.stat(fname)
+        if date is None:
+            date = stat.st_mtime
+
+        cursor = self._db.execute(
+            "INSERT INTO runs (source, size, mtime_ns, paradigm, rank, device, num_threads, num_tests, commit_id, host, date)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (os.path.abspath(fname), stat.st_size, stat.st_mtime_ns, data.paradigm(), data.rank(), data.device(),
+             data.num_threads(), data.num_tests(), commit, host, date))
+        run_id = cursor.lastrowid
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            mean = np.nanmean(data.mean_values(), axis=0)
+            std = np.nanmean(data.std_values(), axis=0)
+        samples = data.sample_counts().sum(axis=0)
+
+        ids = self._function_ids(data.series())
+        rows = [(ids[col], data.paradigm(), data.rank(), data.device(), data.num_threads(), date, run_id,
+                 None if np.isnan(mean[col]) else float(mean[col]),
+                 None if np.isnan(std[col]) else float(std[col]), int(samples[col]))
+                for col in range(len(ids))]
+        self._db.executemany(
+            "INSERT INTO measurements (function_id, paradigm, rank, device, num_threads, date, run_id, mean, std, samples)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+        return run_id
+
+    def ingest(self, fnames, commit=None, host=None, date=None, cache=None, progress=None, cancelled=None):
+        """
+        Load the profiling files which are not yet in the database and store them.
+        Returns the number of new runs; missing and broken files are skipped and
+        reported, a file given twice is stored once. If cancelled, nothing is stored.
+
+        Arguments:
+            * fnames -- list of profiling files
+            * commit, host, date -- tags of the runs, see add() -- default = None
+            * cache (ProfileCache) -- cache of the loader -- default = None
+            * progress -- function called with (done, total) -- default = None
+            * cancelled -- function returning true if the ingest should stop -- default = None
+        """
+        pending = []
+        seen = set()
+        for fname in fnames:
+            if os.path.abspath(fname) in seen:
+                continue
+            seen.add(os.path.abspath(fname))
+
+            try:
+                if not self.known(fname):
+                    pending.append(fname)
+            except OSError as e:
+                print("Could not load", fname, "-", e)
+        if len(pending) == 0:
+            return 0
+
+        loader = ParallelLoader(cache)
+
+        def loaded(done, total):
+            if cancelled is not None and cancelled():
+                loader.cancel()
+            if progress is not None:
+                progress(done, total)
+
+        added = 0
+        for fname, data in loader.load(pending, loaded):
+            if cancelled is not None and cancelled():
+                break
+            if data is None:
+                print("Skipped", fname, "- not a valid profiling file")
+                continue
+
+            try:
+                self.add(data, fname, commit, host, date)
+                added += 1
+            except OSError as e:
+                # removed after loading
+                print("Could not load", fname, "-", e)
+
+        if cancelled is not None and cancelled():
+            self._db.rollback()
+            self._read_functions()
+            return 0
+
+        self._db.commit()
+        return added
+
+    def functions(self):
+        """
+        Return the sorted (obj_type, name, func) of all stored functions.
+        """
+        return sorted(self._functions)
+
+    def configurations(self, obj_type, name, func):
+        """
+        Return the sorted (paradigm, num_threads, rank, device) tuples with measurements
+        of a function, the device is empty for CPU runs.
+        """
+        function_id = self._functions.get((obj_type, name, func))
+        return [tuple(row) for row in self._db.execute(
+            "SELECT DISTINCT paradigm, num_threads, rank, device FROM measurements WHERE function_id = ?"
+            " ORDER BY paradigm, num_threads, rank, device", (function_id,))]
+
+    def series(self, obj_type, name, func, paradigm, num_threads, rank=None, device=None, since=None, until=None):
+        """
+        Return the measurements of a function in one configuration ordered by date
+        as dictionary of arrays: "date", "mean", "std", "samples" and lists "commit",
+        "host", "source", "rank", "device". Without rank or device the measurements
+        of all ranks or devices are returned, see the lists to tell them apart.
+
+        Arguments:
+            * obj_type, name, func -- the function
+            * paradigm, num_threads -- the configuration
+            * rank, device -- the MPI rank and the GPU, see configurations() -- default = all
+            * since, until -- time range in seconds since the epoch -- default = all
+        """
+        function_id = self._functions.get((obj_type, name, func))
+        rows = self._db.execute(
+            "SELECT m.date, m.mean, m.std, m.samples, r.commit_id, r.host, r.source, m.rank, m.device"
+            " FROM measurements m JOIN runs r ON r.id = m.run_id"
+            " WHERE m.function_id = ? AND m.paradigm = ? AND m.num_threads = ? AND m.date >= ? AND m.date <= ?"
+            " AND (? IS NULL OR m.rank = ?) AND (? IS NULL OR m.device = ?)"
+            " ORDER BY m.date",
+            (function_id, paradigm, num_threads, since if since is not None else -np.inf,
+             until if until is not None else np.inf, rank, rank, device, device)).fetchall()
+
+        columns = list(zip(*rows)) if len(rows) != 0 else [()] * 9
+        return {
+            "date": np.array(columns[0], dtype=np.float64),
+            "mean": np.array([np.nan if v is None else v for v in columns[1]], dtype=np.float64),
+            "std": np.array([np.nan if v is None else v for v in columns[2]], dtype=np.float64),
+            "samples": np.array(columns[3], dtype=np.int64),
+            "commit": list(columns[4]),
+            "host": list(columns[5]),
+            "source": list(columns[6]),
+            "rank": list(columns[7]),
+            "device": list(columns[8]),
+        }
+
+    def num_runs(self):
+        """
+        Return the number of stored runs.
+        """
+        return self._db.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+
+def parse_date(text):
+    """
+    Return the seconds since the epoch of a date "YYYY-MM-DD" or "YYYY-MM-DD HH:MM".
+    Raises ValueError for other formats.
+    """
+    for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            return time.mktime(time.strptime(text, fmt))
+        except ValueError:
+            continue
+    raise ValueError("Invalid date: " + text)
@@ -0,0 +1,160 @@
+# ==============================================================================
+#
+#     ParallelLoader.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
+import os
+
+from numpy import float64, memmap
+
+from DataContainer import DataContainer
+
+
+def _load_file(fname, cache):
+    """
+    Parse one profiling file, executed in the worker processes.
+
+    Returns the arrays of the container (see DataContainer.to_arrays()) and
+    the raw data. If the raw data is stored in the cache, only the name of the
+    cache file is returned, so the raw data is not transferred between the
+    processes. Returns None if the file could not be loaded, any error while
+    reading a single file is reported and counts as a broken file.
+
+    Arguments:
+        * fname -- path and name of the profiling file
+        * cache (ProfileCache) -- cache for the parsed file or None
+    """
+    try:
+        if cache is not None:
+            data = cache.load(fname, evict=False)
+            if data is None:
+                return None
+        else:
+            data = DataContainer()
+            if not data.load_data(fname):
+                return None
+    except Exception as e:
+        # one broken file should not stop loading the others, whatever is wrong with it
+        print("Could not load", fname, "-", e)
+        return None
+
+    raw = data.raw_buffer()
+    if isinstance(raw, memmap):
+        raw = raw.filename
+
+    return data.to_arrays(), raw
+
+
+class ParallelLoader(object):
+    """
+    Loads multiple profiling files in parallel by a pool of processes.
+    """
+    def __init__(self, cache=None, max_workers=None):
+        """
+        Initialization.
+
+        Arguments:
+            * cache (ProfileCache) -- cache used by the workers -- default = None
+            * max_workers -- number of worker processes -- default = number of cores
+        """
+        self._cache = cache
+        self._max_workers = max_workers if max_workers is not None else os.cpu_count()
+        self._cancelled = False
+
+    def cancel(self):
+        """
+        Stop loading, files which are not yet started will be skipped.
+        """
+        self._cancelled = True
+
+    def cancelled(self):
+        """
+        Return true if loading was cancelled.
+        """
+        return self._cancelled
+
+    def _container(self, result):
+        """
+        Create a DataContainer from the result of _load_file().
+        """
+        if result is None:
+            return None
+
+        arrays, raw = result
+        if isinstance(raw, str):
+            raw = memmap(raw, dtype=float64, mode="r")
+
+        data = DataContainer()
+        data.from_arrays(arrays, raw)
+        return data
+
+    def load(self, fnames, progress=None):
+        """
+        Load the given files and return a list of (fname, DataContainer) pairs in the
+        order of fnames. The container is None if the file could not be loaded.
+        Files skipped by cancel() are not part of the result.
+
+        Arguments:
+            * fnames -- list of paths of the profiling files
+            * progress -- function called with (number of loaded files, number of files) after each file -- default = None
+        """
+        self._cancelled = False
+        results = {}
+
+        # cached files are read directly, starting the workers would take longer
+        if self._cache is not None:
+            for fname in fnames:
+                data = self._cache.get(fname)
+                if data is not None:
+                    results[fname] = data
+                    if progress is not None:
+                        progress(len(results), len(fnames))
+        pending = [fname for fname in fnames if not fname in results]
+
+        if len(pending) <= 1 or self._max_workers <= 1:
+            for fname in pending:
+                if self._cancelled:
+                    break
+                results[fname] = self._container(_load_file(fname, self._cache))
+                if progress is not None:
+                    progress(len(results), len(fnames))
+        else:
+            # spawn the workers, forking a process with a running Qt application is not safe
+            executor = ProcessPoolExecutor(max_workers=min(self._max_workers, len(pending)),
+                                           mp_context=multiprocessing.get_context("spawn"))
+            try:
+                futures = {executor.submit(_load_file, fname, self._cache): fname for fname in pending}
+                for future in as_completed(futures):
+                    results[futures[future]] = self._container(future.result())
+                    if progress is not None:
+                        progress(len(results), len(fnames))
+
+                    if self._cancelled:
+                        break
+            finally:
+                executor.shutdown(wait=not self._cancelled, cancel_futures=True)
+
+        if self._cache is not None:
+            self._cache.evict()
+
+        return [(fname, results[fname]) for fname in fnames if fname in results]
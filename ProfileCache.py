@@ -0,0 +1,279 @@
+# ==============================================================================
+#
+#     ProfileCache.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+import hashlib
+import os
+import time
+
+from numpy import array, float64, load, memmap, savez, zeros
+
+from DataContainer import DataContainer
+
+# Increase if the stored arrays change, old entries are invalidated then.
+CACHE_VERSION = 4
+
+# seconds since the last write after which a .raw file without .npz file is
+# considered left over, a parse of another process appends to it until then
+ORPHAN_AGE = 3600
+
+
+class ProfileCache(object):
+    """
+    Stores the parsed content of profiling files in a cache directory, so
+    reopening a file does not require to parse the XML again.
+
+    Each entry consists of two files named by the hash of the source path:
+
+        * <hash>.npz -- configuration, mean and std values (see DataContainer.to_arrays())
+        * <hash>.raw -- raw data buffer, read as memory map
+
+    An entry is only used if path, size and modification time of the source
+    file are unchanged. If the cache exceeds its size limit, the least recently
+    used entries are removed.
+    """
+    def __init__(self, cache_dir=None, max_size=1024**3):
+        """
+        Initialization.
+
+        Arguments:
+            * cache_dir -- directory of the cache files -- default = $ANNARCHY_PROFILER_CACHE or ~/.cache/ANNarchyProfiler
+            * max_size -- maximum size of all cache files in bytes -- default = 1 GiB
+        """
+        if cache_dir is None:
+            cache_dir = os.environ.get("ANNARCHY_PROFILER_CACHE",
+                                       os.path.join(os.path.expanduser("~"), ".cache", "ANNarchyProfiler"))
+
+        self._cache_dir = cache_dir
+        self._max_size = max_size
+
+    def _entry(self, fname):
+        """
+        Return the path of the cache entry, without extension, for a profiling file.
+        """
+        path = os.path.abspath(str(fname))
+        return os.path.join(self._cache_dir, hashlib.sha1(path.encode("utf-8")).hexdigest())
+
+    def _remove(self, entry):
+        """
+        Remove the files of a cache entry.
+        """
+        for ext in (".npz", ".raw"):
+            try:
+                os.remove(entry + ext)
+            except OSError:
+                pass
+
+    def get(self, fname):
+        """
+        Return the cached DataContainer of a profiling file or None if no valid entry exists.
+
+        Arguments:
+            * fname -- path and name of the profiling file
+        """
+        entry = self._entry(fname)
+        if not os.path.exists(entry + ".npz"):
+            return None
+
+        try:
+            stat = os.stat(str(fname))
+            with load(entry + ".npz") as arrays:
+                arrays = dict(arrays)
+
+            if (int(arrays["cache_version"]) != CACHE_VERSION or
+                    str(arrays["source"]) != os.path.abspath(str(fname)) or
+                    int(arrays["source_size"]) != stat.st_size or
+                    int(arrays["source_mtime"]) != stat.st_mtime_ns):
+                # stale entry
+                self._remove(entry)
+                return None
+
+            if os.path.getsize(entry + ".raw") > 0:
+                raw = memmap(entry + ".raw", dtype=float64, mode="r")
+            else:
+                raw = zeros(0)
+        except (OSError, KeyError, ValueError):
+            self._remove(entry)
+            return None
+
+        # mark as recently used
+        os.utime(entry + ".npz")
+
+        data = DataContainer()
+        data.from_arrays(arrays, raw)
+        return data
+
+    def put(self, fname, data):
+        """
+        Store the DataContainer of a profiling file in the cache.
+
+        Arguments:
+            * fname -- path and name of the profiling file
+            * data (DataContainer) -- parsed content of the file
+        """
+        entry = self._entry(fname)
+
+        try:
+            if not os.path.isdir(self._cache_dir):
+                os.makedirs(self._cache_dir)
+
+            # write to a temporary file first, so an interrupted write leaves no broken entry
+            data.raw_buffer().astype(float64, copy=False).tofile(entry + ".raw.tmp")
+            os.replace(entry + ".raw.tmp", entry + ".raw")
+            self._write_arrays(fname, data)
+        except OSError as e:
+            print("Could not write cache entry for", fname, "-", e)
+            return
+
+        self.evict()
+
+    def _write_arrays(self, fname, data):
+        """
+        Write the .npz file of an entry. The entry is valid afterwards,
+        so the .raw file must be written before.
+        """
+        entry = self._entry(fname)
+        stat = os.stat(str(fname))
+
+        arrays = data.to_arrays()
+        arrays["cache_version"] = array(CACHE_VERSION)
+        arrays["source"] = array(os.path.abspath(str(fname)))
+        arrays["source_size"] = array(stat.st_size)
+        arrays["source_mtime"] = array(stat.st_mtime_ns)
+
+        with open(entry + ".npz.tmp", "wb") as f:
+            savez(f, **arrays)
+        os.replace(entry + ".npz.tmp", entry + ".npz")
+
+    def load(self, fname, evict=True):
+        """
+        Return the DataContainer of a profiling file. The file is only parsed if
+        there is no valid cache entry. Returns None if the file could not be loaded.
+
+        While parsing, the raw data is written directly into the cache entry, so
+        also a newly parsed file keeps its raw data as memory map.
+
+        Arguments:
+            * fname -- path and name of the profiling file
+            * evict -- remove old entries if the cache is full, disable it while several processes fill the cache -- default = True
+        """
+        data = self.get(fname)
+        if data is not None:
+            return data
+
+        entry = self._entry(fname)
+
+        # a missing or unreadable profiling file is not a problem of the cache
+        with open(str(fname), "rb"):
+            pass
+
+        data = DataContainer()
+        try:
+            if not os.path.isdir(self._cache_dir):
+                os.makedirs(self._cache_dir)
+
+            # containers of an older entry may still map the raw file, so
+            # it is removed instead of overwritten
+            self._remove(entry)
+            success = data.load_data(fname, raw_file=entry + ".raw")
+        except OSError as e:
+            self._remove(entry)
+            print("Could not write cache entry for", fname, "-", e)
+            data = DataContainer()
+            return data if data.load_data(fname) else None
+        except:
+            # e.g. a syntax error, the partial raw file is of no use
+            self._remove(entry)
+            raise
+
+        if not success:
+            self._remove(entry)
+            return None
+
+        try:
+            self._write_arrays(fname, data)
+        except OSError as e:
+            print("Could not write cache entry for", fname, "-", e)
+            return data
+
+        if evict:
+            self.evict()
+        return data
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache fits into its size limit.
+        """
+        if not os.path.isdir(self._cache_dir):
+            return
+
+        self._remove_orphans()
+
+        entries = []
+        total = 0
+        for fname in os.listdir(self._cache_dir):
+            if not fname.endswith(".npz"):
+                continue
+
+            entry = os.path.join(self._cache_dir, fname[:-4])
+            try:
+                size = os.path.getsize(entry + ".npz") + os.path.getsize(entry + ".raw")
+                entries.append((os.path.getmtime(entry + ".npz"), size, entry))
+            except OSError:
+                continue
+            total += size
+
+        for _, size, entry in sorted(entries):
+            if total <= self._max_size:
+                break
+            self._remove(entry)
+            total -= size
+
+    def clear(self):
+        """
+        Remove all entries of the cache.
+        """
+        if not os.path.isdir(self._cache_dir):
+            return
+
+        for fname in os.listdir(self._cache_dir):
+            if fname.endswith(".npz"):
+                self._remove(os.path.join(self._cache_dir, fname[:-4]))
+        self._remove_orphans()
+
+    def _remove_orphans(self):
+        """
+        Remove the .raw files without .npz file, e.g. left by an interrupted parse.
+        Only files not written for ORPHAN_AGE seconds are removed, a younger one
+        may belong to an entry which another process is just writing.
+        """
+        now = time.time()
+        for fname in os.listdir(self._cache_dir):
+            entry = os.path.join(self._cache_dir, fname[:-4])
+            if not fname.endswith(".raw") or os.path.exists(entry + ".npz"):
+                continue
+            try:
+                if now - os.path.getmtime(entry + ".raw") < ORPHAN_AGE:
+                    continue
+            except OSError:
+                continue
+            self._remove(entry)
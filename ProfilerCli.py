@@ -0,0 +1,636 @@
+# ==============================================================================
+#
+#     ProfilerCli.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+"""
+Headless analysis of profiling files, e.g. on compute nodes without display.
+Neither PyQt5 nor matplotlib is imported, unless charts are requested.
+
+    $ python ProfilerCli.py report measurement.xml [more files ...]
+    $ python ProfilerCli.py report --charts ./charts *.xml
+    $ python ProfilerCli.py scaling --max-threads 64 *.xml
+    $ python ProfilerCli.py ranking --top 20 *.xml
+    $ python ProfilerCli.py compare --threshold 5 baseline.xml candidate.xml
+    $ python ProfilerCli.py history ingest --commit 1a2b3c nightly/*.xml
+    $ python ProfilerCli.py history show --paradigm openmp --threads 4 proj proj0 psp
+    $ python ProfilerCli.py ranks --top 10 rank_*.xml
+    $ python ProfilerCli.py phases measurement.xml
+    $ python ProfilerCli.py report --steady-state measurement.xml
+    $ python ProfilerCli.py throughput --sizes sizes.json --bandwidth 100 --gflops 1000 *.xml
+    $ python ProfilerCli.py gpu --baseline-threads 16 openmp_*.xml cuda_*.xml
+    $ python ProfilerCli.py sweep --threads 1-64 --path ./model model.py
+"""
+import argparse
+import datetime
+import os
+import sys
+
+from numpy import inf, isnan, nanmean
+
+from Breakdown import Breakdown
+from History import History, parse_date
+from ParallelLoader import ParallelLoader
+from ProfileCache import ProfileCache
+from Ranks import CRITICAL_PATH_COLUMNS, critical_path_summary, group_ranks, RANK_COLUMNS, rank_statistics
+from Regression import compare_containers, regressions, REGRESSION_COLUMNS, UNCHANGED
+from Scaling import CROSS_SPEEDUP_COLUMNS, cross_speedups, efficiency_ranking, fit_scaling, MODELS, RANKING_COLUMNS, thread_baseline
+from Statistics import PHASE_COLUMNS, phase_statistics, WARMUP_MAX_FRACTION, WARMUP_PENALTY
+from SweepRunner import PARADIGMS, parse_threads, SweepRunner
+from Throughput import parse_cost, plot_roofline, Roofline, roofline_points, throughput_table, THROUGHPUT_COLUMNS, UNIT_COSTS
+
+# names of the sub commands, used by __init__.py to select the headless mode
+COMMANDS = ["compare", "gpu", "history", "phases", "ranking", "ranks", "report", "scaling", "sweep", "throughput"]
+
+# sort orders of the ranking command: column and worst first
+RANKING_ORDERS = {
+    "lost-total": (RANKING_COLUMNS.index("lost total (ms)"), True),
+    "lost": (RANKING_COLUMNS.index("lost per call (ms)"), True),
+    "efficiency": (RANKING_COLUMNS.index("efficiency"), False),
+    "speedup": (RANKING_COLUMNS.index("speedup"), False),
+}
+
+
+def load_files(fnames, use_cache=True, steady_state=False):
+    """
+    Load the profiling files in parallel. Returns a dictionary of the
+    DataContainers by their key, broken files are reported on stderr.
+
+    Arguments:
+        * fnames -- list of paths of the profiling files
+        * use_cache -- use the binary cache, see ProfileCache -- default = True
+        * steady_state -- drop the warm-up, see DataContainer.steady_state() -- default = False
+    """
+    loader = ParallelLoader(ProfileCache() if use_cache else None)
+
+    data = {}
+    for fname, container in loader.load(fnames):
+        if container is None:
+            sys.stderr.write("Problem while importing " + fname + "\n")
+        else:
+            data[container.key()] = container.steady_state() if steady_state else container
+    return data
+
+
+def print_table(header, rows, out=sys.stdout):
+    """
+    Print rows of values as aligned text table. Floats are printed with 4 decimals.
+
+    Arguments:
+        * header -- list of column titles
+        * rows -- list of rows, each a list of values
+    """
+    text = [[("%.4f" % v) if isinstance(v, float) else str(v) for v in row] for row in rows]
+    widths = [max([len(h)] + [len(row[i]) for row in text]) for i, h in enumerate(header)]
+
+    out.write("  ".join(h.ljust(w) for h, w in zip(header, widths)) + "\n")
+    out.write("  ".join("-" * w for w in widths) + "\n")
+    for row in text:
+        out.write("  ".join(v.ljust(w) for v, w in zip(row, widths)) + "\n")
+    out.write("\n")
+
+
+def function_table(data):
+    """
+    Rows of (obj_type, name, func, mean, std, tests) for all functions of a container.
+    Mean and std are averaged over the tests.
+    """
+    mean_values = nanmean(data.mean_values(), axis=0)
+    std_values = nanmean(data.std_values(), axis=0)
+
+    rows = []
+    for col, (obj_type, name, func) in enumerate(data.series()):
+        rows.append([obj_type, name, func, float(mean_values[col]), float(std_values[col]), data.num_tests()])
+    return rows
+
+
+def speedup_table(data):
+    """
+    Return the thread counts and rows of (obj_type, name, func, speedups ...) of all
+    functions. The speedup is computed against the measurement with one thread of
+    the same paradigm. Returns an empty table if there is no such measurement.
+
+    Arguments:
+        * data -- dictionary of DataContainers by key
+    """
+    baselines = dict((k, thread_baseline(data, data[k])) for k in data)
+    keys = sorted([k for k in data if data[k].num_threads() != 1 and baselines[k] is not None],
+                  key=lambda k: data[k].num_threads())
+    if len(keys) == 0:
+        return [], []
+
+    rows = []
+    for key in keys:
+        base = baselines[key]
+        base_mean = nanmean(base.mean_values(), axis=0)
+        mean_values = nanmean(data[key].mean_values(), axis=0)
+
+        for col, series in enumerate(data[key].series()):
+            try:
+                speedup = base_mean[base.column(*series)] / mean_values[col]
+            except KeyError:
+                continue
+            rows.append((series, key, float(speedup)))
+
+    # one row per function, one column per configuration
+    table = {}
+    for series, key, speedup in rows:
+        table.setdefault(series, {})[key] = speedup
+
+    result = []
+    for series, values in table.items():
+        result.append(list(series) + [values.get(key, float("nan")) for key in keys])
+    return keys, result
+
+
+def scaling_table(series, fit, max_threads=None):
+    """
+    Rows of (obj_type, name, func, Amdahl serial fraction (%), Gustafson serial fraction (%),
+    sigma, kappa, USL peak, recommended threads, best model) of a ScalingFit.
+
+    Arguments:
+        * series -- list of (obj_type, name, func) of the fitted rows
+        * fit (ScalingFit) -- the fitted models
+        * max_threads -- upper limit of the recommended threads -- default = None
+    """
+    rows = []
+    for f, (obj_type, name, func) in enumerate(series):
+        if isnan(fit.serial[f]):
+            continue
+        recommended = fit.recommended_threads(f, max_threads)
+        best = min(sorted(MODELS), key=lambda m: inf if isnan(fit.error[m][f]) else fit.error[m][f])
+        rows.append([obj_type, name, func, 100.0 * float(fit.serial[f]), 100.0 * float(fit.gustafson_serial[f]),
+                     float(fit.sigma[f]), float(fit.kappa[f]), float(fit.peak[f]),
+                     "-" if recommended is None else recommended, MODELS[best]])
+    return rows
+
+
+def write_charts(data, directory):
+    """
+    Write the step breakdown of each container and the speedup of the network
+    functions as PNG files. matplotlib is imported here with the Agg backend.
+
+    Arguments:
+        * data -- dictionary of DataContainers by key
+        * directory -- output directory
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    for key, container in data.items():
+        breakdown = Breakdown(container)
+        if len(breakdown) == 0:
+            continue
+
+        for index in range(container.num_tests()):
+            parts = breakdown.parts(index, 0)
+            figure = Figure(figsize=(6, 6))
+            FigureCanvasAgg(figure)
+            ax = figure.gca()
+            ax.pie([max(v, 0.0) for _, v in parts], labels=["%s\n(%.4f)" % p for p in parts],
+                   autopct='%1.1f%%', startangle=90)
+            ax.set_title(key + " - Measurement " + str(index) + " (in ms)")
+            ax.set_aspect('equal')
+            figure.savefig(os.path.join(directory, "breakdown_" + key + "_" + str(index) + ".png"))
+
+    keys, rows = speedup_table(data)
+    if len(keys) != 0:
+        figure = Figure(figsize=(8, 6))
+        FigureCanvasAgg(figure)
+        ax = figure.gca()
+        threads = [data[k].num_threads() for k in keys]
+        for row in rows:
+            if row[0] == "net":
+                ax.plot(threads, row[3:], "-o", label=row[1] + " - " + row[2])
+        ax.set_xlabel("threads")
+        ax.set_ylabel("1 Thread / x Threads")
+        ax.grid(True)
+        ax.legend()
+        figure.savefig(os.path.join(directory, "speedup.png"))
+
+
+def print_report(data):
+    """
+    Print function table, step breakdown and speedup of the DataContainers.
+
+    Arguments:
+        * data -- dictionary of DataContainers by key
+    """
+    for key in sorted(data):
+        container = data[key]
+        print("=== " + key + " (" + str(container.num_tests()) + " tests) ===\n")
+        print_table(["type", "name", "func", "mean (ms)", "std (ms)", "tests"], function_table(container))
+
+        breakdown = Breakdown(container)
+        for index in range(container.num_tests() if len(breakdown) != 0 else 0):
+            parts = breakdown.parts(index, 0)
+            step = sum(v for _, v in parts)
+            print("Breakdown of network step, measurement " + str(index) + ":")
+            print_table(["part", "mean (ms)", "%"], [[f, v, 100.0 * v / step] for f, v in parts])
+
+    keys, rows = speedup_table(data)
+    if len(keys) != 0:
+        print("=== Speedup (1 Thread / x Threads) ===\n")
+        print_table(["type", "name", "func"] + keys, rows)
+
+
+def report(args):
+    """
+    Print the report of the given files.
+    """
+    data = load_files(args.files, not args.no_cache, args.steady_state)
+    if len(data) == 0:
+        return 1
+
+    print_report(data)
+    if args.charts:
+        write_charts(data, args.charts)
+
+    return 0
+
+
+def scaling(args):
+    """
+    Print the fitted scaling models of all functions of the given files.
+    """
+    data = load_files(args.files, not args.no_cache, args.steady_state)
+    fits = fit_scaling(data)
+    if len(fits) == 0:
+        sys.stderr.write("Scaling needs a measurement with one thread and some with more threads.\n")
+        return 1
+
+    for prefix in sorted(fits):
+        series, threads, fit = fits[prefix]
+        print("=== Scaling of " + prefix + " (threads " + ", ".join(str(int(t)) for t in threads) + ") ===\n")
+        print_table(["type", "name", "func", "Amdahl serial (%)", "Gustafson serial (%)", "USL sigma", "USL kappa",
+                     "USL peak", "recommended threads", "best fit"], scaling_table(series, fit, args.max_threads))
+
+    return 0
+
+
+def compare(args):
+    """
+    Compare a candidate with a baseline measurement. Returns 1 if a function got
+    significantly slower by more than the threshold, 2 if a file could not be loaded.
+    """
+    loader = ParallelLoader(None if args.no_cache else ProfileCache())
+    results = loader.load([args.baseline, args.candidate])
+    for fname, container in results:
+        if container is None:
+            sys.stderr.write("Problem while importing " + fname + "\n")
+            return 2
+
+    baseline, candidate = results[0][1], results[1][1]
+    if args.steady_state:
+        baseline, candidate = baseline.steady_state(), candidate.steady_state()
+    rows = compare_containers(baseline, candidate, args.threshold / 100.0, args.alpha)
+
+    shown = rows if args.all else [row for row in rows if row[-1] != UNCHANGED]
+    print("=== " + args.candidate + " compared to " + args.baseline + " ===\n")
+    if len(shown) != 0:
+        print_table(REGRESSION_COLUMNS, shown)
+
+    found = regressions(rows)
+    print(str(len(found)) + " regressions (threshold " + str(args.threshold) + " %, alpha " + str(args.alpha) + ")")
+    return 1 if len(found) != 0 else 0
+
+
+def history(args):
+    """
+    Add profiling files to the history database or show the history of a function.
+    """
+    db = History(args.database)
+    try:
+        if args.action == "ingest":
+            try:
+                date = parse_date(args.date) if args.date else None
+            except ValueError as e:
+                sys.stderr.write(str(e) + "\n")
+                return 2
+            added = db.ingest(args.files, args.commit, args.host, date, None if args.no_cache else ProfileCache())
+            print(str(added) + " new runs, " + str(db.num_runs()) + " runs in the history")
+            return 0
+
+        if args.action == "functions":
+            print_table(["type", "name", "func"], db.functions())
+            return 0
+
+        values = db.series(args.obj_type, args.name, args.function, args.paradigm, args.threads, args.rank, args.device)
+        if len(values["date"]) == 0:
+            sys.stderr.write("No measurements of this function and configuration.\n")
+            return 1
+
+        # the ranks of an MPI run or several GPUs are separate series
+        configs = sorted(set(zip(values["rank"], values["device"])))
+        if len(configs) > 1:
+            sys.stderr.write("Measurements of several ranks or devices, select one with --rank and --device: " +
+                             ", ".join("rank " + repr(rank) + (" on " + device if device else "") for rank, device in configs) + "\n")
+            return 2
+
+        rows = []
+        for i in range(len(values["date"])):
+            date = datetime.datetime.fromtimestamp(values["date"][i]).strftime("%Y-%m-%d %H:%M")
+            rows.append([date, values["commit"][i] or "-", values["host"][i] or "-",
+                         float(values["mean"][i]), float(values["std"][i])])
+        print_table(["date", "commit", "host", "mean (ms)", "std (ms)"], rows)
+        return 0
+    finally:
+        db.close()
+
+
+def phases(args):
+    """
+    Print the warm-up and steady-state statistics of all functions of the given files.
+    """
+    data = load_files(args.files, not args.no_cache)
+    if len(data) == 0:
+        return 2
+
+    for key in sorted(data):
+        rows = phase_statistics(data[key], args.penalty, args.max_fraction)
+        if args.top is not None:
+            rows = rows[:args.top]
+        print("=== " + key + " (" + str(data[key].num_tests()) + " tests) ===\n")
+        print_table(PHASE_COLUMNS, rows)
+    return 0
+
+
+def ranking(args):
+    """
+    Print the functions with the worst parallel efficiency of the given files.
+    """
+    data = load_files(args.files, not args.no_cache, args.steady_state)
+    rows = efficiency_ranking(data)
+    if len(rows) == 0:
+        sys.stderr.write("The ranking needs a measurement with one thread and some with more threads.\n")
+        return 1
+
+    col, descending = RANKING_ORDERS[args.sort]
+    rows.sort(key=lambda row: inf if isnan(row[col]) else (-row[col] if descending else row[col]))
+    if args.top is not None:
+        rows = rows[:args.top]
+
+    print_table(RANKING_COLUMNS, rows)
+    return 0
+
+
+def ranks(args):
+    """
+    Print the load imbalance and the critical path of the MPI runs in the given files.
+    """
+    groups = group_ranks(load_files(args.files, not args.no_cache, args.steady_state))
+    if len(groups) == 0:
+        sys.stderr.write("No MPI run with more than one rank found.\n")
+        return 1
+
+    for name in sorted(groups):
+        containers = groups[name]
+        rows = rank_statistics(containers)
+        critical = critical_path_summary(containers)
+        if args.top is not None:
+            rows = rows[:args.top]
+            critical = critical[:args.top]
+
+        print("=== " + name + " (" + str(len(containers)) + " ranks) ===\n")
+        print_table(RANK_COLUMNS, rows)
+        print("Critical path of the network step:")
+        print_table(CRITICAL_PATH_COLUMNS, critical)
+
+    return 0
+
+
+def throughput(args):
+    """
+    Print the neurons and synapses per second of the populations and projections
+    with a known size and compare them to the roofline of the machine.
+    """
+    costs = dict(UNIT_COSTS)
+    try:
+        costs.update(parse_cost(cost) for cost in args.cost or [])
+        roofline = None
+        if args.bandwidth is not None or args.gflops is not None:
+            if args.bandwidth is None or args.gflops is None:
+                raise ValueError("The roofline needs both --bandwidth and --gflops.")
+            roofline = Roofline(args.bandwidth, args.gflops)
+    except ValueError as e:
+        sys.stderr.write(str(e) + "\n")
+        return 2
+
+    data = load_files(args.files, not args.no_cache, args.steady_state)
+    if args.sizes:
+        for container in data.values():
+            try:
+                container.load_sizes(args.sizes)
+            except (OSError, ValueError) as e:
+                sys.stderr.write("Problem while reading the sizes " + args.sizes + ": " + str(e) + "\n")
+                return 2
+
+    rows = throughput_table(data, costs, roofline)
+    if len(rows) == 0:
+        sys.stderr.write("No population or projection with a known size found, see --sizes.\n")
+        return 1
+
+    print_table(THROUGHPUT_COLUMNS, rows)
+    if roofline is not None:
+        print("Ridge point: %.4f FLOP/byte, functions below are memory bound.\n" % roofline.ridge())
+
+    if args.chart:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        figure = Figure(figsize=(8, 6))
+        FigureCanvasAgg(figure)
+        plot_roofline(figure.gca(), roofline_points(data, costs), roofline)
+        figure.savefig(args.chart)
+
+    return 0
+
+
+def gpu(args):
+    """
+    Print the speedups of the GPU measurements against a measurement of another paradigm.
+    """
+    data = load_files(args.files, not args.no_cache, args.steady_state)
+    if not any(container.is_gpu() for container in data.values()):
+        sys.stderr.write("No GPU measurement found.\n")
+        return 1
+
+    candidates = [container for container in data.values() if container.paradigm() == args.baseline_paradigm and
+                  (args.baseline_threads is None or container.num_threads() == args.baseline_threads)]
+    if len(candidates) == 0:
+        sys.stderr.write("No " + args.baseline_paradigm + " measurement found as baseline.\n")
+        return 1
+    baseline = max(candidates, key=lambda container: (container.num_threads(), container.rank()))
+
+    print("=== Speedup against " + baseline.label() + " ===\n")
+    print_table(CROSS_SPEEDUP_COLUMNS, cross_speedups(data, baseline))
+    return 0
+
+
+def sweep(args):
+    """
+    Run a script for several paradigms and thread counts and print the report
+    of the measurements. Returns 1 if a run failed.
+    """
+    try:
+        threads = parse_threads(args.threads)
+    except ValueError as e:
+        sys.stderr.write(str(e) + "\n")
+        return 2
+
+    runner = SweepRunner(args.script, args.path, args.args, threads, args.paradigm or ["openmp"],
+                         args.parallel, args.out, args.timeout, None if args.no_cache else ProfileCache())
+
+    def finished(run):
+        state = "done" if run.succeeded() else "FAILED (exit code " + str(run.returncode) + ", see " + run.log + ")"
+        sys.stderr.write(run.name() + ": " + state + "\n")
+
+    runs = runner.run(intermediate=finished)
+
+    data = dict((run.data.key(), run.data) for run in runs if run.succeeded())
+    if len(data) != 0:
+        print_report(data)
+        if args.charts:
+            write_charts(data, args.charts)
+
+    return 0 if all(run.succeeded() for run in runs) else 1
+
+
+def main(argv=None):
+    """
+    Parse the command line and execute the sub command. Returns the exit code.
+    """
+    parser = argparse.ArgumentParser(prog="ANNarchyProfiler", description="Headless analysis of ANNarchy profiling files.")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    cmd = commands.add_parser("report", help="print mean/std values, step breakdown and speedups")
+    cmd.add_argument("files", nargs="+", help="profiling files (*.xml)")
+    cmd.add_argument("--charts", metavar="DIR", help="write the charts as PNG files into DIR")
+    cmd.add_argument("--no-cache", action="store_true", help="do not use the binary cache")
+    cmd.add_argument("--steady-state", action="store_true", help="drop the warm-up of each test, see the phases command")
+    cmd.set_defaults(func=report)
+
+    cmd = commands.add_parser("scaling", help="fit Amdahl, Gustafson and USL models to the speedups")
+    cmd.add_argument("files", nargs="+", help="profiling files (*.xml), one of them measured with one thread")
+    cmd.add_argument("--max-threads", type=int, metavar="N", help="upper limit of the recommended thread count, e.g. the number of cores")
+    cmd.add_argument("--no-cache", action="store_true", help="do not use the binary cache")
+    cmd.add_argument("--steady-state", action="store_true", help="drop the warm-up of each test, see the phases command")
+    cmd.set_defaults(func=scaling)
+
+    cmd = commands.add_parser("compare", help="compare two measurements, exit code 1 on regression")
+    cmd.add_argument("baseline", help="profiling file of the reference")
+    cmd.add_argument("candidate", help="profiling file to check")
+    cmd.add_argument("--threshold", type=float, default=5.0, metavar="PERCENT", help="minimal slowdown of a regression in percent -- default = 5")
+    cmd.add_argument("--alpha", type=float, default=0.05, help="significance level of the Mann-Whitney test -- default = 0.05")
+    cmd.add_argument("--all", action="store_true", help="show also the unchanged functions")
+    cmd.add_argument("--no-cache", action="store_true", help="do not use the binary cache")
+    cmd.add_argument("--steady-state", action="store_true", help="drop the warm-up of each test, see the phases command")
+    cmd.set_defaults(func=compare)
+
+    cmd = commands.add_parser("gpu", help="speedup of the GPU measurements against a measurement of another paradigm")
+    cmd.add_argument("files", nargs="+", help="profiling files (*.xml) of the GPU runs and the baseline")
+    cmd.add_argument("--baseline-paradigm", default="openmp", metavar="PARADIGM", help="paradigm of the baseline -- default = openmp")
+    cmd.add_argument("--baseline-threads", type=int, metavar="N", help="number of threads of the baseline -- default = the most threads")
+    cmd.add_argument("--no-cache", action="store_true", help="do not use the binary cache")
+    cmd.add_argument("--steady-state", action="store_true", help="drop the warm-up of each test, see the phases command")
+    cmd.set_defaults(func=gpu)
+
+    cmd = commands.add_parser("history", help="database of the mean times of many runs")
+    cmd.add_argument("--database", metavar="FILE", help="database file -- default = $ANNARCHY_PROFILER_HISTORY or ~/.local/share/ANNarchyProfiler/history.sqlite")
+    actions = cmd.add_subparsers(dest="action")
+    actions.required = True
+    cmd.set_defaults(func=history)
+
+    action = actions.add_parser("ingest", help="add profiling files, files already in the database are skipped")
+    action.add_argument("files", nargs="+", help="profiling files (*.xml)")
+    action.add_argument("--commit", help="version of the model or simulator, e.g. a git commit")
+    action.add_argument("--host", help="machine of the runs")
+    action.add_argument("--date", help="date of the runs (YYYY-MM-DD [HH:MM]) -- default = modification time of the files")
+    action.add_argument("--no-cache", action="store_true", help="do not use the binary cache")
+
+    action = actions.add_parser("functions", help="list the functions in the database")
+
+    action = actions.add_parser("show", help="print the mean times of a function over time")
+    action.add_argument("obj_type", choices=["net", "pop", "proj"])
+    action.add_argument("name", help="name of the network, population or projection")
+    action.add_argument("function", metavar="func", help="name of the function")
+    action.add_argument("--paradigm", default="openmp", help="-- default = openmp")
+    action.add_argument("--threads", type=int, default=1, help="-- default = 1")
+    action.add_argument("--rank", help="MPI rank, needed if several ranks were stored -- default = any")
+    action.add_argument("--device", help="GPU, needed if several devices were stored -- default = any")
+
+    cmd = commands.add_parser("phases", help="warm-up and steady-state statistics of each function")
+    cmd.add_argument("files", nargs="+", help="profiling files (*.xml)")
+    cmd.add_argument("--penalty", type=float, default=WARMUP_PENALTY, help="threshold of a change point in units of log(n) * variance -- default = %(default)s")
+    cmd.add_argument("--max-fraction", type=float, default=WARMUP_MAX_FRACTION, help="maximal length of the warm-up relative to a test -- default = %(default)s")
+    cmd.add_argument("--top", type=int, metavar="N", help="show only the N functions with the largest inflation")
+    cmd.add_argument("--no-cache", action="store_true", help="do not use the binary cache")
+    cmd.set_defaults(func=phases)
+
+    cmd = commands.add_parser("ranking", help="rank the functions by parallel efficiency and time lost")
+    cmd.add_argument("files", nargs="+", help="profiling files (*.xml), one of them measured with one thread")
+    cmd.add_argument("--sort", default="lost-total", choices=sorted(RANKING_ORDERS), help="sort order, worst first -- default = lost-total")
+    cmd.add_argument("--top", type=int, metavar="N", help="show only the N worst functions")
+    cmd.add_argument("--no-cache", action="store_true", help="do not use the binary cache")
+    cmd.add_argument("--steady-state", action="store_true", help="drop the warm-up of each test, see the phases command")
+    cmd.set_defaults(func=ranking)
+
+    cmd = commands.add_parser("ranks", help="load imbalance and critical path of MPI runs")
+    cmd.add_argument("files", nargs="+", help="profiling files (*.xml) of all ranks")
+    cmd.add_argument("--top", type=int, metavar="N", help="show only the N most imbalanced functions and critical ranks")
+    cmd.add_argument("--no-cache", action="store_true", help="do not use the binary cache")
+    cmd.add_argument("--steady-state", action="store_true", help="drop the warm-up of each test, see the phases command")
+    cmd.set_defaults(func=ranks)
+
+    cmd = commands.add_parser("throughput", help="neurons and synapses per second and the roofline of the machine")
+    cmd.add_argument("files", nargs="+", help="profiling files (*.xml)")
+    cmd.add_argument("--sizes", metavar="FILE", help="JSON file of the sizes, e.g. {\"pop\": {\"pop0\": 1000}, \"proj\": {\"proj0\": 100000}}")
+    cmd.add_argument("--bandwidth", type=float, metavar="GB/s", help="peak memory bandwidth of the machine, e.g. measured by STREAM")
+    cmd.add_argument("--gflops", type=float, metavar="GFLOP/s", help="peak floating point performance of the machine")
+    cmd.add_argument("--cost", action="append", metavar="TYPE:FUNC=FLOP:BYTES", help="FLOP and bytes per neuron or synapse of a function, can be repeated, e.g. proj:psp=2:12")
+    cmd.add_argument("--chart", metavar="FILE", help="write the roofline chart as PNG file")
+    cmd.add_argument("--no-cache", action="store_true", help="do not use the binary cache")
+    cmd.add_argument("--steady-state", action="store_true", help="drop the warm-up of each test, see the phases command")
+    cmd.set_defaults(func=throughput)
+
+    cmd = commands.add_parser("sweep", help="run a script for several thread counts and paradigms")
+    cmd.add_argument("script", help="the ANNarchy script")
+    cmd.add_argument("--path", default=".", help="working directory of the script -- default = .")
+    cmd.add_argument("--args", default="", help="additional arguments of the script")
+    cmd.add_argument("--threads", default="1", help="thread counts, e.g. 1,2,4 or 1-64 -- default = 1")
+    cmd.add_argument("--paradigm", action="append", choices=sorted(PARADIGMS), help="can be repeated -- default = openmp")
+    cmd.add_argument("--parallel", type=int, metavar="N", help="maximum number of runs at the same time -- default = number of cores")
+    cmd.add_argument("--timeout", type=float, metavar="SEC", help="maximum duration of a run")
+    cmd.add_argument("--out", metavar="DIR", help="directory of the sweep directories -- default = working directory")
+    cmd.add_argument("--charts", metavar="DIR", help="write the charts as PNG files into DIR")
+    cmd.add_argument("--no-cache", action="store_true", help="do not use the binary cache")
+    cmd.set_defaults(func=sweep)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -21,15 +21,51 @@
 #     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
 # ==============================================================================
+import functools
+import html
 import os
 
 from PyQt5.QtCore import pyqtSlot, Qt
-from PyQt5.QtWidgets import QErrorMessage, QFileDialog, QMainWindow, QMessageBox, QTreeWidgetItem
-from PyQt5.uic import loadUi
+from PyQt5.QtGui import QColor
+from PyQt5.QtWidgets import QErrorMessage, QFileDialog, QMainWindow, QMessageBox, QProgressDialog, QTableWidgetItem, QTreeWidgetItem
 
-from DataContainer import DataContainer
+from numpy import array, concatenate, isnan, linspace, nanmean, nanstd
+
+from Breakdown import Breakdown, OVERHEAD, stack_parts
+from DataContainer import DataContainer, read_sizes
+from History import History
+from ParallelLoader import ParallelLoader
+from ProfileCache import ProfileCache
+from Ranks import CRITICAL_PATH_COLUMNS, critical_path_summary, group_ranks, RANK_COLUMNS, rank_statistics
+from Regression import ADDED, compare_containers, IMPROVEMENT, REGRESSION, REGRESSION_COLUMNS, REMOVED, UNCHANGED
 from RunDialog import RunDialog
+from Scaling import CROSS_SPEEDUP_COLUMNS, cross_speedups, efficiency_ranking, fit_scaling, RANKING_COLUMNS, thread_baseline
+from Statistics import bootstrap, compare_samples, OUTLIER_FILTERS, PHASE_COLUMNS, phase_statistics
+from SweepRunner import parse_threads, SweepRunner
+from Throughput import Roofline, roofline_points, throughput_table, THROUGHPUT_COLUMNS
+from Timeline import MinMaxPyramid, test_starts, trace
 from Charts import MatplotlibWidget
+from Ui_ProfilerWindow import Ui_ProfilerWindow
+from Workers import TaskManager
+
+# error bars of the errorbar chart, the confidence intervals are computed by bootstrap
+ERRORBAR_MODES = {
+    "std": "\u00b1 std",
+    "mean": "95 % confidence interval of the mean",
+    "median": "95 % confidence interval of the median",
+}
+
+# charts of the step breakdown
+PIE_MODES = {
+    "pie": "Pie chart",
+    "sunburst": "Sunburst",
+}
+
+# labels of the parts of the network step in the pie chart
+PIE_LABELS = {"rng": "Draw from RNG", OVERHEAD: "Overhead"}
+
+# number of resamples of the bootstrap
+RESAMPLES = 10000
 
 
 class ProfilerWindow(QMainWindow):
@@ -41,7 +77,8 @@ class ProfilerWindow(QMainWindow):
         Init the class variables, load the window and add actions to the menubar.
         """
         super(self.__class__, self).__init__()
-        self.ui = loadUi("ProfilerWindow.ui")
+        self.ui = Ui_ProfilerWindow()
+        self.ui.setupUi(self)
         
         # actions menubar
         self.ui.btnLoadData.triggered.connect(self.load_data_dialog)
@@ -57,45 +94,141 @@ class ProfilerWindow(QMainWindow):
         self.ui.ErrorbarChartTree.currentItemChanged.connect(self.change_errorbarchart_tree)
         self.ui.FunctionSelectTree.itemSelectionChanged.connect(self.change_multithread_selection)
         self.ui.ThreadSelectTree.itemChanged.connect(self.change_multithread_selection)
+        self.ui.ThreadSelectTree.itemChanged.connect(self.change_barchart_selection)
+        self.ui.TimelineTree.itemSelectionChanged.connect(self.change_timeline_selection)
+        self.ui.IcicleSelectTree.itemChanged.connect(self.change_icicle_selection)
         
         # action checkbox
         self.ui.chkStdValues.stateChanged.connect(self.change_std_state)
+        self.ui.chkSteadyState.stateChanged.connect(self.change_steady_state)
+        self.ui.chkBarPercentage.stateChanged.connect(self.change_barchart_selection)
         
         # action button
         self.ui.btnRawData.clicked.connect(self.click_raw_data)
         self.ui.btnRecalc.clicked.connect(self.click_recalc_errorbar)
+        self.ui.btnCompare.clicked.connect(self.click_compare)
+        self.ui.btnRegression.clicked.connect(self.click_regression)
+        self.ui.btnRegressionFile.clicked.connect(self.click_regression_file)
+        self.ui.btnHistoryIngest.clicked.connect(self.click_history_ingest)
+        self.ui.btnSizes.clicked.connect(self.click_sizes)
+        self.ui.btnThroughput.clicked.connect(self.update_throughput)
+
+        # the history is read when its tab is shown first
+        self.ui.AnalyzerWidget.currentChanged.connect(self.change_analyzer_tab)
+        self.ui.cmbHistoryFunction.currentIndexChanged.connect(self.change_history_function)
+        self.ui.cmbHistoryConfig.currentIndexChanged.connect(self.change_history_config)
+        self.ui.cmbRankRun.currentIndexChanged.connect(self.change_rank_run)
+        self.ui.cmbGpuBaseline.currentIndexChanged.connect(self.change_gpu_baseline)
+
+        # outlier filters for the recalculation
+        for method, text in OUTLIER_FILTERS.items():
+            self.ui.cmbFilter.addItem(text, method)
+
+        # error bars of the errorbar chart
+        for mode, text in ERRORBAR_MODES.items():
+            self.ui.cmbErrorMode.addItem(text, mode)
+        self.ui.cmbErrorMode.currentIndexChanged.connect(self.change_error_mode)
+
+        # charts of the step breakdown
+        for mode, text in PIE_MODES.items():
+            self.ui.cmbPieMode.addItem(text, mode)
+        self.ui.cmbPieMode.currentIndexChanged.connect(self.change_pie_mode)
         
         # set class variables 
         self._data = {}
+        self._measured = {}             # the loaded measurements, self._data holds their steady states if chosen
+        self._cache = ProfileCache()
+        self._tasks = TaskManager(self, error=self._task_failed)
+        self._loads = 0                 # number of load requests, each gets its own channel
+        self._regression_files = {}     # measurements loaded for the comparison only, by file name
+        self._sizes = {}                # sizes of populations and projections read from side files, see click_sizes()
+        self._history_loaded = False
+        self._pyramids = {}             # MinMaxPyramids of the current measurement by (obj_type, name, func)
+        self._breakdowns = {}           # Breakdowns of the measurements by key, built when shown first
+        self._errorbar_shown = None     # redraws the errorbar chart with the shown data
+        self._multithread_shown = None  # redraws the multi thread and speedup chart with the shown data
     
-    def show(self):
-        """
-        Display the widget.
-        """
-        self.ui.show()
-        
-    def add_data(self, data):
+    def add_data(self, data, update=True):
         """
         Add a new DataContainer instance to measurement-data.
         Ask for overwriting if a measurement with same number of threads exists.
         
         Arguments:
             * data (DataContainer) -- new data to hold in app
+            * update (boolean) -- refresh the views, disable it if several files are added at once -- default = True
         """
         # Show warning if data for paradigm with same number of threads exists
         if data.key() in self._data:
             msg = QMessageBox()
-            msg.setText(data.paradigm() + " with " + str(data.num_threads()) + " threads already exists. Want to overwrite?")
+            msg.setText(data.label() + " already exists. Want to overwrite?")
             msg.setIcon(QMessageBox.Warning)
             msg.setStandardButtons(QMessageBox.No | QMessageBox.Yes)
             msg.setDefaultButton(QMessageBox.Yes)
             if msg.exec_() != QMessageBox.Yes:
                 return
         
-        self._data[data.key()] = data
+        data.set_sizes(self._sizes)
+        self._measured[data.key()] = data
+        self._data[data.key()] = data.steady_state() if self.ui.chkSteadyState.isChecked() else data
+        if update:
+            self.update_views()
+
+    def update_views(self):
+        """
+        Refresh the combobox and selection trees after measurement-data was added.
+        """
+        # a measurement may have been replaced, so the rendered charts are outdated
+        for chart in (self.ui.ErrorbarChart, self.ui.PieChart, self.ui.MultiThreadChart, self.ui.SpeedupChart,
+                      self.ui.BarChart):
+            chart.forget()
+        self._breakdowns = {}
+
         self.update_cmb_thread()
         self.update_function_select()
         self.update_thread_select()
+        self.change_barchart_selection()
+        self.update_icicle_select()
+        self.update_rank_runs()
+        self.update_gpu_baseline()
+        self.update_throughput()
+
+        self._tasks.submit("ranking", efficiency_ranking, self._draw_ranking, dict(self._data))
+
+    def _draw_ranking(self, rows):
+        """
+        Show the result of Scaling.efficiency_ranking() in the ranking table.
+        """
+        self._fill_table(self.ui.RankingTable, RANKING_COLUMNS, rows)
+        self.ui.RankingTable.sortByColumn(len(RANKING_COLUMNS) - 1, Qt.DescendingOrder)
+
+    def _fill_table(self, table, columns, rows, colors={}):
+        """
+        Show rows of values in a sortable table.
+
+        Arguments:
+            * table (QTableWidget) -- the table
+            * columns -- list of column titles
+            * rows -- list of rows, each a list of values
+            * colors -- background colors of the rows by the value in the last column -- default = {}
+        """
+        table.setSortingEnabled(False)
+        table.clear()
+        table.setColumnCount(len(columns))
+        table.setHorizontalHeaderLabels(columns)
+        table.setRowCount(len(rows))
+
+        for r, row in enumerate(rows):
+            color = colors.get(row[-1])
+            for c, value in enumerate(row):
+                item = QTableWidgetItem()
+                # numbers as data, so the columns are sorted numerically
+                item.setData(Qt.DisplayRole, round(value, 4) if isinstance(value, float) else value)
+                if color is not None:
+                    item.setBackground(QColor(color))
+                table.setItem(r, c, item)
+
+        table.setSortingEnabled(True)
+        table.resizeColumnsToContents()
         
     def current_data(self):
         """
@@ -109,6 +242,35 @@ class ProfilerWindow(QMainWindow):
 
         return self._data[sel_idx]
 
+    def current_breakdown(self):
+        """
+        Returns the Breakdown of the network step of the data chosen over the combobox.
+        """
+        return self._breakdown(self.current_data())
+
+    def _breakdown(self, data):
+        """
+        Returns the Breakdown of a measurement, it is built on first use.
+        """
+        if not data.key() in self._breakdowns:
+            self._breakdowns[data.key()] = Breakdown(data)
+        return self._breakdowns[data.key()]
+
+    def _task_failed(self, msg, progress=None):
+        """
+        Report an exception raised in a background task.
+
+        Arguments:
+            * msg -- the traceback
+            * progress (QProgressDialog) -- the dialog of the task -- default = None
+        """
+        if progress is not None:
+            progress.close()
+
+        print(msg)
+        error = QErrorMessage(self)
+        error.showMessage("Error in a background task:<br><pre>" + html.escape(msg) + "</pre>")
+
     # ==============================================================================
     # actions for the buttons in the menu bar
     # ==============================================================================
@@ -122,35 +284,97 @@ class ProfilerWindow(QMainWindow):
             * activated() emitted from btnLoadData in menubar
         """
         fnames, _ = QFileDialog.getOpenFileNames(self, 'Open data file', '.', '*.xml')
+        if len(fnames) == 0:
+            return
+
+        # Process the files in parallel (or take them from the cache) in the background
+        loader = ParallelLoader(self._cache)
+        progress = QProgressDialog("Loading data ...", "Cancel", 0, len(fnames), self)
+        progress.setMinimumDuration(500)
+        progress.canceled.connect(loader.cancel)
+
+        # a second batch of files must not cancel the one still loading
+        self._loads += 1
+        self._tasks.submit("load-" + str(self._loads), loader.load, functools.partial(self._loaded_data, progress=progress),
+                           fnames, progress=progress.setValue, error=functools.partial(self._task_failed, progress=progress))
+
+    def _loaded_data(self, results, progress=None):
+        """
+        Store the DataContainers loaded by load_data_dialog() in the application.
+
+        Arguments:
+            * results -- list of (fname, DataContainer) pairs, see ParallelLoader.load()
+            * progress (QProgressDialog) -- the dialog of the request -- default = None
+        """
+        if progress is not None:
+            progress.close()
 
-        for fname in fnames:
-            # Process the file and store the date in a container
-            data = DataContainer()
-            if not data.load_data(fname):
+        for fname, data in results:
+            if data is None:
                 error = QErrorMessage()
                 error.showMessage("Problem while importing data.")
             else:
-                self.add_data(data)
+                self.add_data(data, update=False)
+
+        self.update_views()
         
     @pyqtSlot()
     def load_run_dialog(self):
         """
-        Shows a dialog to enter data for a ANNarchy profile run.
-        Measurement data will be load into the application.
+        Shows a dialog to enter data for a ANNarchy profile run. The script is executed
+        in the background for each chosen paradigm and thread count, the measurement
+        data of each run is loaded into the application as soon as the run is done.
         
         Signals:
             * activated() emitted from btnRunMeasurement in menubar
         """
         diag = RunDialog()
-        script, path, args = diag.get_data()
+        script, path, args, threads, paradigms, max_parallel = diag.get_data()
         
         if(script != ""):
-            os.system("cd " + str(path))
-            os.system("python " + str(script) + " --profile --profile_out=" + str(path) + "/measurement.xml " + str(args))
-            
-            data = DataContainer()
-            data.load_data(str(path) + "/measurement.xml")
-            self.add_data(data)
+            if path == "":
+                path = os.path.dirname(os.path.abspath(script))
+            try:
+                threads = parse_threads(threads)
+            except ValueError:
+                QMessageBox.warning(self, "Run measurement", "The threads must be numbers or ranges, e.g. 1,2,4-8.")
+                return
+
+            runner = SweepRunner(script, path, args, threads, paradigms, max_parallel, cache=self._cache)
+            progress = QProgressDialog("Running measurements ...", "Cancel", 0, runner.num_runs(), self)
+            progress.setMinimumDuration(0)
+            progress.canceled.connect(runner.cancel)
+
+            self._tasks.submit("sweep", runner.run, functools.partial(self._finished_sweep, progress=progress),
+                               progress=progress.setValue, error=functools.partial(self._task_failed, progress=progress),
+                               intermediate=self._finished_run)
+
+    def _finished_run(self, run):
+        """
+        Store the data of a finished run of load_run_dialog() in the application.
+
+        Arguments:
+            * run (SweepRun) -- the finished run
+        """
+        if run.succeeded():
+            self.add_data(run.data)
+
+    def _finished_sweep(self, runs, progress=None):
+        """
+        Report the failed runs of load_run_dialog().
+
+        Arguments:
+            * runs -- list of SweepRuns
+            * progress (QProgressDialog) -- the dialog of the request -- default = None
+        """
+        if progress is not None:
+            progress.close()
+
+        failed = [run for run in runs if run.returncode is not None and not run.succeeded()]
+        if len(failed) != 0:
+            error = QErrorMessage(self)
+            error.showMessage("Failed measurements:<br>" +
+                              "<br>".join(run.name() + " (see " + run.log + ")" for run in failed))
     
     @pyqtSlot()
     def save_chart(self):
@@ -161,6 +385,8 @@ class ProfilerWindow(QMainWindow):
             * activated() emitted from btnSave in menubar
         """
         
+        figure = 0
+
         # tab "Standardabweichung" selected
         if self.ui.AnalyzerWidget.currentIndex() == 0:
             figure = self.ui.ErrorbarChart.figure()
@@ -169,16 +395,29 @@ class ProfilerWindow(QMainWindow):
         elif self.ui.AnalyzerWidget.currentIndex() == 1:
             figure = self.ui.PieChart.figure()
         
-        # tab "Multi-Thread" selected
-        elif self.ui.AnalyzerWidget.currentIndex() == 2:
-            figure = self.ui.MultiThreadChart.figure()
-        
-        # tab "Speedup" selected
-        elif self.ui.AnalyzerWidget.currentIndex() == 3:
-            figure = self.ui.SpeedupChart.figure()
+        # tab "Multi-Thread" selected, with the sub tabs "Multi-Thread Comparision", "Speedup" and "Proportion"
+        elif self.ui.AnalyzerWidget.currentWidget() is self.ui.MultiThreadTab:
+            if self.ui.tabWidget.currentIndex() == 0:
+                figure = self.ui.MultiThreadChart.figure()
+            elif self.ui.tabWidget.currentIndex() == 1:
+                figure = self.ui.SpeedupChart.figure()
+            elif self.ui.tabWidget.currentWidget() is self.ui.ProportionTab:
+                figure = self.ui.BarChart.figure()
+
+        elif self.ui.AnalyzerWidget.currentWidget() is self.ui.IcicleTab:
+            figure = self.ui.IcicleChart.figure()
+
+        elif self.ui.AnalyzerWidget.currentWidget() is self.ui.TimelineTab:
+            figure = self.ui.TimelineChart.figure()
+
+        elif self.ui.AnalyzerWidget.currentWidget() is self.ui.ThroughputTab:
+            figure = self.ui.RooflineChart.figure()
+
+        elif self.ui.AnalyzerWidget.currentWidget() is self.ui.HistoryTab:
+            figure = self.ui.HistoryChart.figure()
                 
         if figure != 0:
-            fname = QFileDialog.getSaveFileName(self, 'Save chart file', './chart.png', 'Image file (*.png *.jpg);;PDF file (*.pdf)')
+            fname, _ = QFileDialog.getSaveFileName(self, 'Save chart file', './chart.png', 'Image file (*.png *.jpg);;PDF file (*.pdf)')
             if fname:
                 figure.savefig(str(fname))
     
@@ -189,16 +428,76 @@ class ProfilerWindow(QMainWindow):
     @pyqtSlot()
     def change_std_state(self):
         """
-        Update ErrorbarChart and MultiThread Chart if state of std state checkbox changed
+        Update ErrorbarChart and MultiThread Chart if state of std state checkbox changed.
+        Only the options changed, so the shown data is drawn again without extracting it.
         
         Signals:
             * stateChanged(int) emitted from chkStdState
             * currentIndexChanged(int) emitted from cmbScale
         """
+        if self._errorbar_shown is not None:
+            self._errorbar_shown()
+
+        if self._multithread_shown is not None:
+            self._multithread_shown()
+
+    def change_steady_state(self):
+        """
+        Replace the measurements by their steady states, or restore them, if the state
+        of the steady state checkbox changed. The warm-up is detected in the background.
+
+        Signals:
+            * stateChanged(int) emitted from chkSteadyState
+        """
+        self._tasks.submit("steady_state", self._steady_values, self._replaced_data,
+                           dict(self._measured), self.ui.chkSteadyState.isChecked())
+
+    def _steady_values(self, measured, steady):
+        """
+        Return the measurements or their steady states by key.
+        """
+        if not steady:
+            return measured
+        return dict((key, data.steady_state()) for key, data in measured.items())
+
+    def _replaced_data(self, data):
+        """
+        Show the measurements computed by _steady_values(). The keys and functions are the
+        same, so the selections are kept and only the charts and tables are drawn again.
+        """
+        # measurements loaded meanwhile are not replaced
+        for key in data:
+            if key in self._data:
+                self._data[key] = data[key]
+
+        for chart in (self.ui.ErrorbarChart, self.ui.PieChart, self.ui.MultiThreadChart, self.ui.SpeedupChart,
+                      self.ui.BarChart):
+            chart.forget()
+        self._pyramids = {}
+        self._breakdowns = {}
+
         if len(self.ui.ErrorbarChartTree.selectedItems()) != 0:
             self.change_errorbarchart_tree(self.ui.ErrorbarChartTree.selectedItems()[0])
-            
+        self.change_piechart_tree(self.ui.PieChartTree.currentItem(), None)
         self.change_multithread_selection()
+        self.change_barchart_selection()
+        self.change_timeline_selection()
+        self.change_icicle_selection()
+        self.change_rank_run()
+        self.change_gpu_baseline()
+        self.update_throughput()
+
+        self._tasks.submit("ranking", efficiency_ranking, self._draw_ranking, dict(self._data))
+
+    def change_error_mode(self):
+        """
+        Compute the errorbars of the selected function again if their kind changed.
+
+        Signals:
+            * currentIndexChanged(int) emitted from cmbErrorMode
+        """
+        if len(self.ui.ErrorbarChartTree.selectedItems()) != 0:
+            self.change_errorbarchart_tree(self.ui.ErrorbarChartTree.selectedItems()[0])
 
     
     #==============================================================================
@@ -216,18 +515,23 @@ class ProfilerWindow(QMainWindow):
         if self.current_data():
             self.update_piechart_tree()
             self.update_errorbarchart_tree()
-            self.update_barchart_tree()
+            self.update_timeline_tree()
+            self.update_phases()
     
     def update_cmb_thread(self):
         """
         Update the items of the combobox from test data
         """
-        self.ui.cmbThread.clear()
+        combos = [self.ui.cmbThread, self.ui.cmbCompare, self.ui.cmbBaseline, self.ui.cmbCandidate]
+        for combo in combos:
+            combo.clear()
         for key in self._data:
-            splitted = key.split("-")
-            thread_count = splitted[1]
-            paradigm = splitted[0]
-            self.ui.cmbThread.addItem(paradigm + " - " + thread_count + " Threads ", key)
+            for combo in combos:
+                combo.addItem(self._data[key].label(), key)
+
+        for fname in self._regression_files:
+            self.ui.cmbBaseline.addItem(os.path.basename(fname), fname)
+            self.ui.cmbCandidate.addItem(os.path.basename(fname), fname)
     
     
     #==============================================================================
@@ -268,42 +572,110 @@ class ProfilerWindow(QMainWindow):
             if len(idx) == 0:
                 return
             
-            mean_values = []
-            std_values = []
-            labels = []
-            
             obj = str(current.text(0)).split(" - ")
-            for i in idx:
-                mean_values.append(self._data[i].values_each_test(obj_type, obj[0], obj[1], "mean"))
-                std_values.append(self._data[i].values_each_test(obj_type, obj[0], obj[1], "std"))
-                labels.append(str(i) + " Threads")
-            
-            if self.ui.chkStdValues.isChecked():
-                self.ui.MultiThreadChart.draw(mean_values, std_values, labels, yscale=str(self.ui.cmbScale.currentText()))
+
+            # the extraction runs in the background, so pass the containers
+            # instead of the dictionary which may change meanwhile
+            containers = [(i, self._data[i]) for i in idx]
+            key = (tuple(idx), obj_type, obj[0], obj[1])
+
+            self._tasks.submit("multithread", self._multithread_values, functools.partial(self._draw_multithread, key=key),
+                               containers, dict(self._data), obj_type, obj[0], obj[1])
+
+    def _multithread_values(self, containers, data, obj_type, name, func):
+        """
+        Extract the values of the multi thread and the speedup chart. Executed in a background thread.
+
+        The scaling models are fitted to all measurements of the paradigms of the
+        selected containers, see Scaling.fit_scaling().
+
+        Arguments:
+            * containers -- list of (key, DataContainer) pairs to compare
+            * data -- dictionary of all DataContainers by key
+            * obj_type -- Network(net), Projection(proj) or Population(pop)
+            * name -- name of the object
+            * func -- name of the function
+        """
+        mean_values = []
+        std_values = []
+        labels = []
+
+        for i, container in containers:
+            mean_values.append(container.values_each_test(obj_type, name, func, "mean"))
+            std_values.append(container.values_each_test(obj_type, name, func, "std"))
+            labels.append(container.label())
+
+        ### Speedup-Graph ###
+
+        prefixes = set(container.paradigm() + container.rank() for _, container in containers)
+        fits = fit_scaling(dict((k, v) for k, v in data.items() if v.paradigm() + v.rank() in prefixes),
+                           [(obj_type, name, func)])
+
+        measured = []
+        models = []
+        for prefix in sorted(fits):
+            selected = [container for _, container in containers if container.paradigm() + container.rank() == prefix]
+            baseline = thread_baseline(data, selected[0])
+            mean_one_thread = baseline.values_each_test(obj_type, name, func, "mean")
+
+            threads = []
+            speedups = []
+            std = []
+            for i, container in containers:
+                if container.paradigm() + container.rank() != prefix:
+                    continue
+                speedup = mean_one_thread / container.values_each_test(obj_type, name, func, "mean")
+                threads.append(container.num_threads())
+                speedups.append(nanmean(speedup))
+                std.append(nanstd(speedup))
+            if len(threads) != 0:
+                measured.append((prefix + " measured", threads, speedups, std))
+
+            _, fit_threads, fit = fits[prefix]
+            if isnan(fit.serial[0]):
+                continue
+
+            peak = fit.recommended_threads(0)
+            max_threads = fit_threads[-1] * 2
+            if peak is not None:
+                max_threads = min(max(max_threads, 1.25 * peak), 4 * fit_threads[-1])
+            x = linspace(1, max_threads, 200)
+
+            models.append((prefix + " Amdahl (serial %.1f %%)" % (100 * fit.serial[0]),
+                           x, fit.predict("amdahl", x)[0], None))
+            models.append((prefix + " Gustafson (serial %.1f %%)" % (100 * fit.gustafson_serial[0]),
+                           x, fit.predict("gustafson", x)[0], None))
+            label = prefix + " USL (\u03c3 %.3f, \u03ba %.4f" % (fit.sigma[0], fit.kappa[0])
+            if peak is not None and peak <= max_threads:
+                label += ", peak at %d threads" % peak
             else:
-                self.ui.MultiThreadChart.draw(mean_values, labels=labels, yscale=str(self.ui.cmbScale.currentText()))
-            
-            ### Speedup-Graph ###
-            
-            mean_values = []
-            mean_value = []
-            labels = []
-            
-            for i in idx:
-                paradigm, thread_count = i.split('-')
-                paradigm_key = paradigm + '-1'
-    
-                if thread_count != '1' and paradigm_key in self._data:
-                    mean_one_thread = self._data[paradigm_key].values_each_test(obj_type, obj[0], obj[1], "mean")
-                    mean_value = self._data[i].values_each_test(obj_type, obj[0], obj[1], "mean")
-                    for n in range(len(mean_value)):
-                        mean_value[n] = mean_one_thread[n] / mean_value[n]
-                        
-                    mean_values.append(mean_value)
-                    labels.append(str(i) + " Threads")
-            
-            if len(mean_values) != 0:  
-                self.ui.SpeedupChart.draw(values=mean_values, labels=labels, ylabel="1 Thread / x Threads", yscale=str(self.ui.cmbScale.currentText()))
+                peak = None
+            models.append((label + ")", x, fit.predict("usl", x)[0], peak))
+
+        return mean_values, std_values, labels, measured, models
+
+    def _draw_multithread(self, values, key=None):
+        """
+        Draw the multi thread and the speedup chart with the result of _multithread_values().
+
+        Arguments:
+            * values -- result of _multithread_values()
+            * key -- identifies the selection for the render cache of the charts -- default = None
+        """
+        self._multithread_shown = functools.partial(self._draw_multithread, values, key)
+        mean_values, std_values, labels, measured, models = values
+        scale = str(self.ui.cmbScale.currentText())
+        std_state = self.ui.chkStdValues.isChecked()
+
+        if std_state:
+            self.ui.MultiThreadChart.draw(mean_values, std_values, labels, yscale=scale,
+                                          key=key and key + (std_state, scale))
+        else:
+            self.ui.MultiThreadChart.draw(mean_values, labels=labels, yscale=scale,
+                                          key=key and key + (std_state, scale))
+
+        if len(measured) != 0:
+            self.ui.SpeedupChart.draw(measured, models, yscale=scale, key=key and key + (scale,))
             
     def update_function_select(self):
         """
@@ -343,7 +715,7 @@ class ProfilerWindow(QMainWindow):
         
         l = []
         for key in self._data:
-            item = QTreeWidgetItem([str(key) + " Threads"])
+            item = QTreeWidgetItem([self._data[key].label()])
             item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsUserCheckable)
             item.setCheckState(0, Qt.Unchecked) 
             l.append(item)
@@ -351,25 +723,79 @@ class ProfilerWindow(QMainWindow):
         self.ui.ThreadSelectTree.clear()
         self.ui.ThreadSelectTree.addTopLevelItems(l)
 
+    # ==============================================================================
+    # actions for the IcicleTab
+    # ==============================================================================
+
+    def update_icicle_select(self):
+        """
+        Fill IcicleSelectTree with the measurements, the checked ones stay checked.
+        """
+        checked = self._icicle_keys()
+        self.ui.IcicleSelectTree.blockSignals(True)
+
+        l = []
+        for key in self._data:
+            item = QTreeWidgetItem([self._data[key].label()])
+            item.setData(0, Qt.UserRole, key)
+            item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsUserCheckable)
+            item.setCheckState(0, Qt.Checked if key in checked else Qt.Unchecked)
+            l.append(item)
+
+        self.ui.IcicleSelectTree.clear()
+        self.ui.IcicleSelectTree.addTopLevelItems(l)
+        self.ui.IcicleSelectTree.blockSignals(False)
+        self.change_icicle_selection()
+
+    def _icicle_keys(self):
+        """
+        Return the keys of the measurements checked in IcicleSelectTree.
+        """
+        root = self.ui.IcicleSelectTree.invisibleRootItem()
+        return [root.child(i).data(0, Qt.UserRole) for i in range(root.childCount())
+                if root.child(i).checkState(0) == Qt.Checked]
+
+    def change_icicle_selection(self):
+        """
+        Draw the step breakdown of the checked measurements below each other.
+
+        Signals:
+            * itemChanged() emitted from IcicleSelectTree
+        """
+        keys = [key for key in self._icicle_keys() if key in self._data]
+        if len(keys) == 0:
+            self.ui.IcicleChart.clear()
+            return
+
+        self.ui.IcicleChart.draw([(key, self._breakdown(self._data[key])) for key in keys])
+
     #==============================================================================
-    # actions for the TreeWidget of BarChart
+    # actions for the BarChart in the proportion tab
     #==============================================================================
     
-    @pyqtSlot(QTreeWidgetItem,QTreeWidgetItem)
-    def change_barchart_tree(self, current, previous=0):
+    def change_barchart_selection(self):
         """
-        If selection changed then filter data and draw chart.
+        Draw the parts of the network step of the measurements checked in ThreadSelectTree
+        (all if none is checked) as stacked bars, ordered by paradigm and threads.
         
         Signals:
-            * currentItemChanged(QTreeWidgetItem,QTreeWidgetItem) emitted from ErrorbarChartTree
+            * itemChanged() emitted from ThreadSelectTree
+            * stateChanged(int) emitted from chkBarPercentage
         """
-        pass
+        root = self.ui.ThreadSelectTree.invisibleRootItem()
+        keys = [str(self.ui.cmbThread.itemData(i)) for i in range(root.childCount())
+                if root.child(i).checkState(0) == Qt.Checked]
+        containers = [self._data[key] for key in keys if key in self._data] or list(self._data.values())
+        if len(containers) == 0:
+            self.ui.BarChart.clear()
+            return
 
-    def update_barchart_tree(self):
-        """
-        Fill TreeWidget with data from container.
-        """
-        pass
+        containers.sort(key=lambda data: (data.paradigm(), data.rank(), data.num_threads()))
+        parts, values = stack_parts([self._breakdown(data) for data in containers])
+        percentage = self.ui.chkBarPercentage.isChecked()
+        labels = [data.key() for data in containers]
+        self.ui.BarChart.draw(values, parts, labels, "Parts of the network step", percentage=percentage,
+                              key=(tuple(labels), percentage))
     
     #==============================================================================
     # actions for the TreeWidget of ErrorbarChart
@@ -394,17 +820,52 @@ class ProfilerWindow(QMainWindow):
                 elif parentIdx == 2: obj_type = "proj"
                 
                 obj = str(current.text(0)).split(" - ")
-                mean_values = [self.current_data().values_each_test(obj_type, obj[0], obj[1], "mean")]
-                std_values = [self.current_data().values_each_test(obj_type, obj[0], obj[1], "std")]
-            
-                if self.ui.chkStdValues.isChecked():
-                    self.ui.ErrorbarChart.draw(mean_values, std_values, yscale=str(self.ui.cmbScale.currentText()))
-                else:
-                    self.ui.ErrorbarChart.draw(mean_values, yscale=str(self.ui.cmbScale.currentText()))
+                mode = str(self.ui.cmbErrorMode.itemData(self.ui.cmbErrorMode.currentIndex()))
+                key = (self.current_data().key(), obj_type, obj[0], obj[1], mode)
+                self._tasks.submit("errorbar", self._errorbar_values, functools.partial(self._draw_errorbar, key=key),
+                                   self.current_data(), obj_type, obj[0], obj[1], mode)
             
                 self.ui.cmbRawData.clear()
                 for i in range(self.current_data().num_tests()):
                     self.ui.cmbRawData.addItem("Test " + str(i), i)
+
+    def _errorbar_values(self, data, obj_type, name, func, mode="std"):
+        """
+        Extract the values and errors of the errorbar chart. Executed in a background thread.
+
+        Arguments:
+            * data (DataContainer) -- selected measurement
+            * obj_type -- Network(net), Projection(proj) or Population(pop)
+            * name -- name of the object
+            * func -- name of the function
+            * mode -- one of ERRORBAR_MODES -- default = "std"
+        """
+        if mode == "std":
+            return ([data.values_each_test(obj_type, name, func, "mean")],
+                    [data.values_each_test(obj_type, name, func, "std")])
+
+        # same seed, so the intervals do not change when the chart is redrawn
+        raw = data.values_each_test(obj_type, name, func, "raw")
+        estimate, lower, upper = bootstrap(raw, mode, RESAMPLES, seed=0)
+        return [estimate], [array([estimate - lower, upper - estimate])]
+
+    def _draw_errorbar(self, values, key=None):
+        """
+        Draw the errorbar chart from (mean_values, std_values).
+
+        Arguments:
+            * values -- (mean_values, std_values)
+            * key -- identifies the function for the render cache of the chart -- default = None
+        """
+        self._errorbar_shown = functools.partial(self._draw_errorbar, values, key)
+        mean_values, std_values = values
+        scale = str(self.ui.cmbScale.currentText())
+        std_state = self.ui.chkStdValues.isChecked()
+
+        if std_state:
+            self.ui.ErrorbarChart.draw(mean_values, std_values, yscale=scale, key=key and key + (std_state, scale))
+        else:
+            self.ui.ErrorbarChart.draw(mean_values, yscale=scale, key=key and key + (std_state, scale))
             
     def update_errorbarchart_tree(self):
         """
@@ -456,10 +917,25 @@ class ProfilerWindow(QMainWindow):
                 elif parentIdx == 2: obj_type = "proj"
                 
                 obj = str(self.ui.ErrorbarChartTree.selectedItems()[0].text(0)).split(" - ")
-                test_nr = self.ui.cmbRawData.itemData(self.ui.cmbRawData.currentIndex()).toInt()[0]
-                raw_data = [self.current_data().values_each_test(obj_type, obj[0], obj[1], "raw")[test_nr]]
-            
-                self.ui.ErrorbarChart.draw(raw_data, yscale=str(self.ui.cmbScale.currentText()))
+                test_nr = int(self.ui.cmbRawData.itemData(self.ui.cmbRawData.currentIndex()))
+                data = self.current_data()
+                col = data.column(obj_type, obj[0], obj[1])
+
+                # reading the raw data may page it in from disk, so it runs in the background
+                self._tasks.submit("errorbar", self._raw_values, self._draw_raw_data, data, test_nr, col)
+
+    def _raw_values(self, data, test_nr, col):
+        """
+        Read the raw data of one test into memory. Executed in a background thread.
+        """
+        return [array(data.raw_values(test_nr, col))]
+
+    def _draw_raw_data(self, raw_data):
+        """
+        Draw the raw data of one test in the errorbar chart.
+        """
+        self._errorbar_shown = functools.partial(self._draw_raw_data, raw_data)
+        self.ui.ErrorbarChart.draw(raw_data, yscale=str(self.ui.cmbScale.currentText()))
             
     def click_recalc_errorbar(self):
         """
@@ -480,15 +956,585 @@ class ProfilerWindow(QMainWindow):
                 elif parentIdx == 1: obj_type = "pop"
                 elif parentIdx == 2: obj_type = "proj"
         
-                factor = float(self.ui.txtFactor.text())
+                try:
+                    factor = float(self.ui.txtFactor.text())
+                except ValueError:
+                    QMessageBox.warning(self, "Recalc mean values", "The factor must be a number.")
+                    return
+                method = str(self.ui.cmbFilter.itemData(self.ui.cmbFilter.currentIndex()))
                 
                 obj = str(self.ui.ErrorbarChartTree.selectedItems()[0].text(0)).split(" - ")
-                mean_values, std_values = self.current_data().recalc_mean_values(obj_type, obj[0], obj[1], factor)
+                self._tasks.submit("errorbar", self._recalc_values, self._draw_errorbar,
+                                   self.current_data(), obj_type, obj[0], obj[1], factor, method)
+
+    def click_compare(self):
+        """
+        Compare the raw data of the selected function in the current measurement with another
+        measurement: difference of the means with bootstrap confidence interval and
+        Mann-Whitney U test. The raw data of all tests is pooled.
+        
+        Signals:
+            * clicked() emitted from btnCompare
+        """
+        other = self.ui.cmbCompare.itemData(self.ui.cmbCompare.currentIndex())
+        if self.current_data() and self.ui.ErrorbarChartTree.selectedItems() and other in self._data:
+            
+            current = self.ui.ErrorbarChartTree.selectedItems()[0]
+            idx = self.ui.ErrorbarChartTree.invisibleRootItem().indexOfChild(current)
+            if idx == -1: # not top element?
+                parentIdx = self.ui.ErrorbarChartTree.invisibleRootItem().indexOfChild(current.parent())
+            
+                if parentIdx == 0: obj_type = "net"
+                elif parentIdx == 1: obj_type = "pop"
+                elif parentIdx == 2: obj_type = "proj"
+
+                obj = str(current.text(0)).split(" - ")
+                self.ui.lblCompareResult.setText("Computing ...")
+                self._tasks.submit("compare", self._compare_values, self._show_comparison,
+                                   self.current_data(), self._data[other], obj_type, obj[0], obj[1])
+
+    def _compare_values(self, data, other, obj_type, name, func):
+        """
+        Compare the raw data of a function in two measurements. Executed in a background thread.
+        Returns None if the function was not measured in one of them.
+        """
+        try:
+            x = concatenate(data.values_each_test(obj_type, name, func, "raw"))
+            y = concatenate(other.values_each_test(obj_type, name, func, "raw"))
+        except (KeyError, ValueError):
+            return None
+
+        result = compare_samples(x, y, RESAMPLES, seed=0)
+        result["keys"] = (data.key(), other.key())
+        return result
+
+    def _show_comparison(self, result):
+        """
+        Show the result of _compare_values().
+        """
+        if result is None:
+            self.ui.lblCompareResult.setText("The function was not measured in both measurements.")
+            return
+
+        verdict = "significant" if result["p"] < 0.05 else "not significant"
+        if result["p"] < 0.05:
+            verdict += ", " + result["keys"][1] + (" slower" if result["difference"] > 0 else " faster")
+
+        self.ui.lblCompareResult.setText(
+            "%s: mean %.4f ms, median %.4f ms\n%s: mean %.4f ms, median %.4f ms\n"
+            "difference %+.4f ms (%+.1f %%)\n95 %% CI [%+.4f, %+.4f] ms\n"
+            "Mann-Whitney p = %.3g (%s)" %
+            (result["keys"][0], result["mean_x"], result["median_x"], result["keys"][1], result["mean_y"],
+             result["median_y"], result["difference"], 100 * result["relative"], result["lower"], result["upper"],
+             result["p"], verdict))
+
+    def _recalc_values(self, data, obj_type, name, func, factor, method):
+        """
+        Recalculate mean and std values without outliers. Executed in a background thread.
+        """
+        mean_values, std_values = data.recalc_mean_values(obj_type, name, func, factor, method)
+        return [mean_values], [std_values]
 
-                if self.ui.chkStdValues.isChecked():
-                    self.ui.ErrorbarChart.draw([mean_values], [std_values], yscale=str(self.ui.cmbScale.currentText()))
-                else:
-                    self.ui.ErrorbarChart.draw(mean_values, yscale=str(self.ui.cmbScale.currentText()))
+    # ==============================================================================
+    # actions for the TimelineTab
+    # ==============================================================================
+
+    def update_timeline_tree(self):
+        """
+        Fill TimelineTree with the functions of the current measurement.
+        """
+        self._pyramids = {}
+        data = self.current_data()
+
+        items = []
+        for obj_type, title in (("net", "Network"), ("pop", "Population"), ("proj", "Projection")):
+            item = QTreeWidgetItem([title])
+            item.setFlags(item.flags() & ~Qt.ItemIsSelectable)
+            for series in data.series():
+                if series[0] == obj_type:
+                    child = QTreeWidgetItem([series[1] + " - " + series[2]])
+                    child.setData(0, Qt.UserRole, series)
+                    item.addChild(child)
+            items.append(item)
+
+        self.ui.TimelineTree.clear()
+        self.ui.TimelineTree.addTopLevelItems(items)
+        self.ui.TimelineTree.expandAll()
+
+    def change_timeline_selection(self):
+        """
+        Draw the raw data of the selected functions over the steps of all tests.
+
+        Signals:
+            * itemSelectionChanged() emitted from TimelineTree
+        """
+        data = self.current_data()
+        selected = [tuple(item.data(0, Qt.UserRole)) for item in self.ui.TimelineTree.selectedItems()
+                    if item.data(0, Qt.UserRole) is not None]
+        if not data or len(selected) == 0:
+            return
+
+        # the pyramids of long traces take a moment, they are computed in the background
+        self._tasks.submit("timeline", self._timeline_values, self._draw_timeline, data, selected, dict(self._pyramids))
+
+    def _timeline_values(self, data, selected, pyramids):
+        """
+        Return the MinMaxPyramid of each selected function and the first step of each test.
+        Pyramids which were computed before are taken from pyramids.
+        """
+        traces = []
+        for series in selected:
+            if not series in pyramids:
+                pyramids[series] = MinMaxPyramid(trace(data, *series))
+            traces.append((series, pyramids[series]))
+        return traces, test_starts(data, *selected[0])
+
+    def _draw_timeline(self, values):
+        """
+        Draw the result of _timeline_values() in the TimelineChart.
+        """
+        traces, boundaries = values
+        self._pyramids.update(traces)
+        self.ui.TimelineChart.draw([(" - ".join(series), pyramid) for series, pyramid in traces], boundaries,
+                                   yscale=str(self.ui.cmbScale.currentText()))
+
+    # ==============================================================================
+    # actions for the PhasesTab
+    # ==============================================================================
+
+    def update_phases(self):
+        """
+        Detect the warm-up of all functions of the current measurement, always in the
+        measured data even if only the steady state is shown.
+        """
+        data = self._measured.get(self.ui.cmbThread.itemData(self.ui.cmbThread.currentIndex()))
+        if data is None:
+            return
+
+        self.ui.lblPhasesResult.setText("Computing ...")
+        self._tasks.submit("phases", phase_statistics, self._draw_phases, data)
+
+    def _draw_phases(self, rows):
+        """
+        Show the result of Statistics.phase_statistics() in the phases table.
+        """
+        self._fill_table(self.ui.PhasesTable, PHASE_COLUMNS, rows)
+        self.ui.PhasesTable.sortByColumn(PHASE_COLUMNS.index("inflation (%)"), Qt.DescendingOrder)
+
+        warm = [row for row in rows if row[3] > 0]
+        self.ui.lblPhasesResult.setText("%d of %d functions have a warm-up" % (len(warm), len(rows)))
+
+    # ==============================================================================
+    # actions for the RegressionTab
+    # ==============================================================================
+
+    def click_regression(self):
+        """
+        Compare all functions of the baseline and the candidate measurement.
+
+        Signals:
+            * clicked() emitted from btnRegression
+        """
+        measurements = dict(self._data)
+        for fname, data in self._regression_files.items():
+            measurements[fname] = data.steady_state() if self.ui.chkSteadyState.isChecked() else data
+
+        baseline = self.ui.cmbBaseline.itemData(self.ui.cmbBaseline.currentIndex())
+        candidate = self.ui.cmbCandidate.itemData(self.ui.cmbCandidate.currentIndex())
+        if not baseline in measurements or not candidate in measurements:
+            return
+
+        try:
+            threshold = float(self.ui.txtThreshold.text()) / 100.0
+        except ValueError:
+            QMessageBox.warning(self, "Regression", "The threshold must be a number.")
+            return
+
+        self.ui.lblRegressionResult.setText("Computing ...")
+        self._tasks.submit("regression", compare_containers, self._draw_regression,
+                           measurements[baseline], measurements[candidate], threshold)
+
+    def click_regression_file(self):
+        """
+        Open a profiling file for the comparison. It is not added to the other views,
+        so it may have the same paradigm and number of threads as a loaded measurement.
+
+        Signals:
+            * clicked() emitted from btnRegressionFile
+        """
+        fname, _ = QFileDialog.getOpenFileName(self, 'Open data file', '.', '*.xml')
+        if fname:
+            self._tasks.submit("regression_file", ParallelLoader(self._cache).load, self._loaded_regression_file, [fname])
+
+    def _loaded_regression_file(self, results):
+        """
+        Add a DataContainer loaded by click_regression_file() to the comparison.
+
+        Arguments:
+            * results -- list with one (fname, DataContainer) pair, see ParallelLoader.load()
+        """
+        fname, data = results[0]
+        if data is None:
+            error = QErrorMessage(self)
+            error.showMessage("Problem while importing data.")
+            return
+
+        self._regression_files[fname] = data
+        self.update_cmb_thread()
+        self.ui.cmbCandidate.setCurrentIndex(self.ui.cmbCandidate.findData(fname))
+
+    def _draw_regression(self, rows):
+        """
+        Show the result of Regression.compare_containers() in the regression table.
+        """
+        colors = {REGRESSION: "#ffc8c8", IMPROVEMENT: "#c8f0c8"}
+        self._fill_table(self.ui.RegressionTable, REGRESSION_COLUMNS, rows, colors)
+        self.ui.RegressionTable.sortByColumn(REGRESSION_COLUMNS.index("change (%)"), Qt.DescendingOrder)
+
+        statuses = [row[-1] for row in rows]
+        self.ui.lblRegressionResult.setText("%d regressions, %d improvements, %d unchanged, %d added, %d removed functions" %
+                                            tuple(statuses.count(s) for s in (REGRESSION, IMPROVEMENT, UNCHANGED, ADDED, REMOVED)))
+
+    # ==============================================================================
+    # actions for the RanksTab
+    # ==============================================================================
+
+    def update_rank_runs(self):
+        """
+        Fill cmbRankRun with the MPI runs, i.e. the measurements with the same paradigm and
+        number of threads but different ranks. The current selection is kept.
+        """
+        current = self.ui.cmbRankRun.itemData(self.ui.cmbRankRun.currentIndex())
+        groups = group_ranks(self._data)
+
+        self.ui.cmbRankRun.blockSignals(True)
+        self.ui.cmbRankRun.clear()
+        for name in sorted(groups):
+            self.ui.cmbRankRun.addItem(groups[name][0].label(rank=False) + " - " + str(len(groups[name])) + " ranks", name)
+        self.ui.cmbRankRun.blockSignals(False)
+
+        index = self.ui.cmbRankRun.findData(current) if current is not None else -1
+        self.ui.cmbRankRun.setCurrentIndex(max(index, 0))
+        self.change_rank_run()
+
+    def change_rank_run(self):
+        """
+        Compute the load imbalance and the critical path of the selected MPI run.
+
+        Signals:
+            * currentIndexChanged(int) emitted from cmbRankRun
+        """
+        name = self.ui.cmbRankRun.itemData(self.ui.cmbRankRun.currentIndex())
+        containers = group_ranks(self._data).get(name)
+        if containers is None:
+            return
+
+        self.ui.lblRanksResult.setText("Computing ...")
+        self._tasks.submit("ranks", self._rank_values, self._draw_ranks, containers)
+
+    def _rank_values(self, containers):
+        """
+        Return the rows of Ranks.rank_statistics() and Ranks.critical_path_summary().
+        """
+        return rank_statistics(containers), critical_path_summary(containers)
+
+    def _draw_ranks(self, values):
+        """
+        Show the result of _rank_values() in the tables of the RanksTab.
+        """
+        rows, critical = values
+        self._fill_table(self.ui.RanksTable, RANK_COLUMNS, rows)
+        self.ui.RanksTable.sortByColumn(RANK_COLUMNS.index("waiting (ms)"), Qt.DescendingOrder)
+        self._fill_table(self.ui.CriticalPathTable, CRITICAL_PATH_COLUMNS, critical)
+        self.ui.CriticalPathTable.sortByColumn(CRITICAL_PATH_COLUMNS.index("critical steps"), Qt.DescendingOrder)
+
+        step = [row for row in rows if tuple(row[:3]) == ("net", "network", "step")]
+        if len(step) != 0:
+            self.ui.lblRanksResult.setText("Load imbalance of the network step: %.2f, slowest rank: %s" % (step[0][7], step[0][9]))
+        else:
+            self.ui.lblRanksResult.setText("")
+
+    # ==============================================================================
+    # actions for the GpuTab
+    # ==============================================================================
+
+    def update_gpu_baseline(self):
+        """
+        Fill cmbGpuBaseline with the measurements which did not run on a GPU. The current
+        selection is kept, else the OpenMP measurement with most threads is chosen.
+        """
+        current = self.ui.cmbGpuBaseline.itemData(self.ui.cmbGpuBaseline.currentIndex())
+        candidates = sorted([data for data in self._data.values() if not data.is_gpu()],
+                            key=lambda data: (data.paradigm() != "openmp", -data.num_threads(), data.key()))
+
+        self.ui.cmbGpuBaseline.blockSignals(True)
+        self.ui.cmbGpuBaseline.clear()
+        for data in candidates:
+            self.ui.cmbGpuBaseline.addItem(data.label(), data.key())
+        self.ui.cmbGpuBaseline.blockSignals(False)
+
+        index = self.ui.cmbGpuBaseline.findData(current) if current is not None else -1
+        self.ui.cmbGpuBaseline.setCurrentIndex(max(index, 0))
+        self.change_gpu_baseline()
+
+    def change_gpu_baseline(self):
+        """
+        Compare all GPU measurements with the selected baseline.
+
+        Signals:
+            * currentIndexChanged(int) emitted from cmbGpuBaseline
+        """
+        baseline = self._data.get(self.ui.cmbGpuBaseline.itemData(self.ui.cmbGpuBaseline.currentIndex()))
+        if baseline is None or not any(data.is_gpu() for data in self._data.values()):
+            self._fill_table(self.ui.GpuTable, CROSS_SPEEDUP_COLUMNS, [])
+            self.ui.lblGpuResult.setText("Load a GPU and a CPU measurement to compare them.")
+            return
+
+        self.ui.lblGpuResult.setText("Computing ...")
+        self._tasks.submit("gpu", cross_speedups, self._draw_gpu, dict(self._data), baseline)
+
+    def _draw_gpu(self, rows):
+        """
+        Show the result of Scaling.cross_speedups() in the GPU table.
+        """
+        self._fill_table(self.ui.GpuTable, CROSS_SPEEDUP_COLUMNS, rows)
+
+        step = ["%s %.2fx" % (row[0], row[-1]) for row in rows if tuple(row[2:5]) == ("net", "network", "step")]
+        self.ui.lblGpuResult.setText("Speedup of the network step: " + ", ".join(step) if len(step) != 0 else "")
+
+    # ==============================================================================
+    # actions for the ThroughputTab
+    # ==============================================================================
+
+    def click_sizes(self):
+        """
+        Read the sizes of populations and projections from a JSON file, see DataContainer.read_sizes().
+        They are added to all loaded measurements and the ones loaded later.
+
+        Signals:
+            * clicked() emitted from btnSizes
+        """
+        fname, _ = QFileDialog.getOpenFileName(self, 'Open sizes file', '.', '*.json')
+        if not fname:
+            return
+
+        try:
+            sizes = read_sizes(fname)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Throughput", "Problem while reading the sizes: " + str(e))
+            return
+
+        self._sizes.update(sizes)
+        for data in list(self._measured.values()) + list(self._data.values()):
+            data.set_sizes(sizes)
+        self.update_throughput()
+
+    def update_throughput(self):
+        """
+        Compute the throughput of all measurements and compare it to the roofline of the
+        machine, if its peak bandwidth and GFLOP/s are entered.
+
+        Signals:
+            * clicked() emitted from btnThroughput
+        """
+        roofline = None
+        if self.ui.txtBandwidth.text().strip() or self.ui.txtGflops.text().strip():
+            try:
+                roofline = Roofline(float(self.ui.txtBandwidth.text()), float(self.ui.txtGflops.text()))
+            except ValueError:
+                QMessageBox.warning(self, "Throughput", "The peak bandwidth and GFLOP/s must be positive numbers.")
+                return
+
+        self.ui.lblThroughputResult.setText("Computing ...")
+        self._tasks.submit("throughput", self._throughput_values, self._draw_throughput, dict(self._data), roofline)
+
+    def _throughput_values(self, data, roofline):
+        """
+        Return the rows of Throughput.throughput_table(), the points of the roofline chart and the roofline.
+        """
+        return throughput_table(data, roofline=roofline), roofline_points(data), roofline
+
+    def _draw_throughput(self, values):
+        """
+        Show the result of _throughput_values() in the table and the chart of the ThroughputTab.
+        """
+        rows, points, roofline = values
+        self._fill_table(self.ui.ThroughputTable, THROUGHPUT_COLUMNS, rows)
+        self.ui.RooflineChart.draw(points, roofline)
+
+        if len(rows) == 0:
+            self.ui.lblThroughputResult.setText("No population or projection with a known size, load the sizes.")
+        elif roofline is not None:
+            memory = len([row for row in rows if row[-1] == "memory"])
+            self.ui.lblThroughputResult.setText("Ridge point %.2f FLOP/byte, %d of %d functions are memory bound" %
+                                                (roofline.ridge(), memory, len(rows)))
+        else:
+            self.ui.lblThroughputResult.setText("%d functions with a known size" % len(rows))
+
+    # ==============================================================================
+    # actions for the HistoryTab
+    # ==============================================================================
+
+    def change_analyzer_tab(self, index):
+        """
+        Read the functions of the history when the HistoryTab is shown the first time.
+
+        Signals:
+            * currentChanged(int) emitted from AnalyzerWidget
+        """
+        if self.ui.AnalyzerWidget.widget(index) is self.ui.HistoryTab and not self._history_loaded:
+            self._history_loaded = True
+            self._tasks.submit("history", self._history_functions, self._fill_history_functions)
+
+    def click_history_ingest(self):
+        """
+        Add profiling files with the entered commit and host to the history.
+
+        Signals:
+            * clicked() emitted from btnHistoryIngest
+        """
+        fnames, _ = QFileDialog.getOpenFileNames(self, 'Add data files to the history', '.', '*.xml')
+        if len(fnames) == 0:
+            return
+
+        progress = QProgressDialog("Adding files to the history ...", "Cancel", 0, len(fnames), self)
+        progress.setMinimumDuration(500)
+        progress.canceled.connect(lambda: self._tasks.cancel("history_ingest"))
+
+        commit = str(self.ui.txtHistoryCommit.text()) or None
+        host = str(self.ui.txtHistoryHost.text()) or None
+        self._tasks.submit("history_ingest", self._history_ingest, functools.partial(self._ingested_history, progress=progress),
+                           fnames, commit, host, progress=progress.setValue, cancellable=True,
+                           error=functools.partial(self._task_failed, progress=progress))
+
+    def _history_ingest(self, fnames, commit, host, progress=None, cancelled=None):
+        """
+        Add the files to the history, returns the number of new runs and the functions.
+        Runs in the background, so it opens its own connection. Nothing is added if cancelled.
+        """
+        history = History()
+        try:
+            added = history.ingest(fnames, commit, host, cache=self._cache, progress=progress, cancelled=cancelled)
+            return added, history.functions()
+        finally:
+            history.close()
+
+    def _ingested_history(self, result, progress=None):
+        """
+        Show the result of _history_ingest().
+
+        Arguments:
+            * result -- number of new runs and the functions
+            * progress (QProgressDialog) -- the dialog of the request -- default = None
+        """
+        if progress is not None:
+            progress.close()
+        added, functions = result
+        self.ui.lblHistoryResult.setText("%d new runs added to the history" % added)
+        self._fill_history_functions(functions)
+
+    def _history_functions(self):
+        """
+        Return the functions of the history, runs in the background.
+        """
+        history = History()
+        try:
+            return history.functions()
+        finally:
+            history.close()
+
+    def _fill_history_functions(self, functions):
+        """
+        Fill cmbHistoryFunction with the (obj_type, name, func) of the history, the
+        current selection is kept.
+        """
+        current = self.ui.cmbHistoryFunction.itemData(self.ui.cmbHistoryFunction.currentIndex())
+
+        self.ui.cmbHistoryFunction.blockSignals(True)
+        self.ui.cmbHistoryFunction.clear()
+        for function in functions:
+            self.ui.cmbHistoryFunction.addItem(" ".join(function), function)
+        self.ui.cmbHistoryFunction.blockSignals(False)
+
+        index = self.ui.cmbHistoryFunction.findData(current) if current is not None else -1
+        self.ui.cmbHistoryFunction.setCurrentIndex(max(index, 0))
+        self.change_history_function()
+
+    def change_history_function(self):
+        """
+        Read the configurations (paradigm, threads) measured for the selected function.
+
+        Signals:
+            * currentIndexChanged(int) emitted from cmbHistoryFunction
+        """
+        function = self.ui.cmbHistoryFunction.itemData(self.ui.cmbHistoryFunction.currentIndex())
+        if function is not None:
+            self._tasks.submit("history", self._history_configurations, self._fill_history_configurations, function)
+
+    def _history_configurations(self, function):
+        """
+        Return the configurations of a function in the history, runs in the background.
+        """
+        history = History()
+        try:
+            return history.configurations(*function)
+        finally:
+            history.close()
+
+    def _fill_history_configurations(self, configurations):
+        """
+        Fill cmbHistoryConfig with the (paradigm, threads, rank, device) tuples, the current selection is kept.
+        """
+        current = self.ui.cmbHistoryConfig.itemData(self.ui.cmbHistoryConfig.currentIndex())
+
+        self.ui.cmbHistoryConfig.blockSignals(True)
+        self.ui.cmbHistoryConfig.clear()
+        for config in configurations:
+            self.ui.cmbHistoryConfig.addItem(self._history_label(config), config)
+        self.ui.cmbHistoryConfig.blockSignals(False)
+
+        index = self.ui.cmbHistoryConfig.findData(current) if current is not None else -1
+        self.ui.cmbHistoryConfig.setCurrentIndex(max(index, 0))
+        self.change_history_config()
+
+    def _history_label(self, config):
+        """
+        Return a readable name of a configuration of History.configurations(), e.g. "openmp0 - 4 threads".
+        """
+        paradigm, num_threads, rank, device = config
+        return str(paradigm) + str(rank or '') + " - " + (device + " - " if device else '') + str(num_threads) + " threads"
+
+    def change_history_config(self):
+        """
+        Draw the history of the selected function and configuration.
+
+        Signals:
+            * currentIndexChanged(int) emitted from cmbHistoryConfig
+        """
+        function = self.ui.cmbHistoryFunction.itemData(self.ui.cmbHistoryFunction.currentIndex())
+        config = self.ui.cmbHistoryConfig.itemData(self.ui.cmbHistoryConfig.currentIndex())
+        if function is not None and config is not None:
+            self._tasks.submit("history", self._history_series, self._draw_history, function, config)
+
+    def _history_series(self, function, config):
+        """
+        Return the function, configuration and measurements of History.series(), runs in the background.
+        """
+        history = History()
+        try:
+            paradigm, num_threads, rank, device = config
+            return function, config, history.series(*function, paradigm=paradigm, num_threads=num_threads,
+                                                    rank=rank, device=device)
+        finally:
+            history.close()
+
+    def _draw_history(self, result):
+        """
+        Draw the result of _history_series() in the HistoryChart.
+        """
+        function, config, values = result
+        title = " ".join(function) + " (" + self._history_label(config) + ")"
+        self.ui.HistoryChart.draw(values["date"], values["mean"], values["std"], values["commit"], title)
 
     # ==============================================================================
     # actions for the TreeWidget of PieChart
@@ -497,137 +1543,61 @@ class ProfilerWindow(QMainWindow):
     @pyqtSlot(QTreeWidgetItem,QTreeWidgetItem)
     def change_piechart_tree(self, current, previous):
         """
-        If selection changed then filter data and draw chart.  
+        If selection changed then draw the parts of the selected node of the step breakdown.
         
         Signals:
             * currentItemChanged(QTreeWidgetItem, QTreeWidgetItem) emitted from PieChartTree
         """
-        if current:
-            topIdx = self.ui.PieChartTree.invisibleRootItem().indexOfChild(current)
-            if topIdx != -1: # top element? (Network)
-                # TODO: what happens if multi-networks are measured ... ?
-                values = self.current_data().values_by_type(topIdx, "net")
-
-                #
-                # This assignment is for clarity of the following code ...
-                data_set = values[list(values.keys())[0]]
-
-                # net-step = overhead + net-proj_step + net-psp + net-neur_step + rng + record
-                # whereas some parts are optional ...
-                overhead = data_set["step"]["mean"] - ( data_set["psp"]["mean"] + data_set["neur_step"]["mean"])
-
-                #
-                # Add mandatory operations
-                data = [
-                    ["psp\n(" + "%.4f" % data_set["psp"]["mean"] + ")", "%.4f" % data_set["psp"]["mean"]],
-                    ["neur_step\n(" + "%.4f" % data_set["neur_step"]["mean"] + ")", "%.4f" % data_set["neur_step"]["mean"]],
-                ]
-
-                #
-                # Check optional parts
-                if "record" in data_set.keys():
-                    overhead -= data_set["record"]["mean"]
-                    data.append(["record\n(" + "%.4f" % data_set["record"]["mean"] + ")", "%.4f" % data_set["record"]["mean"]])
-
-                if "proj_step" in data_set.keys():
-                    overhead -= data_set["proj_step"]["mean"]
-                    data.append(["proj_step\n(" + "%.4f" % data_set["proj_step"]["mean"] + ")", "%.4f" % data_set["proj_step"]["mean"]])
-                
-                if "rng" in data_set.keys():
-                    overhead -= data_set["rng"]["mean"]
-                    data.append(["Draw from RNG\n(" + "%.4f" % data_set["rng"]["mean"] + ")", "%.4f" % data_set["rng"]["mean"]])
+        if current is None or current.data(0, Qt.UserRole) is None:
+            return
+
+        # TODO: what happens if multi-networks are measured ... ?
+        index, node = current.data(0, Qt.UserRole)
+        breakdown = self.current_breakdown()
+        mode = str(self.ui.cmbPieMode.itemData(self.ui.cmbPieMode.currentIndex()))
+        key = (self.current_data().key(), index, node, mode)
+
+        if mode == "sunburst":
+            self.ui.PieChart.draw_sunburst(breakdown, index, node, current.text(0) + " (in ms)", key=key)
+        elif node == 0:
+            # the network step, the parts are labeled with their values
+            data = []
+            for func, value in breakdown.parts(index, node):
+                data.append([PIE_LABELS.get(func, func) + "\n(" + "%.4f" % value + ")", "%.4f" % value])
+            self.ui.PieChart.draw(data, current.text(0) + " (in ms)", True, key=key)
+        else:
+            values = [[str(name), "%.4f" % value] for name, value in breakdown.parts(index, node)]
+            self.ui.PieChart.draw(values, current.text(0) + " (in ms)", False, key=key)
+
+    def change_pie_mode(self):
+        """
+        Draw the selected node of the step breakdown again if the kind of chart changed.
+
+        Signals:
+            * currentIndexChanged(int) emitted from cmbPieMode
+        """
+        self.change_piechart_tree(self.ui.PieChartTree.currentItem(), None)
 
-                # Add overhead as last, its the time span which is obviously not measured ...
-                data.append(["Overhead\n(" + "%.4f" % overhead + ")", "%.4f" % overhead])
-                self.ui.PieChart.draw(data, current.text(0) + " (in ms)", True)
-            else:
-                childIdx = current.parent().indexOfChild(current)
-                topIdx = self.ui.PieChartTree.invisibleRootItem().indexOfChild(current.parent())
-                if topIdx != -1: # First child of Network?
-                    try:
-                        if childIdx == 0:
-                            # Overhead = net_neur_step - sum(all pop_step)
-                            neur_step = self.current_data().values_by_function(topIdx, "net", "neur_step")
-                            neur_step = neur_step[list(neur_step.keys())[0]]
-                            func_data = self.current_data().values_by_function(topIdx, "pop", "step")
-        
-                            overhead = neur_step["mean"]
-                            values = []
-                            for key,value in func_data.items():
-        
-                                overhead -= value["mean"]
-                                values.append([str(key), "%.4f" % value["mean"]])
-                            
-                            values.append(["overhead", "%.4f" % overhead])
-                            
-                        if childIdx == 1:
-                            proj_step = self.current_data().values_by_function(topIdx, "net", "proj_step")
-                            proj_step = proj_step[list(proj_step.keys())[0]]
-                            func_data = self.current_data().values_by_function(topIdx, "proj", "step")
-        
-                            overhead = proj_step["mean"]
-                            values = []
-                            for key,value in func_data.items():
-        
-                                overhead -= value["mean"]
-                                values.append([str(key), "%.4f" % value["mean"]])
-                            
-                            values.append(["overhead", "%.4f" % overhead])
-                            
-                        if childIdx == 2:
-                            net_psp = self.current_data().values_by_function(topIdx, "net", "psp")
-                            net_psp = net_psp[list(net_psp.keys())[0]]
-                            func_data = self.current_data().values_by_function(topIdx, "proj", "psp")
-        
-                            overhead = net_psp["mean"]
-                            values = []
-                            for key,value in func_data.items():
-        
-                                overhead -= value["mean"]
-                                values.append([str(key), "%.4f" % value["mean"]])
-                            
-                            values.append(["overhead", "%.4f" % overhead])
-                        
-                        if childIdx == 3: # rng
-                            net_rng = self.current_data().values_by_function(topIdx, "net", "rng")
-                            net_rng = net_rng[list(net_rng.keys())[0]]
-                            func_data = self.current_data().values_by_function(topIdx, "pop", "rng")
-
-                            overhead = net_rng["mean"]
-                            values = []
-                            for key,value in func_data.items():
-        
-                                overhead -= value["mean"]
-                                values.append([str(key), "%.4f" % value["mean"]])
-                            
-                            values.append(["overhead", "%.4f" % overhead])
-
-                        self.ui.PieChart.draw(values, current.text(0) + " (in ms)", False)
-
-                    except IndexError:
-                        self.ui.PieChart.clear()
-            
     def update_piechart_tree(self):
         """
-        Fill TreeWidget with data from container.
+        Fill TreeWidget with the nodes of the step breakdown which have parts, one tree
+        per test. The items hold (test, node) as user data.
         """
-        top_lvl_obj = self.current_data().unique_function_names("net")
+        breakdown = self.current_breakdown()
 
         wdg = self.ui.PieChartTree
         l = []
-        for i in range(self.current_data().num_tests()):
-            item = QTreeWidgetItem(["Measurement " + str(i)])
-            item.addChild(QTreeWidgetItem(["pop - step"]))
-            item.addChild(QTreeWidgetItem(["proj - step"]))
-            item.addChild(QTreeWidgetItem(["proj - psp"]))
-            if "network - rng" in top_lvl_obj:
-                item.addChild(QTreeWidgetItem(["rng"]))
-            if "network - record" in top_lvl_obj:
-                #TODO: 
-                # item.addChild(QTreeWidgetItem(["record"]))
-                pass
-                
-            l.append(item)
+        for i in range(self.current_data().num_tests() if len(breakdown) != 0 else 0):
+            items = {0: QTreeWidgetItem(["Measurement " + str(i)])}
+            items[0].setData(0, Qt.UserRole, (i, 0))
+            for node in range(1, len(breakdown)):
+                parent = items.get(breakdown.parent[node])
+                if parent is None or len(breakdown.children(node)) == 0:
+                    continue
+                items[node] = QTreeWidgetItem([" - ".join(breakdown.path(node)[1:])])
+                items[node].setData(0, Qt.UserRole, (i, node))
+                parent.addChild(items[node])
+            l.append(items[0])
         
         wdg.clear()
         wdg.addTopLevelItems(l)
\ No newline at end of file
@@ -0,0 +1,206 @@
+# ==============================================================================
+#
+#     Ranks.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+"""
+Aggregation of the measurements of all ranks of one MPI run. Each rank writes
+its own profiling file, the files of one run have the same paradigm and number
+of threads but a different rank.
+
+The load imbalance of a function is max / mean of its mean time over the
+ranks: 1 is perfectly balanced, 2 means the slowest rank needs twice the
+average time and the other ranks wait for it. The rank with the longest
+network step is the critical path of that step.
+"""
+import warnings
+
+import numpy as np
+
+# columns of rank_statistics()
+RANK_COLUMNS = ["type", "name", "func", "ranks", "min (ms)", "mean (ms)", "max (ms)", "imbalance",
+                "waiting (ms)", "slowest rank"]
+
+# columns of critical_path_summary()
+CRITICAL_PATH_COLUMNS = ["rank", "critical steps", "critical steps (%)", "mean step (ms)", "max step (ms)"]
+
+# function whose raw data is the time of each simulation step
+STEP_FUNCTION = ("net", "network", "step")
+
+
+def group_ranks(data):
+    """
+    Group the measurements of MPI runs. Returns a dictionary by paradigm and
+    configuration (e.g. "openmp-4", see DataContainer.configuration()) of lists
+    of DataContainers sorted by rank; only groups with more than one rank are
+    returned.
+
+    Arguments:
+        * data -- dictionary of DataContainers by key
+    """
+    groups = {}
+    for container in data.values():
+        groups.setdefault(container.paradigm() + "-" + container.configuration(), []).append(container)
+
+    return dict((name, sorted(containers, key=_rank_order))
+                for name, containers in groups.items() if len(containers) > 1)
+
+
+def _rank_order(container):
+    """
+    Sort key of the ranks, numerical if possible.
+    """
+    try:
+        return (0, int(container.rank()), "")
+    except ValueError:
+        return (1, 0, container.rank())
+
+
+def rank_matrix(containers, series=None):
+    """
+    Return the series and the mean time over the tests of each function and
+    rank as (ranks x series) array. Series missing in a rank are NaN.
+
+    Arguments:
+        * containers -- list of DataContainers, one for each rank
+        * series -- list of (obj_type, name, func) -- default = union of the series of all ranks
+    """
+    if series is None:
+        seen = {}
+        for data in containers:
+            for s in data.series():
+                seen.setdefault(s, len(seen))
+        series = list(seen)
+
+    means = np.full((len(containers), len(series)), np.nan)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        for r, data in enumerate(containers):
+            cols = data.columns(series)
+            found = np.flatnonzero(cols >= 0)
+            means[r, found] = np.nanmean(data.mean_values(), axis=0)[cols[found]]
+
+    return series, means
+
+
+def rank_statistics(containers):
+    """
+    Return min, mean and max of the mean time over the ranks, the load imbalance
+    (max / mean), the time the other ranks wait on average (max - mean) and the
+    slowest rank of all functions. The rows (see RANK_COLUMNS) are sorted by the
+    waiting time, worst first.
+
+    Arguments:
+        * containers -- list of DataContainers, one for each rank
+    """
+    series, means = rank_matrix(containers)
+    measured = np.isfinite(means)
+    count = measured.sum(axis=0)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        minimum = np.nanmin(means, axis=0)
+        mean = np.nanmean(means, axis=0)
+        maximum = np.nanmax(means, axis=0)
+        imbalance = maximum / mean
+        waiting = maximum - mean
+    slowest = np.argmax(np.where(measured, means, -np.inf), axis=0)
+
+    rows = []
+    for col, (obj_type, name, func) in enumerate(series):
+        rows.append([obj_type, name, func, int(count[col]), float(minimum[col]), float(mean[col]),
+                     float(maximum[col]), float(imbalance[col]), float(waiting[col]),
+                     containers[slowest[col]].rank()])
+
+    rows.sort(key=lambda row: np.inf if np.isnan(row[8]) else -row[8])
+    return rows
+
+
+def step_times(data, function=STEP_FUNCTION):
+    """
+    Return the raw times of all simulation steps of one rank, the tests are
+    concatenated. Empty if the function was not measured.
+
+    Arguments:
+        * data (DataContainer) -- measurement of one rank
+        * function -- (obj_type, name, func) -- default = STEP_FUNCTION
+    """
+    try:
+        col = data.column(*function)
+    except KeyError:
+        return np.zeros(0)
+    return np.concatenate([data.raw_values(index, col) for index in range(data.num_tests())] + [np.zeros(0)])
+
+
+def critical_path(containers, function=STEP_FUNCTION):
+    """
+    Return the critical rank of each simulation step, i.e. the index into
+    containers of the rank with the longest step, and the time of that step.
+    The ranks are processed one after another and only the running maximum is
+    kept, so the raw data of many ranks is never in memory at the same time.
+    Steps which were not measured by all ranks are dropped.
+
+    Arguments:
+        * containers -- list of DataContainers, one for each rank
+        * function -- (obj_type, name, func) -- default = STEP_FUNCTION
+    """
+    longest = None
+    critical = None
+    for r, data in enumerate(containers):
+        times = step_times(data, function)
+        if longest is None:
+            longest = np.array(times, dtype=np.float64)
+            critical = np.zeros(len(times), dtype=np.int64)
+            continue
+
+        n = min(len(longest), len(times))
+        longest, critical = longest[:n], critical[:n]
+        slower = times[:n] > longest
+        longest[slower] = times[:n][slower]
+        critical[slower] = r
+
+    if longest is None:
+        return np.zeros(0, dtype=np.int64), np.zeros(0)
+    return critical, longest
+
+
+def critical_path_summary(containers, function=STEP_FUNCTION):
+    """
+    Return for each rank how often it was the critical path of a step and its
+    mean and max step time as rows (see CRITICAL_PATH_COLUMNS), the most
+    frequent critical rank first.
+
+    Arguments:
+        * containers -- list of DataContainers, one for each rank
+        * function -- (obj_type, name, func) -- default = STEP_FUNCTION
+    """
+    critical, _ = critical_path(containers, function)
+    counts = np.bincount(critical, minlength=len(containers))
+
+    rows = []
+    for r, data in enumerate(containers):
+        times = step_times(data, function)
+        rows.append([data.rank(), int(counts[r]), 100.0 * float(counts[r]) / max(len(critical), 1),
+                     float(times.mean()) if len(times) != 0 else np.nan,
+                     float(times.max()) if len(times) != 0 else np.nan])
+
+    rows.sort(key=lambda row: -row[1])
+    return rows
@@ -0,0 +1,116 @@
+# ==============================================================================
+#
+#     Regression.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+"""
+Comparison of a baseline and a candidate measurement, e.g. of two builds.
+The functions are lined up by (obj_type, name, func). A function is a
+regression if its mean time grew by more than the threshold and the
+Mann-Whitney test of the raw data is significant.
+"""
+import warnings
+
+import numpy as np
+
+from Statistics import mann_whitney
+
+# columns of compare_containers()
+REGRESSION_COLUMNS = ["type", "name", "func", "baseline (ms)", "candidate (ms)", "change (ms)", "change (%)",
+                      "p-value", "status"]
+
+# status of a function
+REGRESSION = "regression"
+IMPROVEMENT = "improvement"
+UNCHANGED = "unchanged"
+ADDED = "added"
+REMOVED = "removed"
+
+
+def _pooled_raw(data, col):
+    """
+    Return the raw data of one column of all tests as one array.
+    """
+    return np.concatenate([data.raw_values(index, col) for index in range(data.num_tests())] + [np.zeros(0)])
+
+
+def compare_containers(baseline, candidate, threshold=0.05, alpha=0.05):
+    """
+    Compare the mean times of all functions of two measurements. Returns the
+    rows (see REGRESSION_COLUMNS) sorted by the relative change, the largest
+    slowdown first. Functions measured in one container only are appended
+    with the status ADDED or REMOVED. A change above the threshold is only
+    tested for significance if both containers have raw data.
+
+    Arguments:
+        * baseline (DataContainer) -- reference measurement
+        * candidate (DataContainer) -- new measurement
+        * threshold -- minimal relative change of a regression or improvement -- default = 0.05
+        * alpha -- significance level of the Mann-Whitney test -- default = 0.05
+    """
+    base_series = baseline.series()
+    cand_cols = candidate.columns(base_series)
+    common = np.flatnonzero(cand_cols >= 0)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        base_mean = np.nanmean(baseline.mean_values(), axis=0)[common]
+        cand_mean = np.nanmean(candidate.mean_values(), axis=0)[cand_cols[common]]
+        change = cand_mean - base_mean
+        relative = change / base_mean
+
+    rows = []
+    for i, col in enumerate(common):
+        # only functions above the threshold need the (more expensive) test
+        p = np.nan
+        if abs(relative[i]) > threshold:
+            _, p = mann_whitney(_pooled_raw(baseline, col), _pooled_raw(candidate, cand_cols[col]))
+
+        # without raw data (p is nan) the change is judged by the threshold alone
+        status = UNCHANGED
+        if p < alpha or (abs(relative[i]) > threshold and np.isnan(p)):
+            status = REGRESSION if relative[i] > 0 else IMPROVEMENT
+
+        obj_type, name, func = base_series[col]
+        rows.append([obj_type, name, func, float(base_mean[i]), float(cand_mean[i]), float(change[i]),
+                     100.0 * float(relative[i]), float(p), status])
+
+    rows.sort(key=lambda row: np.inf if np.isnan(row[6]) else -row[6])
+
+    # functions of one measurement only
+    base_cols = baseline.columns(candidate.series())
+    for col in np.flatnonzero(base_cols < 0):
+        obj_type, name, func = candidate.series()[col]
+        mean = float(np.nanmean(candidate.mean_values()[:, col]))
+        rows.append([obj_type, name, func, np.nan, mean, np.nan, np.nan, np.nan, ADDED])
+    for col in np.flatnonzero(cand_cols < 0):
+        obj_type, name, func = base_series[col]
+        mean = float(np.nanmean(baseline.mean_values()[:, col]))
+        rows.append([obj_type, name, func, mean, np.nan, np.nan, np.nan, np.nan, REMOVED])
+
+    return rows
+
+
+def regressions(rows):
+    """
+    Return the rows of compare_containers() with the status REGRESSION.
+    """
+    return [row for row in rows if row[-1] == REGRESSION]
@@ -22,40 +22,51 @@
 #
 #==============================================================================
 from PyQt5.QtWidgets import QDialog, QFileDialog
-from PyQt5.uic import loadUi
+
+from SweepRunner import PARADIGMS
+from Ui_RunDialog import Ui_Dialog
 
 class RunDialog(QDialog):
     """
     This is a modified Qt-Component. It opens a dialog where your can choose the script to analyse,
     the path where the scipt will be executete und the data files saved and add some arguments for
-    execution of the script.
+    execution of the script. The script is executed for each selected paradigm and thread count.
     """
     def __init__(self):
         """
         Load design of the dialog window from ui-file and connect buttons with functions.
         """
         super(self.__class__, self).__init__()
-        self.ui = loadUi("RunDialog.ui")
+        self.ui = Ui_Dialog()
+        self.ui.setupUi(self)
         
         self.ui.btnPath.clicked.connect(self.select_path)
         self.ui.btnScript.clicked.connect(self.select_script)
 
+        for paradigm in PARADIGMS:
+            self.ui.cmbParadigm.addItem(paradigm, [paradigm])
+        self.ui.cmbParadigm.addItem(" + ".join(PARADIGMS), list(PARADIGMS))
         
     def get_data(self):
         """
-        Return the input-values of the dialog if submit-button was clicked.
+        Return the input-values of the dialog if submit-button was clicked: script, path,
+        arguments, thread counts (text), list of paradigms and maximum number of parallel
+        runs (0 = automatic).
         """
-        self.ui.exec_()
+        self.exec_()
         if(self.result() == self.Accepted):
-            return self.ui.txtScript.text(), self.ui.txtPath.text(), self.ui.txtArgs.text()
+            return (self.ui.txtScript.text(), self.ui.txtPath.text(), self.ui.txtArgs.text(), self.ui.txtThreads.text(),
+                    self.ui.cmbParadigm.itemData(self.ui.cmbParadigm.currentIndex()), self.ui.spnParallel.value())
         else:
-            return '', '', ''
+            return '', '', '', '', [], 0
     
     def select_path(self):
         """
         Open a FileDialog to choose the execution directory.
         """
-        self.ui.txtPath.setText(QFileDialog.getExistingDirectory(self, 'Select working directory', '.'))
+        path = QFileDialog.getExistingDirectory(self, 'Select working directory', '.')
+        if path != "":
+            self.ui.txtPath.setText(path)
         
     def select_script(self):
         """
@@ -66,4 +77,6 @@ class RunDialog(QDialog):
             path = self.ui.txtPath.text()
         else:
             path = "."
-        self.ui.txtScript.setText(QFileDialog.getOpenFileName(self, 'Select script file', path, '*.py'))
\ No newline at end of file
+        script, _ = QFileDialog.getOpenFileName(self, 'Select script file', path, '*.py')
+        if script != "":
+            self.ui.txtScript.setText(script)
\ No newline at end of file
@@ -0,0 +1,380 @@
+# ==============================================================================
+#
+#     Scaling.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+"""
+Scaling models fitted to the speedups of several thread counts:
+
+    * Amdahl: S(p) = 1 / (s + (1 - s) / p) with the serial fraction s
+    * Gustafson: S(p) = p - s * (p - 1) with the serial fraction s
+    * Universal Scalability Law: S(p) = p / (1 + sigma * (p - 1) + kappa * p * (p - 1))
+      with contention sigma and coherence kappa, the speedup is maximal at
+      p = sqrt((1 - sigma) / kappa)
+
+Each model is linear in its coefficients after a transformation of S, so
+all functions are fitted at once by least squares on (functions x threads)
+arrays. Missing speedups are NaN and ignored.
+
+GPU measurements do not scale with threads, they are compared to a chosen
+measurement of another paradigm instead, see cross_speedups().
+"""
+import warnings
+
+import numpy as np
+
+# fitted models and their names
+MODELS = {
+    "amdahl": "Amdahl",
+    "gustafson": "Gustafson",
+    "usl": "USL",
+}
+
+
+def speedup_matrix(baseline, containers, series=None):
+    """
+    Return the speedups of the containers against the baseline as
+    (series x containers) array, the means over the tests are compared.
+    Series missing in a container are NaN.
+
+    Arguments:
+        * baseline (DataContainer) -- measurement with one thread
+        * containers -- list of DataContainers of the same paradigm
+        * series -- list of (obj_type, name, func) -- default = all series of the baseline
+    """
+    if series is None:
+        series = baseline.series()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        base_mean = np.nanmean(baseline.mean_values(), axis=0)
+
+        speedups = np.full((len(series), len(containers)), np.nan)
+        for k, data in enumerate(containers):
+            mean = np.nanmean(data.mean_values(), axis=0)
+            for f, s in enumerate(series):
+                try:
+                    speedups[f, k] = base_mean[baseline.column(*s)] / mean[data.column(*s)]
+                except KeyError:
+                    continue
+
+    return speedups
+
+
+def thread_baseline(data, container):
+    """
+    Return the measurement with one thread of the same paradigm and rank as a
+    container, None if there is none. GPU measurements have none.
+
+    Arguments:
+        * data -- dictionary of DataContainers by key
+        * container (DataContainer) -- the measurement
+    """
+    if container.is_gpu():
+        return None
+
+    for other in data.values():
+        if (other.paradigm() == container.paradigm() and other.rank() == container.rank() and
+                other.num_threads() == 1 and not other.is_gpu()):
+            return other
+    return None
+
+
+def fit_scaling(data, series=None):
+    """
+    Fit the scaling models of all measurements with the same paradigm and rank.
+    Returns a dictionary by paradigm and rank of (series, threads, ScalingFit).
+    Groups without measurement with one thread and GPU measurements are skipped.
+
+    Arguments:
+        * data -- dictionary of DataContainers by key
+        * series -- list of (obj_type, name, func) to fit -- default = all series of the baselines
+    """
+    groups = {}
+    for container in data.values():
+        if not container.is_gpu():
+            groups.setdefault(container.paradigm() + container.rank(), []).append(container)
+
+    result = {}
+    for prefix, containers in groups.items():
+        containers.sort(key=lambda c: c.num_threads())
+        if containers[0].num_threads() != 1:
+            continue
+
+        fit_series = series if series is not None else containers[0].series()
+        threads = np.array([c.num_threads() for c in containers], dtype=np.float64)
+        speedups = speedup_matrix(containers[0], containers, fit_series)
+        result[prefix] = (fit_series, threads, ScalingFit(threads, speedups))
+
+    return result
+
+
+# columns of efficiency_ranking()
+RANKING_COLUMNS = ["measurement", "threads", "type", "name", "func", "1 thread (ms)", "x threads (ms)",
+                   "speedup", "efficiency", "lost per call (ms)", "lost total (ms)"]
+
+
+def efficiency_ranking(data, obj_types=("pop", "proj")):
+    """
+    Return speedup, parallel efficiency and the time lost to imperfect scaling
+    of all functions of all measurements with more than one thread, compared
+    to the measurement with one thread of the same paradigm and rank. The time
+    lost per call is the difference to the ideal time (1 thread / x threads),
+    the total is multiplied by the number of calls. The rows (see
+    RANKING_COLUMNS) are sorted by the total time lost, worst first.
+
+    Arguments:
+        * data -- dictionary of DataContainers by key
+        * obj_types -- object types of the functions -- default = ("pop", "proj")
+    """
+    rows = []
+    for key, container in data.items():
+        baseline = thread_baseline(data, container)
+        if baseline is None or container.num_threads() == 1:
+            continue
+
+        series = container.series()
+        base_cols = baseline.columns(series)
+        wanted = np.array([obj_type in obj_types for obj_type, _, _ in series], dtype=bool)
+        selected = np.flatnonzero((base_cols >= 0) & wanted)
+        if len(selected) == 0:
+            continue
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            time_one = np.nanmean(baseline.mean_values(), axis=0)[base_cols[selected]]
+            time_x = np.nanmean(container.mean_values(), axis=0)[selected]
+            calls = container.sample_counts()[:, selected].sum(axis=0) / max(container.num_tests(), 1)
+
+            threads = container.num_threads()
+            speedup = time_one / time_x
+            efficiency = speedup / threads
+            lost = time_x - time_one / threads
+            lost_total = lost * calls
+
+        for i, col in enumerate(selected):
+            obj_type, name, func = series[col]
+            rows.append([key, threads, obj_type, name, func, float(time_one[i]), float(time_x[i]),
+                         float(speedup[i]), float(efficiency[i]), float(lost[i]), float(lost_total[i])])
+
+    rows.sort(key=lambda row: np.inf if np.isnan(row[-1]) else -row[-1])
+    return rows
+
+
+# columns of cross_speedups()
+CROSS_SPEEDUP_COLUMNS = ["measurement", "device", "type", "name", "func", "blocks", "threads per block",
+                         "baseline (ms)", "time (ms)", "speedup"]
+
+
+def cross_speedups(data, baseline):
+    """
+    Return the speedups of all functions of the GPU measurements against a measurement
+    of another paradigm, e.g. OpenMP with the best number of threads. The rows (see
+    CROSS_SPEEDUP_COLUMNS) are ordered by measurement and speedup, the functions
+    gaining least first. Unknown blocks and threads per block are "-".
+
+    Arguments:
+        * data -- dictionary of DataContainers by key
+        * baseline (DataContainer) -- the measurement to compare with
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        base_mean = np.nanmean(baseline.mean_values(), axis=0)
+
+    rows = []
+    for key in sorted(data):
+        container = data[key]
+        if not container.is_gpu() or container is baseline:
+            continue
+
+        series = container.series()
+        base_cols = baseline.columns(series)
+        selected = np.flatnonzero(base_cols >= 0)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            time_base = base_mean[base_cols[selected]]
+            time_gpu = np.nanmean(container.mean_values(), axis=0)[selected]
+            speedup = time_base / time_gpu
+
+        found = []
+        for i, col in enumerate(selected):
+            obj_type, name, func = series[col]
+            blocks, threads = container.launch_configuration(obj_type, name, func)
+            found.append([key, container.device(), obj_type, name, func, blocks or "-", threads or "-",
+                          float(time_base[i]), float(time_gpu[i]), float(speedup[i])])
+        found.sort(key=lambda row: np.inf if np.isnan(row[-1]) else row[-1])
+        rows.extend(found)
+
+    return rows
+
+
+def _through_origin(x, y, valid):
+    """
+    Least squares slope of y = c * x along the rows, only valid entries are used.
+    """
+    x = np.where(valid, x, 0.0)
+    y = np.where(valid, y, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (x * y).sum(axis=1) / (x * x).sum(axis=1)
+
+
+def amdahl(threads, serial):
+    """
+    Speedup of Amdahl's law for the given thread counts, broadcasts like numpy.
+    """
+    return 1.0 / (serial + (1.0 - serial) / threads)
+
+
+def gustafson(threads, serial):
+    """
+    Scaled speedup of Gustafson's law for the given thread counts, broadcasts like numpy.
+    """
+    return threads - serial * (threads - 1.0)
+
+
+def usl(threads, sigma, kappa):
+    """
+    Speedup of the Universal Scalability Law for the given thread counts, broadcasts like numpy.
+    """
+    return threads / (1.0 + sigma * (threads - 1.0) + kappa * threads * (threads - 1.0))
+
+
+class ScalingFit(object):
+    """
+    Coefficients of the scaling models of several functions. All attributes
+    are arrays with one value per function (row of the speedups):
+
+        * serial -- serial fraction of Amdahl's law
+        * gustafson_serial -- serial fraction of Gustafson's law
+        * sigma, kappa -- contention and coherence of the USL
+        * peak -- thread count with the maximal speedup of the USL (inf without coherence)
+        * peak_speedup -- speedup of the USL at peak (limit 1 / sigma without coherence)
+        * error -- dictionary of the RMS error of each model
+    """
+    def __init__(self, threads, speedups):
+        """
+        Fit the models.
+
+        Arguments:
+            * threads -- thread counts (1D array)
+            * speedups -- speedups (functions x threads), 1 / x threads compared to one thread
+        """
+        p = np.asarray(threads, dtype=np.float64)[None, :]
+        speedups = np.atleast_2d(np.asarray(speedups, dtype=np.float64))
+        valid = np.isfinite(speedups) & (speedups > 0)
+
+        self.threads = p[0]
+        self.speedups = speedups
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # Amdahl: 1/S - 1/p = s * (1 - 1/p)
+            self.serial = np.clip(_through_origin(1.0 - 1.0 / p, 1.0 / speedups - 1.0 / p, valid), 0.0, 1.0)
+
+            # Gustafson: p - S = s * (p - 1)
+            self.gustafson_serial = np.clip(_through_origin(p - 1.0, p - speedups, valid), 0.0, 1.0)
+
+            # USL: p/S - 1 = sigma * (p - 1) + kappa * p * (p - 1), solved by the normal equations
+            x1 = np.where(valid, p - 1.0, 0.0)
+            x2 = np.where(valid, p * (p - 1.0), 0.0)
+            y = np.where(valid, p / speedups - 1.0, 0.0)
+            a, b, c = (x1 * x1).sum(axis=1), (x1 * x2).sum(axis=1), (x2 * x2).sum(axis=1)
+            d, e = (x1 * y).sum(axis=1), (x2 * y).sum(axis=1)
+            det = a * c - b * b
+
+            sigma = (c * d - b * e) / det
+            kappa = (a * e - b * d) / det
+
+            # both coefficients are non-negative, otherwise fit with one coefficient only
+            single = ~(det > 1e-12 * a * c) | (sigma < 0) | (kappa < 0)
+            sigma_only = np.clip(d / a, 0.0, 1.0)
+            kappa_only = np.clip(e / c, 0.0, None)
+            error_sigma = self._rms(usl(p, sigma_only[:, None], 0.0), speedups, valid)
+            error_kappa = self._rms(usl(p, 0.0, kappa_only[:, None]), speedups, valid)
+            use_sigma = ~(error_kappa < error_sigma)
+            self.sigma = np.where(single, np.where(use_sigma, sigma_only, 0.0), sigma)
+            self.kappa = np.where(single, np.where(use_sigma, 0.0, kappa_only), kappa)
+            self.sigma = np.clip(np.nan_to_num(self.sigma), 0.0, 1.0)
+            self.kappa = np.nan_to_num(self.kappa)
+
+            # no speedup at all if the contention is 1, the peak is at one thread then
+            self.peak = np.where(self.kappa > 0, np.maximum(np.sqrt((1.0 - self.sigma) / self.kappa), 1.0), np.inf)
+            self.peak_speedup = np.where(self.kappa > 0, usl(self.peak, self.sigma, self.kappa), 1.0 / self.sigma)
+
+        # functions without speedup of more than one thread have no fit
+        fitted = (valid & (p > 1)).any(axis=1)
+        for attr in ("serial", "gustafson_serial", "sigma", "kappa", "peak", "peak_speedup"):
+            setattr(self, attr, np.where(fitted, getattr(self, attr), np.nan))
+
+        self.error = {
+            "amdahl": self._rms(self.predict("amdahl", p), speedups, valid),
+            "gustafson": self._rms(self.predict("gustafson", p), speedups, valid),
+            "usl": self._rms(self.predict("usl", p), speedups, valid),
+        }
+
+    @staticmethod
+    def _rms(predicted, speedups, valid):
+        """
+        Root mean square error of the predicted speedups along the rows.
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            diff = np.where(valid, predicted - speedups, 0.0)
+            return np.sqrt((diff * diff).sum(axis=1) / valid.sum(axis=1))
+
+    def predict(self, model, threads):
+        """
+        Return the speedups of a model for the given thread counts as
+        (functions x threads) array.
+
+        Arguments:
+            * model -- one of MODELS
+            * threads -- thread counts (1D array)
+        """
+        p = np.asarray(threads, dtype=np.float64).reshape(1, -1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if model == "amdahl":
+                return amdahl(p, self.serial[:, None])
+            if model == "gustafson":
+                return gustafson(p, self.gustafson_serial[:, None])
+            if model == "usl":
+                return usl(p, self.sigma[:, None], self.kappa[:, None])
+        raise ValueError("Unknown scaling model: " + str(model))
+
+    def recommended_threads(self, index, max_threads=None):
+        """
+        Return the thread count with the maximal speedup predicted by the USL for
+        one function, optionally limited to max_threads.
+
+        Arguments:
+            * index -- row of the function
+            * max_threads -- upper limit, e.g. the number of cores -- default = None
+        """
+        peak = self.peak[index]
+        if np.isnan(peak):
+            return None
+        if np.isinf(peak):
+            return max_threads
+
+        # the speedup is maximal at one of the integer neighbors of peak
+        candidates = np.array([np.floor(peak), np.ceil(peak)])
+        if max_threads is not None:
+            candidates = np.minimum(candidates, max_threads)
+        values = usl(candidates, self.sigma[index], self.kappa[index])
+        return int(candidates[np.argmax(values)])
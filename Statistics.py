@@ -0,0 +1,476 @@
+# ==============================================================================
+#
+#     Statistics.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+"""
+Vectorized statistics over the raw data of several tests. The raw data of the
+tests can differ in length, so it is padded with NaN to a (tests x samples) array.
+
+Warm-up phases at the start of a series are found by a change point of the
+mean, computed from cumulative sums for all series of a measurement at once.
+
+The bootstrap draws the resamples as counts of the sorted values of a sample
+(one multinomial draw per resample), so the cost depends on the number of
+distinct values and not on the number of samples. Samples with more distinct
+values than max_categories are split into as many bins of equally many sorted
+values. This is an approximation: the mean of a resample adds a normal
+deviation with the variance of the values drawn from each bin to the bin means,
+so the spread of the distribution is kept. The median takes the quantile of
+its bin at its position among the values drawn from the bin.
+"""
+import math
+import warnings
+
+import numpy as np
+
+# Available outlier filters, see remove_outliers()
+OUTLIER_FILTERS = {
+    "std": "mean ± factor · std",
+    "mad": "median ± factor · MAD",
+    "iqr": "quartiles ± factor · IQR",
+    "sigma_clip": "iterative sigma clipping",
+}
+
+# scales the median absolute deviation to the std of a normal distribution
+MAD_SCALE = 1.4826
+
+
+def padded(samples):
+    """
+    Return a list of 1D arrays as 2D array with one row for each array. Shorter
+    rows are filled with NaN.
+
+    Arguments:
+        * samples -- list of arrays
+    """
+    length = max([len(s) for s in samples] + [0])
+    values = np.full((len(samples), length), np.nan)
+    for i, s in enumerate(samples):
+        values[i, :len(s)] = s
+    return values
+
+
+def _row_nanfunc(func, values, *args):
+    """
+    Apply a nan-function along the rows without warnings for empty rows.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return func(values, *args, axis=1)
+
+
+def remove_outliers(samples, factor, method="std", mean=None, std=None, max_iter=20):
+    """
+    Return the samples as masked array (tests x samples) with padding and
+    outliers masked.
+
+    Arguments:
+        * samples -- list of raw data arrays, one per test
+        * factor -- width of the accepted range in units of the filter's scale
+        * method -- outlier filter, one of OUTLIER_FILTERS -- default = "std"
+        * mean, std -- mean and std of each test, used by method "std" -- default = computed from samples
+        * max_iter -- maximum number of iterations of "sigma_clip" -- default = 20
+    """
+    values = padded(samples)
+    valid = ~np.isnan(values)
+
+    if method == "std":
+        if mean is None:
+            mean = _row_nanfunc(np.nanmean, values)
+        if std is None:
+            std = _row_nanfunc(np.nanstd, values)
+        lower = np.asarray(mean) - factor * np.asarray(std)
+        upper = np.asarray(mean) + factor * np.asarray(std)
+
+    elif method == "mad":
+        median = _row_nanfunc(np.nanmedian, values)
+        mad = MAD_SCALE * _row_nanfunc(np.nanmedian, np.abs(values - median[:, None]))
+        lower = median - factor * mad
+        upper = median + factor * mad
+
+    elif method == "iqr":
+        q1, q3 = _row_nanfunc(np.nanpercentile, values, [25, 75])
+        lower = q1 - factor * (q3 - q1)
+        upper = q3 + factor * (q3 - q1)
+
+    elif method == "sigma_clip":
+        keep = valid
+        with np.errstate(invalid="ignore", divide="ignore"):
+            for _ in range(max_iter):
+                # mean and std of the kept samples, plain sums are faster than masked arrays here
+                count = keep.sum(axis=1)
+                center = np.where(keep, values, 0.0).sum(axis=1) / count
+                deviation = np.abs(values - center[:, None])
+                scale = np.sqrt(np.where(keep, deviation**2, 0.0).sum(axis=1) / count)
+
+                new_keep = valid & (deviation <= factor * scale[:, None])
+                if (new_keep == keep).all():
+                    break
+                keep = new_keep
+        return np.ma.masked_array(values, mask=~keep)
+
+    else:
+        raise ValueError("Unknown outlier filter: " + str(method))
+
+    with np.errstate(invalid="ignore"):
+        keep = valid & (values >= lower[:, None]) & (values <= upper[:, None])
+    return np.ma.masked_array(values, mask=~keep)
+
+
+def masked_mean_std(values):
+    """
+    Return mean and std of each row of a masked array. Rows without
+    values give NaN.
+
+    Arguments:
+        * values -- masked array, e.g. the result of remove_outliers()
+    """
+    return values.mean(axis=1).filled(np.nan), values.std(axis=1).filled(np.nan)
+
+
+# minimal reduction of the squared error by a change point, in units of log(n) * variance
+WARMUP_PENALTY = 4.0
+
+# warm-up phases may last at most this fraction of a series
+WARMUP_MAX_FRACTION = 0.5
+
+
+def split_phases(raw, offsets, lengths, penalty=WARMUP_PENALTY, max_fraction=WARMUP_MAX_FRACTION):
+    """
+    Split each raw series into a warm-up and a steady-state phase at the change
+    point of its mean. All series are processed at once, series i is
+    raw[offsets[i]:offsets[i] + lengths[i]].
+
+    The change point k of a series of n values is the split which reduces the
+    squared error around the mean the most: with the cumulative sum S_k of the
+    centered values, the reduction is S_k^2 * n / (k * (n - k)). It is accepted
+    if it exceeds penalty * log(n) * variance, the variance is estimated from the
+    differences of neighbouring values, so it is not inflated by the change
+    itself. Otherwise the whole series is steady state.
+
+    Returns a dictionary of arrays in the shape of offsets: "warmup" (number of
+    warm-up values), "warmup_mean", "warmup_std", "steady_mean" and "steady_std".
+    Statistics of empty phases are NaN.
+
+    Arguments:
+        * raw -- buffer of all series (1D array)
+        * offsets, lengths -- start and length of each series in raw (integer arrays)
+        * penalty -- threshold of a change point -- default = WARMUP_PENALTY
+        * max_fraction -- maximal length of the warm-up relative to the series -- default = WARMUP_MAX_FRACTION
+    """
+    shape = np.shape(offsets)
+    offsets = np.asarray(offsets, dtype=np.int64).ravel()
+    lengths = np.asarray(lengths, dtype=np.int64).ravel()
+    total = int(lengths.sum())
+
+    # gather the series one after another, position of each value in its series and its series
+    starts = np.cumsum(lengths) - lengths
+    series = np.repeat(np.arange(len(lengths)), lengths)
+    local = np.arange(total) - starts[series]
+    values = np.asarray(raw, dtype=np.float64)[offsets[series] + local]
+
+    def sums(x):
+        # sums of x over each series and cumulative sums within each series, the
+        # cumulative sum runs over all series, so non-finite values are summed as
+        # 0 and counted separately, they make only their own series NaN
+        finite = np.isfinite(x)
+        cumulative = np.concatenate(([0.0], np.cumsum(np.where(finite, x, 0.0))))
+        broken = np.concatenate(([0], np.cumsum(~finite)))
+        total = cumulative[starts + lengths] - cumulative[starts]
+        total[broken[starts + lengths] != broken[starts]] = np.nan
+        within = cumulative[1:] - cumulative[starts][series]
+        within[broken[1:] != broken[starts][series]] = np.nan
+        return total, within
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        n = lengths.astype(np.float64)
+        mean = sums(values)[0] / n
+        centered = values - mean[series]
+        _, cumulative = sums(centered)
+        _, cumulative_sq = sums(centered * centered)
+
+        # reduction of the squared error by a split after k = local + 1 values
+        k = local + 1.0
+        gain = cumulative * cumulative * n[series] / (k * (n[series] - k))
+        gain[(k >= n[series]) | (k > max_fraction * n[series])] = -np.inf
+
+        # best split of each series: first position of the maximal gain
+        best_gain = np.full(len(lengths), -np.inf)
+        filled = lengths > 0
+        if total:
+            best_gain[filled] = np.maximum.reduceat(gain, starts[filled])
+        candidates = np.flatnonzero(gain == best_gain[series])
+        first = np.unique(series[candidates], return_index=True)
+        split = np.zeros(len(lengths), dtype=np.int64)
+        split[first[0]] = local[candidates[first[1]]] + 1
+
+        # variance from the differences within the series
+        diff = np.diff(values)
+        same = series[1:] == series[:-1]
+        variance = np.bincount(series[1:][same], weights=diff[same] ** 2, minlength=len(lengths)) / (2.0 * (n - 1))
+
+        accepted = (best_gain > penalty * np.log(np.maximum(n, 2.0)) * variance) & (variance > 0)
+        warmup = np.where(accepted, split, 0)
+
+        # statistics of both phases from the cumulative sums of the centered values
+        at = starts + warmup - 1
+        head = np.where(warmup > 0, cumulative[np.maximum(at, 0)] if total else 0.0, 0.0)
+        head_sq = np.where(warmup > 0, cumulative_sq[np.maximum(at, 0)] if total else 0.0, 0.0)
+        tail = -head
+        tail_sq = sums(centered * centered)[0] - head_sq
+        m = warmup.astype(np.float64)
+
+        warmup_mean = head / m
+        steady_mean = tail / (n - m)
+        result = {
+            "warmup": warmup,
+            "warmup_mean": mean + warmup_mean,
+            "warmup_std": np.sqrt(np.maximum(head_sq / m - warmup_mean ** 2, 0.0)),
+            "steady_mean": mean + steady_mean,
+            "steady_std": np.sqrt(np.maximum(tail_sq / (n - m) - steady_mean ** 2, 0.0)),
+        }
+
+    return dict((name, value.reshape(shape)) for name, value in result.items())
+
+
+# columns of phase_statistics()
+PHASE_COLUMNS = ["type", "name", "func", "warm-up steps", "warm-up (ms)", "steady state (ms)", "steady std (ms)",
+                 "mean in file (ms)", "inflation (%)"]
+
+
+def phase_statistics(data, penalty=WARMUP_PENALTY, max_fraction=WARMUP_MAX_FRACTION):
+    """
+    Return the warm-up and steady-state statistics of all functions of a
+    DataContainer, averaged over the tests. The inflation is the difference of
+    the mean in the file to the steady-state mean in percent. The rows (see
+    PHASE_COLUMNS) are sorted by the inflation, largest first.
+
+    Arguments:
+        * data (DataContainer) -- the measurement
+        * penalty, max_fraction -- see split_phases()
+    """
+    phases = data.phases(penalty, max_fraction)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        warmup = phases["warmup"].mean(axis=0)
+        warmup_mean = np.nanmean(phases["warmup_mean"], axis=0)
+        steady_mean = np.nanmean(phases["steady_mean"], axis=0)
+        steady_std = np.nanmean(phases["steady_std"], axis=0)
+        file_mean = np.nanmean(data.mean_values(), axis=0)
+        inflation = 100.0 * (file_mean - steady_mean) / steady_mean
+
+    rows = []
+    for col, (obj_type, name, func) in enumerate(data.series()):
+        rows.append([obj_type, name, func, float(warmup[col]), float(warmup_mean[col]), float(steady_mean[col]),
+                     float(steady_std[col]), float(file_mean[col]), float(inflation[col])])
+
+    rows.sort(key=lambda row: np.inf if np.isnan(row[-1]) else -row[-1])
+    return rows
+
+
+# statistics of the bootstrap
+BOOTSTRAP_STATISTICS = ["mean", "median"]
+
+# number of drawn values per chunk of resamples
+_BOOTSTRAP_CHUNK = 4000000
+
+
+def _bins(sample, max_categories):
+    """
+    Return the sorted sample and the start, size, mean and variance of its bins: the
+    distinct values, or at most max_categories bins of equally many sorted values.
+    """
+    ordered = np.sort(sample)
+    values, counts = np.unique(ordered, return_counts=True)
+    if len(values) <= max_categories:
+        return ordered, np.cumsum(counts) - counts, counts, values, np.zeros(len(values))
+
+    starts = (np.arange(max_categories) * len(ordered)) // max_categories
+    counts = np.diff(np.append(starts, len(ordered)))
+    means = np.add.reduceat(ordered, starts) / counts
+    variances = np.add.reduceat((ordered - np.repeat(means, counts)) ** 2, starts) / counts
+    return ordered, starts, counts, means, variances
+
+
+def bootstrap_distribution(sample, statistic="mean", resamples=10000, rng=None, max_categories=1024):
+    """
+    Return the statistic of each resample of a sample as array. NaN values are ignored,
+    an empty sample gives NaN.
+
+    Arguments:
+        * sample -- 1D array of the raw data
+        * statistic -- one of BOOTSTRAP_STATISTICS -- default = "mean"
+        * resamples -- number of resamples -- default = 10000
+        * rng -- numpy.random.Generator -- default = new generator
+        * max_categories -- maximum number of bins, see module description -- default = 1024
+    """
+    if not statistic in BOOTSTRAP_STATISTICS:
+        raise ValueError("Unknown statistic: " + str(statistic))
+    if rng is None:
+        rng = np.random.default_rng()
+
+    sample = np.asarray(sample, dtype=np.float64)
+    sample = sample[~np.isnan(sample)]
+    n = len(sample)
+    if n == 0:
+        return np.full(resamples, np.nan)
+
+    ordered, starts, counts, means, variances = _bins(sample, max_categories)
+    probabilities = counts / float(n)
+
+    result = np.empty(resamples)
+    chunk = max(1, _BOOTSTRAP_CHUNK // len(counts))
+    for start in range(0, resamples, chunk):
+        stop = min(start + chunk, resamples)
+        drawn = rng.multinomial(n, probabilities, size=stop - start)
+
+        if statistic == "mean":
+            # the values drawn from a bin scatter around its mean with its variance
+            spread = np.sqrt(drawn.dot(variances))
+            result[start:stop] = (drawn.dot(means) + spread * rng.standard_normal(stop - start)) / n
+        else:
+            cumulated = np.cumsum(drawn, axis=1)
+            result[start:stop] = 0.5 * (_order_statistic(ordered, starts, counts, drawn, cumulated, (n - 1) // 2) +
+                                        _order_statistic(ordered, starts, counts, drawn, cumulated, n // 2))
+
+    return result
+
+
+def _order_statistic(ordered, starts, counts, drawn, cumulated, position):
+    """
+    Return the value at a position of each sorted resample, given as drawn counts of
+    the bins. Within its bin the value is the quantile of the bin at the relative
+    position in the drawn values of the bin.
+    """
+    rows = np.arange(len(drawn))
+    b = (cumulated > position).argmax(axis=1)
+    in_bin = drawn[rows, b]
+    rank = position - (cumulated[rows, b] - in_bin)
+    offset = ((rank + 0.5) / in_bin * counts[b]).astype(np.int64)
+    return ordered[starts[b] + np.minimum(offset, counts[b] - 1)]
+
+
+def bootstrap(samples, statistic="mean", resamples=10000, confidence=0.95, seed=None, max_categories=1024):
+    """
+    Return the statistic of each test and the bounds of its percentile bootstrap
+    confidence interval as three arrays (estimate, lower, upper).
+
+    Arguments:
+        * samples -- list of raw data arrays, one per test
+        * statistic -- one of BOOTSTRAP_STATISTICS -- default = "mean"
+        * resamples -- number of resamples -- default = 10000
+        * confidence -- confidence level of the interval -- default = 0.95
+        * seed -- seed of the random numbers, for reproducible intervals -- default = None
+        * max_categories -- maximum number of distinct values, see module description -- default = 1024
+    """
+    rng = np.random.default_rng(seed)
+    alpha = 100.0 * (1.0 - confidence) / 2.0
+    func = np.nanmean if statistic == "mean" else np.nanmedian
+
+    estimate = np.full(len(samples), np.nan)
+    lower = np.full(len(samples), np.nan)
+    upper = np.full(len(samples), np.nan)
+    for i, sample in enumerate(samples):
+        distribution = bootstrap_distribution(sample, statistic, resamples, rng, max_categories)
+        if np.isnan(distribution[0]):
+            continue
+        estimate[i] = func(sample)
+        lower[i], upper[i] = np.percentile(distribution, [alpha, 100.0 - alpha])
+
+    return estimate, lower, upper
+
+
+def _ranks(values):
+    """
+    Return the ranks (starting at 1) of the values, ties get their average rank,
+    and the sizes of the groups of ties.
+    """
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    average = np.cumsum(counts) - (counts - 1) / 2.0
+    return average[inverse], counts
+
+
+def mann_whitney(x, y):
+    """
+    Two-sided Mann-Whitney U test with normal approximation, tie correction and
+    continuity correction. Returns U of x and the p-value. The approximation
+    is good for more than about 20 values per sample.
+
+    Arguments:
+        * x, y -- 1D arrays of the samples, NaN values are ignored
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    x = x[~np.isnan(x)]
+    y = y[~np.isnan(y)]
+    n1, n2 = len(x), len(y)
+    if n1 == 0 or n2 == 0:
+        return np.nan, np.nan
+
+    ranks, ties = _ranks(np.concatenate((x, y)))
+    u = ranks[:n1].sum() - n1 * (n1 + 1) / 2.0
+
+    n = float(n1 + n2)
+    ties = ties.astype(np.float64)
+    variance = n1 * n2 / 12.0 * ((n + 1) - (ties ** 3 - ties).sum() / (n * (n - 1)))
+    if variance <= 0:
+        # all values are equal
+        return float(u), 1.0
+
+    z = (abs(u - n1 * n2 / 2.0) - 0.5) / math.sqrt(variance)
+    return float(u), math.erfc(max(z, 0.0) / math.sqrt(2.0))
+
+
+def compare_samples(x, y, resamples=10000, confidence=0.95, seed=None):
+    """
+    Compare two samples, e.g. the raw data of one function in two measurements.
+    Returns a dictionary with the means ("mean_x", "mean_y"), the medians ("median_x",
+    "median_y"), the difference of the means y - x with its bootstrap confidence
+    interval ("difference", "lower", "upper"), the relative change of the mean
+    ("relative") and U and p-value of the Mann-Whitney test ("u", "p").
+
+    Arguments:
+        * x, y -- 1D arrays of the samples
+        * resamples -- number of resamples -- default = 10000
+        * confidence -- confidence level of the interval -- default = 0.95
+        * seed -- seed of the random numbers -- default = None
+    """
+    rng = np.random.default_rng(seed)
+    alpha = 100.0 * (1.0 - confidence) / 2.0
+
+    # the samples are independent, so are their resamples
+    difference = (bootstrap_distribution(y, "mean", resamples, rng) -
+                  bootstrap_distribution(x, "mean", resamples, rng))
+    u, p = mann_whitney(x, y)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        result = {
+            "mean_x": float(np.nanmean(x)), "mean_y": float(np.nanmean(y)),
+            "median_x": float(np.nanmedian(x)), "median_y": float(np.nanmedian(y)),
+            "u": float(u), "p": float(p),
+        }
+        result["difference"] = result["mean_y"] - result["mean_x"]
+        result["lower"], result["upper"] = [float(v) for v in np.nanpercentile(difference, [alpha, 100.0 - alpha])]
+        result["relative"] = result["difference"] / result["mean_x"] if result["mean_x"] != 0 else np.nan
+
+    return result
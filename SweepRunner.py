@@ -0,0 +1,394 @@
+# ==============================================================================
+#
+#     SweepRunner.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+"""
+Runs an ANNarchy script with --profile for several paradigms and thread counts,
+e.g. a scaling study with 1 to 64 threads.
+
+Several runs are executed at the same time if there are enough cores. Each run
+is pinned to its own set of cores with taskset, so the runs do not share cores.
+They still share caches and memory bandwidth, set max_parallel to 1 for exact
+timings.
+The first run of each paradigm is executed alone, so the network is compiled
+only once and the following runs reuse the generated code.
+
+The profiling files and the output of the scripts (*.log) are stored in a new
+directory for each sweep.
+"""
+import asyncio
+import os
+import shlex
+import shutil
+import signal
+import sys
+import time
+
+from DataContainer import DataContainer
+
+# paradigms and the command line arguments selecting them
+PARADIGMS = {
+    "openmp": lambda threads: ["-j", str(threads)],
+    "cuda": lambda threads: ["--gpu"],
+}
+
+
+def parse_threads(text):
+    """
+    Return the sorted thread counts of a text like "1,2,4-8". Ranges include
+    both ends. Raises ValueError for invalid text.
+
+    Arguments:
+        * text -- comma separated thread counts and ranges
+    """
+    threads = set()
+    try:
+        for part in text.replace(" ", "").split(","):
+            if part == "":
+                continue
+            if "-" in part:
+                first, last = part.split("-", 1)
+                threads.update(range(int(first), int(last) + 1))
+            else:
+                threads.add(int(part))
+    except ValueError:
+        threads = set()
+
+    if len(threads) == 0 or min(threads) < 1:
+        raise ValueError("Invalid thread counts: " + text)
+    return sorted(threads)
+
+
+def available_cores():
+    """
+    Return the cores this process may run on or None if the platform does not
+    support CPU affinity or taskset is not installed.
+    """
+    if shutil.which("taskset") is None:
+        return None
+    try:
+        return sorted(os.sched_getaffinity(0))
+    except AttributeError:
+        return None
+
+
+def _pinned(command, cores):
+    """
+    Return the command running on the given cores. taskset sets the affinity
+    before the script starts, so all its threads and processes inherit it. Unlike
+    preexec_fn it is safe to start from a multi-threaded process like the GUI.
+    """
+    if cores is None:
+        return command
+    return ["taskset", "-c", ",".join(str(core) for core in cores)] + command
+
+
+def _signal(process, sig):
+    """
+    Send a signal to the process group of a script started in its own session.
+    """
+    try:
+        os.killpg(process.pid, sig)
+    except ProcessLookupError:
+        pass
+
+
+class SweepRun(object):
+    """
+    One configuration of a sweep and its outcome.
+    """
+    def __init__(self, paradigm, num_threads, fname):
+        """
+        Initialization.
+
+        Arguments:
+            * paradigm -- one of PARADIGMS
+            * num_threads -- number of threads, ignored by cuda
+            * fname -- path and name of the profiling file
+        """
+        self.paradigm = paradigm
+        self.num_threads = num_threads
+        self.fname = fname
+        self.log = os.path.splitext(fname)[0] + ".log"
+        self.cores = None
+        self.returncode = None
+        self.data = None
+
+    def name(self):
+        """
+        Return a short description of the configuration.
+        """
+        if self.paradigm == "cuda":
+            return self.paradigm
+        return self.paradigm + " with " + str(self.num_threads) + " threads"
+
+    def succeeded(self):
+        """
+        Return true if the script finished and the profiling file was loaded.
+        """
+        return self.data is not None
+
+
+class SweepRunner(object):
+    """
+    Executes an ANNarchy script for a list of paradigms and thread counts.
+    """
+    def __init__(self, script, path=".", args="", threads=(1,), paradigms=("openmp",),
+                 max_parallel=None, out_dir=None, timeout=None, cache=None):
+        """
+        Initialization.
+
+        Arguments:
+            * script -- the ANNarchy script
+            * path -- working directory of the script -- default = "."
+            * args -- additional command line arguments of the script -- default = ""
+            * threads -- thread counts of the openmp runs -- default = (1,)
+            * paradigms -- list of PARADIGMS, cuda is run once -- default = ("openmp",)
+            * max_parallel -- maximum number of runs at the same time -- default = as many as there are cores
+            * out_dir -- directory of the sweep directories -- default = path
+            * timeout -- maximum duration of a run in seconds -- default = None
+            * cache (ProfileCache) -- cache for the loaded files -- default = None
+        """
+        for paradigm in paradigms:
+            if not paradigm in PARADIGMS:
+                raise ValueError("Unknown paradigm: " + str(paradigm))
+
+        self._script = os.path.abspath(os.path.join(path, script))
+        self._path = path
+        self._args = shlex.split(args)
+        self._threads = sorted(set(threads))
+        self._paradigms = list(paradigms)
+        self._out_dir = out_dir if out_dir is not None else path
+        self._timeout = timeout
+        self._cache = cache
+
+        self._cores = available_cores()
+        if max_parallel is None or max_parallel < 1:
+            # without pinning the runs would disturb each other
+            max_parallel = len(self._cores) if self._cores is not None else 1
+        self._max_parallel = max_parallel
+
+        self._cancelled = False
+        self._loop = None
+        self._processes = set()
+
+    def runs(self, directory):
+        """
+        Return the SweepRuns of all configurations with their files in directory.
+        """
+        runs = []
+        for paradigm in self._paradigms:
+            if paradigm == "cuda":
+                runs.append(SweepRun(paradigm, 1, os.path.join(directory, "profile_cuda.xml")))
+                continue
+            for num_threads in self._threads:
+                fname = "profile_%s_%03dthreads.xml" % (paradigm, num_threads)
+                runs.append(SweepRun(paradigm, num_threads, os.path.join(directory, fname)))
+        return runs
+
+    def num_runs(self):
+        """
+        Return the number of runs of the sweep.
+        """
+        return len(self.runs(""))
+
+    def cancel(self):
+        """
+        Stop the sweep, running scripts are terminated. Can be called from any thread.
+        """
+        self._cancelled = True
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._terminate)
+
+    def cancelled(self):
+        """
+        Return true if the sweep was cancelled.
+        """
+        return self._cancelled
+
+    def run(self, progress=None, intermediate=None):
+        """
+        Execute the sweep and return the list of SweepRuns. Blocks until all
+        runs are done, so call it in a background thread from the GUI.
+
+        Arguments:
+            * progress -- function called with (done, total) after each run -- default = None
+            * intermediate -- function called with each finished SweepRun -- default = None
+        """
+        runs = self.runs(self._create_directory())
+        asyncio.run(self._run_all(runs, progress, intermediate))
+        return runs
+
+    def _create_directory(self):
+        """
+        Create a new directory for the files of this sweep.
+        """
+        base = os.path.join(self._out_dir, "sweep_" + time.strftime("%Y%m%d-%H%M%S"))
+        directory = base
+        count = 1
+        while True:
+            try:
+                os.makedirs(directory)
+                return directory
+            except FileExistsError:
+                count += 1
+                directory = base + "_" + str(count)
+
+    async def _run_all(self, runs, progress, intermediate):
+        """
+        Start the runs as soon as enough cores are free. Larger runs are
+        started first, so the small runs fill the remaining cores.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._changed = asyncio.Condition()
+        self._free = list(self._cores) if self._cores is not None else None
+        self._active = 0
+        self._done = 0
+
+        first = []
+        for run in runs:
+            if not run.paradigm in [r.paradigm for r in first]:
+                first.append(run)
+        others = sorted([r for r in runs if not r in first], key=lambda r: -r.num_threads)
+
+        tasks = []
+        for run in first + others:
+            cores = await self._acquire(run, exclusive=run in first)
+            if self._cancelled:
+                break
+
+            task = asyncio.ensure_future(self._execute(run, cores, len(runs), progress, intermediate))
+            tasks.append(task)
+            if run in first:
+                await task
+
+        await asyncio.gather(*tasks)
+        self._loop = None
+
+    def _cores_needed(self, run):
+        """
+        Return the number of cores of a run, at most all available cores.
+        """
+        if self._free is None:
+            return 0
+        needed = 1 if run.paradigm == "cuda" else run.num_threads
+        return min(needed, len(self._cores))
+
+    async def _acquire(self, run, exclusive):
+        """
+        Wait until a run can be started and return its cores. Exclusive runs
+        wait until all other runs are done.
+        """
+        needed = self._cores_needed(run)
+
+        def ready():
+            if self._cancelled:
+                return True
+            if exclusive and self._active > 0:
+                return False
+            return self._active < self._max_parallel and (self._free is None or len(self._free) >= needed)
+
+        async with self._changed:
+            await self._changed.wait_for(ready)
+            if self._cancelled:
+                return None
+            self._active += 1
+            if self._free is None:
+                return None
+            cores = self._free[:needed]
+            del self._free[:needed]
+            return cores
+
+    async def _release(self, cores):
+        """
+        Return the cores of a finished run.
+        """
+        async with self._changed:
+            self._active -= 1
+            if cores is not None:
+                self._free = sorted(self._free + cores)
+            self._changed.notify_all()
+
+    async def _execute(self, run, cores, total, progress, intermediate):
+        """
+        Execute the script for one configuration and load its profiling file.
+        """
+        command = [sys.executable, self._script, "--profile", "--profile_out=" + run.fname]
+        command += PARADIGMS[run.paradigm](run.num_threads) + self._args
+        run.cores = cores
+
+        try:
+            with open(run.log, "wb") as log:
+                log.write((" ".join(shlex.quote(c) for c in command) + "\n\n").encode())
+                log.flush()
+
+                # its own session allows to kill the script with its children
+                process = await asyncio.create_subprocess_exec(*_pinned(command, cores), cwd=self._path,
+                                                               stdout=log, stderr=asyncio.subprocess.STDOUT,
+                                                               start_new_session=True)
+
+                self._processes.add(process)
+                try:
+                    run.returncode = await asyncio.wait_for(process.wait(), self._timeout)
+                except asyncio.TimeoutError:
+                    _signal(process, signal.SIGKILL)
+                    run.returncode = await process.wait()
+                finally:
+                    self._processes.discard(process)
+        finally:
+            await self._release(cores)
+
+        if run.returncode == 0 and os.path.isfile(run.fname):
+            run.data = await self._loop.run_in_executor(None, self._load, run.fname)
+
+        self._done += 1
+        if progress is not None:
+            progress(self._done, total)
+        if intermediate is not None:
+            intermediate(run)
+
+    def _load(self, fname):
+        """
+        Load a profiling file, returns None if it is broken.
+        """
+        try:
+            if self._cache is not None:
+                return self._cache.load(fname)
+
+            data = DataContainer()
+            return data if data.load_data(fname) else None
+        except Exception as e:
+            # a broken file of one run should not stop the sweep
+            print("Could not load", fname, "-", e)
+            return None
+
+    def _terminate(self):
+        """
+        Terminate the running scripts and wake up the scheduler.
+        """
+        for process in self._processes:
+            _signal(process, signal.SIGTERM)
+
+        async def wake():
+            async with self._changed:
+                self._changed.notify_all()
+        asyncio.ensure_future(wake())
@@ -0,0 +1,251 @@
+# ==============================================================================
+#
+#     Throughput.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+"""
+Throughput of the populations and projections, computed from their sizes
+(see DataContainer.sizes()): neurons per second of the population step and
+synapses per second of the projection functions.
+
+With an estimate of the floating point operations and bytes moved per
+neuron or synapse (UNIT_COSTS), the achieved GFLOP/s and GB/s are compared
+to the roofline of the machine:
+
+    attainable GFLOP/s = min(peak GFLOP/s, peak GB/s * intensity)
+
+where the intensity of a function is FLOP / byte. Functions with an
+intensity below the ridge point (peak GFLOP/s / peak GB/s) are memory
+bound, more threads only help until they reach the bandwidth roof.
+"""
+import warnings
+
+import numpy as np
+
+# estimated (FLOP, bytes) per neuron or synapse of the functions with a
+# throughput, for the code generated by ANNarchy with double precision:
+#     * proj psp -- weight * pre-synaptic rate summed up, reads weight and index (8 + 4 bytes)
+#     * proj step -- update of the weight, reads and writes it and the traces
+#     * pop step -- update of the variables of a simple rate-coded or spiking neuron
+UNIT_COSTS = {
+    ("proj", "psp"): (2.0, 12.0),
+    ("proj", "step"): (4.0, 24.0),
+    ("pop", "step"): (10.0, 40.0),
+}
+
+# what is counted by the size of an object
+UNITS = {
+    "pop": "neurons",
+    "proj": "synapses",
+}
+
+# columns of throughput_table()
+THROUGHPUT_COLUMNS = ["measurement", "threads", "type", "name", "func", "size", "time (ms)", "units/s",
+                      "GFLOP/s", "GB/s", "% of roof", "bound"]
+
+
+class Roofline(object):
+    """
+    Roofline model of a machine given by its peak memory bandwidth and peak
+    floating point performance.
+    """
+    def __init__(self, bandwidth, gflops):
+        """
+        Arguments:
+            * bandwidth -- peak memory bandwidth in GB/s, e.g. measured by STREAM
+            * gflops -- peak floating point performance in GFLOP/s
+        """
+        if not bandwidth > 0 or not gflops > 0:
+            raise ValueError("The peak bandwidth and performance must be positive.")
+        self.bandwidth = float(bandwidth)
+        self.gflops = float(gflops)
+
+    def ridge(self):
+        """
+        Return the intensity (FLOP / byte) where the bandwidth roof meets the compute roof.
+        """
+        return self.gflops / self.bandwidth
+
+    def attainable(self, intensity):
+        """
+        Return the attainable GFLOP/s for the given intensities, broadcasts like numpy.
+        """
+        return np.minimum(self.gflops, self.bandwidth * np.asarray(intensity, dtype=np.float64))
+
+    def bound(self, intensity):
+        """
+        Return "memory" or "compute", the roof limiting a function with the given intensity.
+        """
+        return "memory" if intensity < self.ridge() else "compute"
+
+
+def parse_cost(text):
+    """
+    Parse the cost of a function "type:func=flop:bytes", e.g. "proj:psp=2:12".
+    Returns ((obj_type, func), (flop, bytes)), raises ValueError for other formats.
+    """
+    try:
+        function, cost = text.split("=")
+        obj_type, func = function.split(":")
+        flop, size = cost.split(":")
+        return (obj_type, func), (float(flop), float(size))
+    except ValueError:
+        raise ValueError("Invalid cost, expected type:func=flop:bytes: " + text)
+
+
+def _mean_times(data, cols):
+    """
+    Return the mean time in ms of the columns over all tests.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanmean(data.mean_values()[:, cols], axis=0)
+
+
+def _measured(data, costs):
+    """
+    Return the columns of a container with a size and a cost and the sizes.
+    """
+    sizes = data.sizes()
+    cols, values = [], []
+    for col, (obj_type, name, func) in enumerate(data.series()):
+        if (obj_type, func) in costs and (obj_type, name) in sizes:
+            cols.append(col)
+            values.append(sizes[(obj_type, name)])
+    return np.array(cols, dtype=np.int64), np.array(values, dtype=np.float64)
+
+
+def throughput_table(data, costs=UNIT_COSTS, roofline=None):
+    """
+    Return the throughput of all functions with a known size and cost. The rows
+    (see THROUGHPUT_COLUMNS) are ordered by function and threads, so the thread
+    counts of a function are next to each other. Without roofline the last two
+    columns are NaN and "".
+
+    Arguments:
+        * data -- dictionary of DataContainers by key
+        * costs -- (FLOP, bytes) per unit by (obj_type, func) -- default = UNIT_COSTS
+        * roofline (Roofline) -- the machine -- default = None
+    """
+    rows = []
+    for key, container in data.items():
+        cols, sizes = _measured(container, costs)
+        if len(cols) == 0:
+            continue
+
+        series = container.series()
+        time = _mean_times(container, cols)
+        flop = np.array([costs[(series[col][0], series[col][2])][0] for col in cols])
+        size = np.array([costs[(series[col][0], series[col][2])][1] for col in cols])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            units = sizes / (time * 1e-3)
+            gflops = units * flop * 1e-9
+            bandwidth = units * size * 1e-9
+            percent = 100.0 * gflops / roofline.attainable(flop / size) if roofline is not None else np.full(len(cols), np.nan)
+
+        for i, col in enumerate(cols):
+            obj_type, name, func = series[col]
+            bound = roofline.bound(flop[i] / size[i]) if roofline is not None else ""
+            order = (obj_type, name, func, container.paradigm() + container.rank(), container.device(),
+                     container.num_threads(), key)
+            rows.append((order, [key, container.num_threads(), obj_type, name, func, int(sizes[i]), float(time[i]),
+                                 float(units[i]), float(gflops[i]), float(bandwidth[i]), float(percent[i]), bound]))
+
+    rows.sort(key=lambda row: row[0])
+    return [row for _, row in rows]
+
+
+def roofline_points(data, costs=UNIT_COSTS):
+    """
+    Return the performance of each function type of each measurement for the
+    roofline chart. The objects are summed up, i.e. all projections computing
+    psp are one point with their total synapses and time. Returns a list of
+    (label, threads, intensity, GFLOP/s) arrays, one per function type and
+    paradigm (and device of GPU measurements), ordered by threads.
+
+    Arguments:
+        * data -- dictionary of DataContainers by key
+        * costs -- (FLOP, bytes) per unit by (obj_type, func) -- default = UNIT_COSTS
+    """
+    points = {}
+    for container in data.values():
+        cols, sizes = _measured(container, costs)
+        if len(cols) == 0:
+            continue
+
+        series = container.series()
+        time = _mean_times(container, cols)
+        for function in sorted(set((series[col][0], series[col][2]) for col in cols)):
+            selected = np.array([(series[col][0], series[col][2]) == function for col in cols])
+            total = np.nansum(time[selected]) * 1e-3
+            if not total > 0:
+                continue
+            flop, size = costs[function]
+            measurement = container.paradigm() + container.rank()
+            if container.is_gpu():
+                measurement += " " + (container.device() or "GPU")
+            label = function[0] + " " + function[1] + " (" + measurement + ")"
+            points.setdefault(label, []).append((container.num_threads(), flop / size,
+                                                 sizes[selected].sum() / total * flop * 1e-9))
+
+    result = []
+    for label in sorted(points):
+        values = np.array(sorted(points[label]))
+        result.append((label, values[:, 0].astype(np.int64), values[:, 1], values[:, 2]))
+    return result
+
+
+def plot_roofline(ax, points, roofline=None):
+    """
+    Draw the achieved GFLOP/s of functions over their intensity below the roofline
+    of the machine into a matplotlib axis, log-log scaled.
+
+    Arguments:
+        * ax -- the matplotlib axis
+        * points -- list of (label, threads, intensity, GFLOP/s) arrays, see roofline_points()
+        * roofline (Roofline) -- the machine, only the points are drawn without it -- default = None
+    """
+    intensities = [np.min(p[2]) for p in points] + [np.max(p[2]) for p in points]
+    if roofline is not None:
+        intensities.append(roofline.ridge())
+    if len(intensities) != 0:
+        x = np.logspace(np.log10(min(intensities) / 4.0), np.log10(max(intensities) * 4.0), 100)
+        if roofline is not None:
+            ax.plot(x, roofline.attainable(x), "-", color="black", linewidth=2,
+                    label="roofline (%g GB/s, %g GFLOP/s)" % (roofline.bandwidth, roofline.gflops))
+
+    # the thread counts of a function lie on a vertical line, the darkest point has the most threads
+    for i, (label, threads, intensity, gflops) in enumerate(points):
+        color = "C" + str(i % 10)
+        ax.plot(intensity, gflops, "-", color=color, alpha=0.4)
+        ax.scatter(intensity, gflops, c=[color], s=20 + 60 * np.arange(1, len(threads) + 1) / len(threads), label=label,
+                   zorder=3)
+        ax.annotate(str(threads[-1]) + " threads", (intensity[-1], gflops[-1]), textcoords="offset points",
+                    xytext=(5, 5), fontsize="small")
+
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.set_xlabel("intensity (FLOP / byte)", fontsize=18)
+    ax.set_ylabel("GFLOP/s", fontsize=18)
+    ax.grid(True, which="both", alpha=0.3)
+    ax.figure.subplots_adjust(bottom=0.15)
+    if len(points) != 0 or roofline is not None:
+        ax.legend(loc="lower right", fontsize="small")
@@ -0,0 +1,157 @@
+# ==============================================================================
+#
+#     Timeline.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+"""
+Level of detail of long traces of raw data, e.g. the time of each of 10^6
+simulation steps. A chart can not show more values than it has pixels, so
+for each zoom level only the minimum and maximum of the samples falling on
+one pixel are drawn. Their envelope looks the same as the full trace but
+needs only two points per pixel.
+
+The minima and maxima are precomputed for buckets of 4, 16, 64, ... samples
+(a pyramid of levels), so each zoom or pan only slices the level whose
+bucket size fits the visible range.
+"""
+import numpy as np
+
+# number of samples combined into one bucket of the next level
+LEVEL_FACTOR = 4
+
+
+def _reduce(values, func, factor):
+    """
+    Combine factor neighbouring values by func (np.minimum or np.maximum), the last
+    bucket may be shorter.
+    """
+    n = len(values)
+    full = n - n % factor
+    reduced = func.reduce(values[:full].reshape(-1, factor), axis=1)
+    if full != n:
+        reduced = np.append(reduced, func.reduce(values[full:]))
+    return reduced
+
+
+class MinMaxPyramid(object):
+    """
+    Minimum and maximum of a trace for buckets of LEVEL_FACTOR ** level samples.
+    Level 0 is the trace itself. The levels need about 2/3 of the memory of the
+    trace in total.
+    """
+    def __init__(self, values):
+        """
+        Compute all levels.
+
+        Arguments:
+            * values -- the trace (1D array)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        self._minima = [values]
+        self._maxima = [values]
+        while len(self._minima[-1]) > 1:
+            self._minima.append(_reduce(self._minima[-1], np.minimum, LEVEL_FACTOR))
+            self._maxima.append(_reduce(self._maxima[-1], np.maximum, LEVEL_FACTOR))
+
+    def __len__(self):
+        """
+        Return the number of samples of the trace.
+        """
+        return len(self._minima[0])
+
+    def num_levels(self):
+        """
+        Return the number of levels including the trace.
+        """
+        return len(self._minima)
+
+    def limits(self):
+        """
+        Return minimum and maximum of the whole trace.
+        """
+        if len(self) == 0:
+            return np.nan, np.nan
+        return float(self._minima[-1][0]), float(self._maxima[-1][0])
+
+    def level_for(self, start, stop, max_points):
+        """
+        Return the finest level with at most max_points buckets between the
+        samples start and stop.
+        """
+        level = 0
+        span = max(stop - start, 1)
+        while level + 1 < self.num_levels() and span > max_points * LEVEL_FACTOR ** level:
+            level += 1
+        return level
+
+    def envelope(self, start, stop, max_points):
+        """
+        Return level, x, minimum and maximum of the buckets covering the samples
+        start to stop, at most max_points buckets. x is the center of each bucket
+        in samples. On level 0 the minimum and maximum are the samples themselves.
+
+        Arguments:
+            * start, stop -- range of samples, clipped to the trace
+            * max_points -- maximal number of buckets, e.g. the width of the chart in pixels
+        """
+        start = max(int(np.floor(start)), 0)
+        stop = min(int(np.ceil(stop)), len(self))
+        if stop <= start:
+            return 0, np.zeros(0), np.zeros(0), np.zeros(0)
+
+        level = self.level_for(start, stop, max_points)
+        size = LEVEL_FACTOR ** level
+        first = start // size
+        last = -(-stop // size)
+
+        x = (np.arange(first, last) + 0.5) * size - 0.5
+        return level, x, self._minima[level][first:last], self._maxima[level][first:last]
+
+    def line(self, start, stop, max_points):
+        """
+        Return the result of envelope() as x and y of one line, which goes from
+        the minimum to the maximum of each bucket and on to the next one. The
+        samples of level 0 are returned as they are.
+        """
+        level, x, minimum, maximum = self.envelope(start, stop, max_points)
+        if level == 0:
+            return x, minimum
+        return np.repeat(x, 2), np.column_stack((minimum, maximum)).ravel()
+
+
+def trace(data, obj_type, name, func):
+    """
+    Return the raw data of one function of all tests as one trace.
+
+    Arguments:
+        * data (DataContainer) -- the measurement
+        * obj_type, name, func -- the function
+    """
+    col = data.column(obj_type, name, func)
+    return np.concatenate([data.raw_values(index, col) for index in range(data.num_tests())] + [np.zeros(0)])
+
+
+def test_starts(data, obj_type, name, func):
+    """
+    Return the first sample of each test in the trace of a function.
+    """
+    counts = data.sample_counts()[:, data.column(obj_type, name, func)]
+    return np.concatenate(([0], np.cumsum(counts)[:-1]))
@@ -0,0 +1,640 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'ProfilerWindow.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_ProfilerWindow(object):
+    def setupUi(self, ProfilerWindow):
+        ProfilerWindow.setObjectName("ProfilerWindow")
+        ProfilerWindow.resize(787, 600)
+        self.CentralWidget = QtWidgets.QWidget(ProfilerWindow)
+        self.CentralWidget.setObjectName("CentralWidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.CentralWidget)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setContentsMargins(-1, 0, -1, -1)
+        self.horizontalLayout_3.setSpacing(20)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.cmbThread = QtWidgets.QComboBox(self.CentralWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cmbThread.sizePolicy().hasHeightForWidth())
+        self.cmbThread.setSizePolicy(sizePolicy)
+        self.cmbThread.setMaximumSize(QtCore.QSize(250, 16777215))
+        self.cmbThread.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.cmbThread.setObjectName("cmbThread")
+        self.horizontalLayout_3.addWidget(self.cmbThread)
+        self.cmbScale = QtWidgets.QComboBox(self.CentralWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cmbScale.sizePolicy().hasHeightForWidth())
+        self.cmbScale.setSizePolicy(sizePolicy)
+        self.cmbScale.setMaximumSize(QtCore.QSize(200, 16777215))
+        self.cmbScale.setSizeIncrement(QtCore.QSize(0, 0))
+        self.cmbScale.setObjectName("cmbScale")
+        self.cmbScale.addItem("")
+        self.cmbScale.addItem("")
+        self.horizontalLayout_3.addWidget(self.cmbScale)
+        self.chkStdValues = QtWidgets.QCheckBox(self.CentralWidget)
+        self.chkStdValues.setChecked(True)
+        self.chkStdValues.setObjectName("chkStdValues")
+        self.horizontalLayout_3.addWidget(self.chkStdValues)
+        self.chkSteadyState = QtWidgets.QCheckBox(self.CentralWidget)
+        self.chkSteadyState.setObjectName("chkSteadyState")
+        self.horizontalLayout_3.addWidget(self.chkSteadyState)
+        self.verticalLayout.addLayout(self.horizontalLayout_3)
+        self.AnalyzerWidget = QtWidgets.QTabWidget(self.CentralWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.AnalyzerWidget.sizePolicy().hasHeightForWidth())
+        self.AnalyzerWidget.setSizePolicy(sizePolicy)
+        self.AnalyzerWidget.setTabPosition(QtWidgets.QTabWidget.North)
+        self.AnalyzerWidget.setObjectName("AnalyzerWidget")
+        self.deviation_chart = QtWidgets.QWidget()
+        self.deviation_chart.setObjectName("deviation_chart")
+        self.errorbar_chart_layout = QtWidgets.QHBoxLayout(self.deviation_chart)
+        self.errorbar_chart_layout.setObjectName("errorbar_chart_layout")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_4.setContentsMargins(-1, -1, 0, -1)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.ErrorbarChartTree = QtWidgets.QTreeWidget(self.deviation_chart)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(100)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ErrorbarChartTree.sizePolicy().hasHeightForWidth())
+        self.ErrorbarChartTree.setSizePolicy(sizePolicy)
+        self.ErrorbarChartTree.setObjectName("ErrorbarChartTree")
+        self.ErrorbarChartTree.headerItem().setText(0, "1")
+        self.ErrorbarChartTree.header().setVisible(False)
+        self.verticalLayout_4.addWidget(self.ErrorbarChartTree)
+        self.gridLayout = QtWidgets.QGridLayout()
+        self.gridLayout.setContentsMargins(-1, 0, -1, -1)
+        self.gridLayout.setObjectName("gridLayout")
+        self.cmbRawData = QtWidgets.QComboBox(self.deviation_chart)
+        self.cmbRawData.setObjectName("cmbRawData")
+        self.gridLayout.addWidget(self.cmbRawData, 1, 0, 1, 1)
+        self.lblRawData = QtWidgets.QLabel(self.deviation_chart)
+        self.lblRawData.setObjectName("lblRawData")
+        self.gridLayout.addWidget(self.lblRawData, 0, 0, 1, 1)
+        self.btnRawData = QtWidgets.QPushButton(self.deviation_chart)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.btnRawData.sizePolicy().hasHeightForWidth())
+        self.btnRawData.setSizePolicy(sizePolicy)
+        self.btnRawData.setMaximumSize(QtCore.QSize(70, 16777215))
+        self.btnRawData.setObjectName("btnRawData")
+        self.gridLayout.addWidget(self.btnRawData, 1, 1, 1, 1)
+        self.lblRecalc = QtWidgets.QLabel(self.deviation_chart)
+        self.lblRecalc.setObjectName("lblRecalc")
+        self.gridLayout.addWidget(self.lblRecalc, 2, 0, 1, 1)
+        self.cmbFilter = QtWidgets.QComboBox(self.deviation_chart)
+        self.cmbFilter.setObjectName("cmbFilter")
+        self.gridLayout.addWidget(self.cmbFilter, 3, 0, 1, 2)
+        self.txtFactor = QtWidgets.QLineEdit(self.deviation_chart)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.txtFactor.sizePolicy().hasHeightForWidth())
+        self.txtFactor.setSizePolicy(sizePolicy)
+        self.txtFactor.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.txtFactor.setObjectName("txtFactor")
+        self.gridLayout.addWidget(self.txtFactor, 4, 0, 1, 1)
+        self.btnRecalc = QtWidgets.QPushButton(self.deviation_chart)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.btnRecalc.sizePolicy().hasHeightForWidth())
+        self.btnRecalc.setSizePolicy(sizePolicy)
+        self.btnRecalc.setMaximumSize(QtCore.QSize(70, 16777215))
+        self.btnRecalc.setObjectName("btnRecalc")
+        self.gridLayout.addWidget(self.btnRecalc, 4, 1, 1, 1)
+        self.lblErrorMode = QtWidgets.QLabel(self.deviation_chart)
+        self.lblErrorMode.setObjectName("lblErrorMode")
+        self.gridLayout.addWidget(self.lblErrorMode, 5, 0, 1, 1)
+        self.cmbErrorMode = QtWidgets.QComboBox(self.deviation_chart)
+        self.cmbErrorMode.setObjectName("cmbErrorMode")
+        self.gridLayout.addWidget(self.cmbErrorMode, 6, 0, 1, 2)
+        self.lblCompare = QtWidgets.QLabel(self.deviation_chart)
+        self.lblCompare.setObjectName("lblCompare")
+        self.gridLayout.addWidget(self.lblCompare, 7, 0, 1, 1)
+        self.cmbCompare = QtWidgets.QComboBox(self.deviation_chart)
+        self.cmbCompare.setObjectName("cmbCompare")
+        self.gridLayout.addWidget(self.cmbCompare, 8, 0, 1, 1)
+        self.btnCompare = QtWidgets.QPushButton(self.deviation_chart)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.btnCompare.sizePolicy().hasHeightForWidth())
+        self.btnCompare.setSizePolicy(sizePolicy)
+        self.btnCompare.setMaximumSize(QtCore.QSize(70, 16777215))
+        self.btnCompare.setObjectName("btnCompare")
+        self.gridLayout.addWidget(self.btnCompare, 8, 1, 1, 1)
+        self.lblCompareResult = QtWidgets.QLabel(self.deviation_chart)
+        self.lblCompareResult.setWordWrap(True)
+        self.lblCompareResult.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
+        self.lblCompareResult.setObjectName("lblCompareResult")
+        self.gridLayout.addWidget(self.lblCompareResult, 9, 0, 1, 2)
+        self.verticalLayout_4.addLayout(self.gridLayout)
+        self.errorbar_chart_layout.addLayout(self.verticalLayout_4)
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_3.setContentsMargins(-1, -1, 0, -1)
+        self.verticalLayout_3.setSpacing(6)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.errorbar_chart_layout.addLayout(self.verticalLayout_3)
+        self.ErrorbarChart = ErrorbarChartWidget(self.deviation_chart)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ErrorbarChart.sizePolicy().hasHeightForWidth())
+        self.ErrorbarChart.setSizePolicy(sizePolicy)
+        self.ErrorbarChart.setObjectName("ErrorbarChart")
+        self.errorbar_chart_layout.addWidget(self.ErrorbarChart)
+        self.AnalyzerWidget.addTab(self.deviation_chart, "")
+        self.PieChartTab = QtWidgets.QWidget()
+        self.PieChartTab.setObjectName("PieChartTab")
+        self.pie_chart_layout = QtWidgets.QHBoxLayout(self.PieChartTab)
+        self.pie_chart_layout.setObjectName("pie_chart_layout")
+        self.pie_tree_layout = QtWidgets.QVBoxLayout()
+        self.pie_tree_layout.setObjectName("pie_tree_layout")
+        self.PieChartTree = QtWidgets.QTreeWidget(self.PieChartTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(100)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.PieChartTree.sizePolicy().hasHeightForWidth())
+        self.PieChartTree.setSizePolicy(sizePolicy)
+        self.PieChartTree.setObjectName("PieChartTree")
+        self.PieChartTree.headerItem().setText(0, "1")
+        self.PieChartTree.header().setVisible(False)
+        self.PieChartTree.header().setStretchLastSection(True)
+        self.pie_tree_layout.addWidget(self.PieChartTree)
+        self.cmbPieMode = QtWidgets.QComboBox(self.PieChartTab)
+        self.cmbPieMode.setObjectName("cmbPieMode")
+        self.pie_tree_layout.addWidget(self.cmbPieMode)
+        self.pie_chart_layout.addLayout(self.pie_tree_layout)
+        self.PieChart = PieChartWidget(self.PieChartTab)
+        self.PieChart.setObjectName("PieChart")
+        self.pie_chart_layout.addWidget(self.PieChart, 0, QtCore.Qt.AlignHCenter)
+        self.AnalyzerWidget.addTab(self.PieChartTab, "")
+        self.IcicleTab = QtWidgets.QWidget()
+        self.IcicleTab.setObjectName("IcicleTab")
+        self.horizontalLayout_icicle = QtWidgets.QHBoxLayout(self.IcicleTab)
+        self.horizontalLayout_icicle.setObjectName("horizontalLayout_icicle")
+        self.verticalLayout_icicle = QtWidgets.QVBoxLayout()
+        self.verticalLayout_icicle.setObjectName("verticalLayout_icicle")
+        self.IcicleSelectTree = QtWidgets.QTreeWidget(self.IcicleTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.IcicleSelectTree.sizePolicy().hasHeightForWidth())
+        self.IcicleSelectTree.setSizePolicy(sizePolicy)
+        self.IcicleSelectTree.setObjectName("IcicleSelectTree")
+        self.IcicleSelectTree.headerItem().setText(0, "1")
+        self.IcicleSelectTree.header().setVisible(False)
+        self.verticalLayout_icicle.addWidget(self.IcicleSelectTree)
+        self.lblIcicleHint = QtWidgets.QLabel(self.IcicleTab)
+        self.lblIcicleHint.setObjectName("lblIcicleHint")
+        self.verticalLayout_icicle.addWidget(self.lblIcicleHint)
+        self.horizontalLayout_icicle.addLayout(self.verticalLayout_icicle)
+        self.IcicleChart = IcicleChartWidget(self.IcicleTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.IcicleChart.sizePolicy().hasHeightForWidth())
+        self.IcicleChart.setSizePolicy(sizePolicy)
+        self.IcicleChart.setObjectName("IcicleChart")
+        self.horizontalLayout_icicle.addWidget(self.IcicleChart)
+        self.AnalyzerWidget.addTab(self.IcicleTab, "")
+        self.MultiThreadTab = QtWidgets.QWidget()
+        self.MultiThreadTab.setObjectName("MultiThreadTab")
+        self.horizontalLayout = QtWidgets.QHBoxLayout(self.MultiThreadTab)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.ThreadSelectTree = QtWidgets.QTreeWidget(self.MultiThreadTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ThreadSelectTree.sizePolicy().hasHeightForWidth())
+        self.ThreadSelectTree.setSizePolicy(sizePolicy)
+        self.ThreadSelectTree.setObjectName("ThreadSelectTree")
+        self.ThreadSelectTree.headerItem().setText(0, "1")
+        self.ThreadSelectTree.header().setVisible(False)
+        self.verticalLayout_2.addWidget(self.ThreadSelectTree)
+        self.FunctionSelectTree = QtWidgets.QTreeWidget(self.MultiThreadTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.FunctionSelectTree.sizePolicy().hasHeightForWidth())
+        self.FunctionSelectTree.setSizePolicy(sizePolicy)
+        self.FunctionSelectTree.setObjectName("FunctionSelectTree")
+        self.FunctionSelectTree.headerItem().setText(0, "1")
+        self.FunctionSelectTree.header().setVisible(False)
+        self.verticalLayout_2.addWidget(self.FunctionSelectTree)
+        self.horizontalLayout.addLayout(self.verticalLayout_2)
+        self.tabWidget = QtWidgets.QTabWidget(self.MultiThreadTab)
+        self.tabWidget.setTabPosition(QtWidgets.QTabWidget.South)
+        self.tabWidget.setObjectName("tabWidget")
+        self.MutiThreadComparisionTab = QtWidgets.QWidget()
+        self.MutiThreadComparisionTab.setObjectName("MutiThreadComparisionTab")
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout(self.MutiThreadComparisionTab)
+        self.horizontalLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.MultiThreadChart = ErrorbarChartWidget(self.MutiThreadComparisionTab)
+        self.MultiThreadChart.setObjectName("MultiThreadChart")
+        self.horizontalLayout_5.addWidget(self.MultiThreadChart)
+        self.tabWidget.addTab(self.MutiThreadComparisionTab, "")
+        self.SpeedupTab = QtWidgets.QWidget()
+        self.SpeedupTab.setObjectName("SpeedupTab")
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout(self.SpeedupTab)
+        self.horizontalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.horizontalLayout_4.setSpacing(0)
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.SpeedupChart = SpeedupChartWidget(self.SpeedupTab)
+        self.SpeedupChart.setObjectName("SpeedupChart")
+        self.horizontalLayout_4.addWidget(self.SpeedupChart)
+        self.tabWidget.addTab(self.SpeedupTab, "")
+        self.ProportionTab = QtWidgets.QWidget()
+        self.ProportionTab.setObjectName("ProportionTab")
+        self.horizontalLayout_2 = QtWidgets.QVBoxLayout(self.ProportionTab)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.BarChart = BarChartWidget(self.ProportionTab)
+        self.BarChart.setMaximumSize(QtCore.QSize(16777215, 16777215))
+        self.BarChart.setObjectName("BarChart")
+        self.horizontalLayout_2.addWidget(self.BarChart)
+        self.chkBarPercentage = QtWidgets.QCheckBox(self.ProportionTab)
+        self.chkBarPercentage.setObjectName("chkBarPercentage")
+        self.horizontalLayout_2.addWidget(self.chkBarPercentage)
+        self.tabWidget.addTab(self.ProportionTab, "")
+        self.horizontalLayout.addWidget(self.tabWidget)
+        self.AnalyzerWidget.addTab(self.MultiThreadTab, "")
+        self.TimelineTab = QtWidgets.QWidget()
+        self.TimelineTab.setObjectName("TimelineTab")
+        self.horizontalLayout_timeline = QtWidgets.QHBoxLayout(self.TimelineTab)
+        self.horizontalLayout_timeline.setObjectName("horizontalLayout_timeline")
+        self.TimelineTree = QtWidgets.QTreeWidget(self.TimelineTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(100)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.TimelineTree.sizePolicy().hasHeightForWidth())
+        self.TimelineTree.setSizePolicy(sizePolicy)
+        self.TimelineTree.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.TimelineTree.setObjectName("TimelineTree")
+        self.TimelineTree.headerItem().setText(0, "1")
+        self.TimelineTree.header().setVisible(False)
+        self.horizontalLayout_timeline.addWidget(self.TimelineTree)
+        self.TimelineChart = TimelineChartWidget(self.TimelineTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.TimelineChart.sizePolicy().hasHeightForWidth())
+        self.TimelineChart.setSizePolicy(sizePolicy)
+        self.TimelineChart.setObjectName("TimelineChart")
+        self.horizontalLayout_timeline.addWidget(self.TimelineChart)
+        self.AnalyzerWidget.addTab(self.TimelineTab, "")
+        self.PhasesTab = QtWidgets.QWidget()
+        self.PhasesTab.setObjectName("PhasesTab")
+        self.verticalLayout_phases = QtWidgets.QVBoxLayout(self.PhasesTab)
+        self.verticalLayout_phases.setObjectName("verticalLayout_phases")
+        self.lblPhasesResult = QtWidgets.QLabel(self.PhasesTab)
+        self.lblPhasesResult.setObjectName("lblPhasesResult")
+        self.verticalLayout_phases.addWidget(self.lblPhasesResult)
+        self.PhasesTable = QtWidgets.QTableWidget(self.PhasesTab)
+        self.PhasesTable.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.PhasesTable.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.PhasesTable.setObjectName("PhasesTable")
+        self.PhasesTable.setColumnCount(0)
+        self.PhasesTable.setRowCount(0)
+        self.verticalLayout_phases.addWidget(self.PhasesTable)
+        self.AnalyzerWidget.addTab(self.PhasesTab, "")
+        self.RankingTab = QtWidgets.QWidget()
+        self.RankingTab.setObjectName("RankingTab")
+        self.verticalLayout_ranking = QtWidgets.QVBoxLayout(self.RankingTab)
+        self.verticalLayout_ranking.setObjectName("verticalLayout_ranking")
+        self.RankingTable = QtWidgets.QTableWidget(self.RankingTab)
+        self.RankingTable.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.RankingTable.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.RankingTable.setObjectName("RankingTable")
+        self.RankingTable.setColumnCount(0)
+        self.RankingTable.setRowCount(0)
+        self.verticalLayout_ranking.addWidget(self.RankingTable)
+        self.AnalyzerWidget.addTab(self.RankingTab, "")
+        self.RegressionTab = QtWidgets.QWidget()
+        self.RegressionTab.setObjectName("RegressionTab")
+        self.verticalLayout_regression = QtWidgets.QVBoxLayout(self.RegressionTab)
+        self.verticalLayout_regression.setObjectName("verticalLayout_regression")
+        self.horizontalLayout_regression = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_regression.setObjectName("horizontalLayout_regression")
+        self.lblBaseline = QtWidgets.QLabel(self.RegressionTab)
+        self.lblBaseline.setObjectName("lblBaseline")
+        self.horizontalLayout_regression.addWidget(self.lblBaseline)
+        self.cmbBaseline = QtWidgets.QComboBox(self.RegressionTab)
+        self.cmbBaseline.setObjectName("cmbBaseline")
+        self.horizontalLayout_regression.addWidget(self.cmbBaseline)
+        self.lblCandidate = QtWidgets.QLabel(self.RegressionTab)
+        self.lblCandidate.setObjectName("lblCandidate")
+        self.horizontalLayout_regression.addWidget(self.lblCandidate)
+        self.cmbCandidate = QtWidgets.QComboBox(self.RegressionTab)
+        self.cmbCandidate.setObjectName("cmbCandidate")
+        self.horizontalLayout_regression.addWidget(self.cmbCandidate)
+        self.btnRegressionFile = QtWidgets.QPushButton(self.RegressionTab)
+        self.btnRegressionFile.setObjectName("btnRegressionFile")
+        self.horizontalLayout_regression.addWidget(self.btnRegressionFile)
+        self.lblThreshold = QtWidgets.QLabel(self.RegressionTab)
+        self.lblThreshold.setObjectName("lblThreshold")
+        self.horizontalLayout_regression.addWidget(self.lblThreshold)
+        self.txtThreshold = QtWidgets.QLineEdit(self.RegressionTab)
+        self.txtThreshold.setMaximumSize(QtCore.QSize(60, 16777215))
+        self.txtThreshold.setObjectName("txtThreshold")
+        self.horizontalLayout_regression.addWidget(self.txtThreshold)
+        self.btnRegression = QtWidgets.QPushButton(self.RegressionTab)
+        self.btnRegression.setObjectName("btnRegression")
+        self.horizontalLayout_regression.addWidget(self.btnRegression)
+        spacerItem = QtWidgets.QSpacerItem(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_regression.addItem(spacerItem)
+        self.verticalLayout_regression.addLayout(self.horizontalLayout_regression)
+        self.lblRegressionResult = QtWidgets.QLabel(self.RegressionTab)
+        self.lblRegressionResult.setObjectName("lblRegressionResult")
+        self.verticalLayout_regression.addWidget(self.lblRegressionResult)
+        self.RegressionTable = QtWidgets.QTableWidget(self.RegressionTab)
+        self.RegressionTable.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.RegressionTable.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.RegressionTable.setObjectName("RegressionTable")
+        self.RegressionTable.setColumnCount(0)
+        self.RegressionTable.setRowCount(0)
+        self.verticalLayout_regression.addWidget(self.RegressionTable)
+        self.AnalyzerWidget.addTab(self.RegressionTab, "")
+        self.RanksTab = QtWidgets.QWidget()
+        self.RanksTab.setObjectName("RanksTab")
+        self.verticalLayout_ranks = QtWidgets.QVBoxLayout(self.RanksTab)
+        self.verticalLayout_ranks.setObjectName("verticalLayout_ranks")
+        self.horizontalLayout_ranks = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_ranks.setObjectName("horizontalLayout_ranks")
+        self.lblRankRun = QtWidgets.QLabel(self.RanksTab)
+        self.lblRankRun.setObjectName("lblRankRun")
+        self.horizontalLayout_ranks.addWidget(self.lblRankRun)
+        self.cmbRankRun = QtWidgets.QComboBox(self.RanksTab)
+        self.cmbRankRun.setObjectName("cmbRankRun")
+        self.horizontalLayout_ranks.addWidget(self.cmbRankRun)
+        self.lblRanksResult = QtWidgets.QLabel(self.RanksTab)
+        self.lblRanksResult.setObjectName("lblRanksResult")
+        self.horizontalLayout_ranks.addWidget(self.lblRanksResult)
+        spacerItem1 = QtWidgets.QSpacerItem(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_ranks.addItem(spacerItem1)
+        self.verticalLayout_ranks.addLayout(self.horizontalLayout_ranks)
+        self.RanksTable = QtWidgets.QTableWidget(self.RanksTab)
+        self.RanksTable.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.RanksTable.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.RanksTable.setObjectName("RanksTable")
+        self.RanksTable.setColumnCount(0)
+        self.RanksTable.setRowCount(0)
+        self.verticalLayout_ranks.addWidget(self.RanksTable)
+        self.lblCriticalPath = QtWidgets.QLabel(self.RanksTab)
+        self.lblCriticalPath.setObjectName("lblCriticalPath")
+        self.verticalLayout_ranks.addWidget(self.lblCriticalPath)
+        self.CriticalPathTable = QtWidgets.QTableWidget(self.RanksTab)
+        self.CriticalPathTable.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.CriticalPathTable.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.CriticalPathTable.setObjectName("CriticalPathTable")
+        self.CriticalPathTable.setColumnCount(0)
+        self.CriticalPathTable.setRowCount(0)
+        self.verticalLayout_ranks.addWidget(self.CriticalPathTable)
+        self.AnalyzerWidget.addTab(self.RanksTab, "")
+        self.GpuTab = QtWidgets.QWidget()
+        self.GpuTab.setObjectName("GpuTab")
+        self.verticalLayout_gpu = QtWidgets.QVBoxLayout(self.GpuTab)
+        self.verticalLayout_gpu.setObjectName("verticalLayout_gpu")
+        self.horizontalLayout_gpu = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_gpu.setObjectName("horizontalLayout_gpu")
+        self.lblGpuBaseline = QtWidgets.QLabel(self.GpuTab)
+        self.lblGpuBaseline.setObjectName("lblGpuBaseline")
+        self.horizontalLayout_gpu.addWidget(self.lblGpuBaseline)
+        self.cmbGpuBaseline = QtWidgets.QComboBox(self.GpuTab)
+        self.cmbGpuBaseline.setObjectName("cmbGpuBaseline")
+        self.horizontalLayout_gpu.addWidget(self.cmbGpuBaseline)
+        self.lblGpuResult = QtWidgets.QLabel(self.GpuTab)
+        self.lblGpuResult.setObjectName("lblGpuResult")
+        self.horizontalLayout_gpu.addWidget(self.lblGpuResult)
+        spacerItem2 = QtWidgets.QSpacerItem(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_gpu.addItem(spacerItem2)
+        self.verticalLayout_gpu.addLayout(self.horizontalLayout_gpu)
+        self.GpuTable = QtWidgets.QTableWidget(self.GpuTab)
+        self.GpuTable.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.GpuTable.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.GpuTable.setObjectName("GpuTable")
+        self.GpuTable.setColumnCount(0)
+        self.GpuTable.setRowCount(0)
+        self.verticalLayout_gpu.addWidget(self.GpuTable)
+        self.AnalyzerWidget.addTab(self.GpuTab, "")
+        self.ThroughputTab = QtWidgets.QWidget()
+        self.ThroughputTab.setObjectName("ThroughputTab")
+        self.verticalLayout_throughput = QtWidgets.QVBoxLayout(self.ThroughputTab)
+        self.verticalLayout_throughput.setObjectName("verticalLayout_throughput")
+        self.horizontalLayout_throughput = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_throughput.setObjectName("horizontalLayout_throughput")
+        self.btnSizes = QtWidgets.QPushButton(self.ThroughputTab)
+        self.btnSizes.setObjectName("btnSizes")
+        self.horizontalLayout_throughput.addWidget(self.btnSizes)
+        self.lblBandwidth = QtWidgets.QLabel(self.ThroughputTab)
+        self.lblBandwidth.setObjectName("lblBandwidth")
+        self.horizontalLayout_throughput.addWidget(self.lblBandwidth)
+        self.txtBandwidth = QtWidgets.QLineEdit(self.ThroughputTab)
+        self.txtBandwidth.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.txtBandwidth.setObjectName("txtBandwidth")
+        self.horizontalLayout_throughput.addWidget(self.txtBandwidth)
+        self.lblGflops = QtWidgets.QLabel(self.ThroughputTab)
+        self.lblGflops.setObjectName("lblGflops")
+        self.horizontalLayout_throughput.addWidget(self.lblGflops)
+        self.txtGflops = QtWidgets.QLineEdit(self.ThroughputTab)
+        self.txtGflops.setMaximumSize(QtCore.QSize(80, 16777215))
+        self.txtGflops.setObjectName("txtGflops")
+        self.horizontalLayout_throughput.addWidget(self.txtGflops)
+        self.btnThroughput = QtWidgets.QPushButton(self.ThroughputTab)
+        self.btnThroughput.setObjectName("btnThroughput")
+        self.horizontalLayout_throughput.addWidget(self.btnThroughput)
+        self.lblThroughputResult = QtWidgets.QLabel(self.ThroughputTab)
+        self.lblThroughputResult.setObjectName("lblThroughputResult")
+        self.horizontalLayout_throughput.addWidget(self.lblThroughputResult)
+        spacerItem3 = QtWidgets.QSpacerItem(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_throughput.addItem(spacerItem3)
+        self.verticalLayout_throughput.addLayout(self.horizontalLayout_throughput)
+        self.ThroughputTable = QtWidgets.QTableWidget(self.ThroughputTab)
+        self.ThroughputTable.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.ThroughputTable.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.ThroughputTable.setObjectName("ThroughputTable")
+        self.ThroughputTable.setColumnCount(0)
+        self.ThroughputTable.setRowCount(0)
+        self.verticalLayout_throughput.addWidget(self.ThroughputTable)
+        self.RooflineChart = RooflineChartWidget(self.ThroughputTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(1)
+        sizePolicy.setHeightForWidth(self.RooflineChart.sizePolicy().hasHeightForWidth())
+        self.RooflineChart.setSizePolicy(sizePolicy)
+        self.RooflineChart.setObjectName("RooflineChart")
+        self.verticalLayout_throughput.addWidget(self.RooflineChart)
+        self.AnalyzerWidget.addTab(self.ThroughputTab, "")
+        self.HistoryTab = QtWidgets.QWidget()
+        self.HistoryTab.setObjectName("HistoryTab")
+        self.verticalLayout_history = QtWidgets.QVBoxLayout(self.HistoryTab)
+        self.verticalLayout_history.setObjectName("verticalLayout_history")
+        self.horizontalLayout_history = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_history.setObjectName("horizontalLayout_history")
+        self.lblHistoryCommit = QtWidgets.QLabel(self.HistoryTab)
+        self.lblHistoryCommit.setObjectName("lblHistoryCommit")
+        self.horizontalLayout_history.addWidget(self.lblHistoryCommit)
+        self.txtHistoryCommit = QtWidgets.QLineEdit(self.HistoryTab)
+        self.txtHistoryCommit.setObjectName("txtHistoryCommit")
+        self.horizontalLayout_history.addWidget(self.txtHistoryCommit)
+        self.lblHistoryHost = QtWidgets.QLabel(self.HistoryTab)
+        self.lblHistoryHost.setObjectName("lblHistoryHost")
+        self.horizontalLayout_history.addWidget(self.lblHistoryHost)
+        self.txtHistoryHost = QtWidgets.QLineEdit(self.HistoryTab)
+        self.txtHistoryHost.setObjectName("txtHistoryHost")
+        self.horizontalLayout_history.addWidget(self.txtHistoryHost)
+        self.btnHistoryIngest = QtWidgets.QPushButton(self.HistoryTab)
+        self.btnHistoryIngest.setObjectName("btnHistoryIngest")
+        self.horizontalLayout_history.addWidget(self.btnHistoryIngest)
+        self.verticalLayout_history.addLayout(self.horizontalLayout_history)
+        self.horizontalLayout_history_select = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_history_select.setObjectName("horizontalLayout_history_select")
+        self.cmbHistoryFunction = QtWidgets.QComboBox(self.HistoryTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cmbHistoryFunction.sizePolicy().hasHeightForWidth())
+        self.cmbHistoryFunction.setSizePolicy(sizePolicy)
+        self.cmbHistoryFunction.setObjectName("cmbHistoryFunction")
+        self.horizontalLayout_history_select.addWidget(self.cmbHistoryFunction)
+        self.cmbHistoryConfig = QtWidgets.QComboBox(self.HistoryTab)
+        self.cmbHistoryConfig.setObjectName("cmbHistoryConfig")
+        self.horizontalLayout_history_select.addWidget(self.cmbHistoryConfig)
+        self.verticalLayout_history.addLayout(self.horizontalLayout_history_select)
+        self.lblHistoryResult = QtWidgets.QLabel(self.HistoryTab)
+        self.lblHistoryResult.setObjectName("lblHistoryResult")
+        self.verticalLayout_history.addWidget(self.lblHistoryResult)
+        self.HistoryChart = HistoryChartWidget(self.HistoryTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(1)
+        sizePolicy.setHeightForWidth(self.HistoryChart.sizePolicy().hasHeightForWidth())
+        self.HistoryChart.setSizePolicy(sizePolicy)
+        self.HistoryChart.setObjectName("HistoryChart")
+        self.verticalLayout_history.addWidget(self.HistoryChart)
+        self.AnalyzerWidget.addTab(self.HistoryTab, "")
+        self.verticalLayout.addWidget(self.AnalyzerWidget)
+        ProfilerWindow.setCentralWidget(self.CentralWidget)
+        self.menubar = QtWidgets.QMenuBar(ProfilerWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 787, 20))
+        self.menubar.setObjectName("menubar")
+        self.menuStart = QtWidgets.QMenu(self.menubar)
+        self.menuStart.setObjectName("menuStart")
+        ProfilerWindow.setMenuBar(self.menubar)
+        self.btnLoadData = QtWidgets.QAction(ProfilerWindow)
+        self.btnLoadData.setObjectName("btnLoadData")
+        self.btnRunMeasurement = QtWidgets.QAction(ProfilerWindow)
+        self.btnRunMeasurement.setObjectName("btnRunMeasurement")
+        self.btnSave = QtWidgets.QAction(ProfilerWindow)
+        self.btnSave.setObjectName("btnSave")
+        self.menuStart.addAction(self.btnLoadData)
+        self.menuStart.addAction(self.btnRunMeasurement)
+        self.menuStart.addAction(self.btnSave)
+        self.menubar.addAction(self.menuStart.menuAction())
+
+        self.retranslateUi(ProfilerWindow)
+        self.AnalyzerWidget.setCurrentIndex(2)
+        self.tabWidget.setCurrentIndex(0)
+        QtCore.QMetaObject.connectSlotsByName(ProfilerWindow)
+
+    def retranslateUi(self, ProfilerWindow):
+        _translate = QtCore.QCoreApplication.translate
+        ProfilerWindow.setWindowTitle(_translate("ProfilerWindow", "ANNarchy Profiler"))
+        self.cmbScale.setItemText(0, _translate("ProfilerWindow", "linear"))
+        self.cmbScale.setItemText(1, _translate("ProfilerWindow", "log"))
+        self.chkStdValues.setText(_translate("ProfilerWindow", "Show std values"))
+        self.chkSteadyState.setToolTip(_translate("ProfilerWindow", "Drop the warm-up at the start of each test, the values are computed over the steady state only"))
+        self.chkSteadyState.setText(_translate("ProfilerWindow", "Steady state only"))
+        self.lblRawData.setText(_translate("ProfilerWindow", "Raw data"))
+        self.btnRawData.setText(_translate("ProfilerWindow", "Show"))
+        self.lblRecalc.setText(_translate("ProfilerWindow", "Recalc mean values"))
+        self.cmbFilter.setToolTip(_translate("ProfilerWindow", "Outlier filter"))
+        self.txtFactor.setPlaceholderText(_translate("ProfilerWindow", "factor"))
+        self.btnRecalc.setText(_translate("ProfilerWindow", "Show"))
+        self.lblErrorMode.setText(_translate("ProfilerWindow", "Error bars"))
+        self.cmbErrorMode.setToolTip(_translate("ProfilerWindow", "Error bars of the mean values, the confidence intervals are computed by bootstrap from the raw data"))
+        self.lblCompare.setText(_translate("ProfilerWindow", "Compare with"))
+        self.cmbCompare.setToolTip(_translate("ProfilerWindow", "Measurement to compare the raw data of the selected function with"))
+        self.btnCompare.setText(_translate("ProfilerWindow", "Test"))
+        self.AnalyzerWidget.setTabText(self.AnalyzerWidget.indexOf(self.deviation_chart), _translate("ProfilerWindow", "Standard deviation"))
+        self.cmbPieMode.setToolTip(_translate("ProfilerWindow", "Pie chart of the parts of the selected node or sunburst of all its descendants"))
+        self.AnalyzerWidget.setTabText(self.AnalyzerWidget.indexOf(self.PieChartTab), _translate("ProfilerWindow", "Pie chart"))
+        self.IcicleSelectTree.setToolTip(_translate("ProfilerWindow", "Measurements drawn below each other"))
+        self.lblIcicleHint.setText(_translate("ProfilerWindow", "Click a bar to zoom in,\n"
+"right click to zoom out."))
+        self.AnalyzerWidget.setTabText(self.AnalyzerWidget.indexOf(self.IcicleTab), _translate("ProfilerWindow", "Flame graph"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.MutiThreadComparisionTab), _translate("ProfilerWindow", "Multi-Thread Comparision"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.SpeedupTab), _translate("ProfilerWindow", "Speedup"))
+        self.chkBarPercentage.setToolTip(_translate("ProfilerWindow", "Show the parts of each network step in percent"))
+        self.chkBarPercentage.setText(_translate("ProfilerWindow", "Relative (%)"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.ProportionTab), _translate("ProfilerWindow", "Proportion"))
+        self.AnalyzerWidget.setTabText(self.AnalyzerWidget.indexOf(self.MultiThreadTab), _translate("ProfilerWindow", "Multi-Thread"))
+        self.TimelineTree.setToolTip(_translate("ProfilerWindow", "Functions shown in the timeline, select several with Ctrl"))
+        self.AnalyzerWidget.setTabText(self.AnalyzerWidget.indexOf(self.TimelineTab), _translate("ProfilerWindow", "Timeline"))
+        self.PhasesTable.setSortingEnabled(True)
+        self.AnalyzerWidget.setTabText(self.AnalyzerWidget.indexOf(self.PhasesTab), _translate("ProfilerWindow", "Warm-up"))
+        self.RankingTable.setToolTip(_translate("ProfilerWindow", "Speedup, efficiency and time lost to imperfect scaling of all population and projection functions"))
+        self.RankingTable.setSortingEnabled(True)
+        self.AnalyzerWidget.setTabText(self.AnalyzerWidget.indexOf(self.RankingTab), _translate("ProfilerWindow", "Ranking"))
+        self.lblBaseline.setText(_translate("ProfilerWindow", "Baseline"))
+        self.lblCandidate.setText(_translate("ProfilerWindow", "Candidate"))
+        self.btnRegressionFile.setToolTip(_translate("ProfilerWindow", "Open a profiling file for the comparison only, e.g. the same configuration of another build"))
+        self.btnRegressionFile.setText(_translate("ProfilerWindow", "Open file ..."))
+        self.lblThreshold.setText(_translate("ProfilerWindow", "Threshold (%)"))
+        self.txtThreshold.setText(_translate("ProfilerWindow", "5"))
+        self.btnRegression.setText(_translate("ProfilerWindow", "Compare"))
+        self.RegressionTable.setSortingEnabled(True)
+        self.AnalyzerWidget.setTabText(self.AnalyzerWidget.indexOf(self.RegressionTab), _translate("ProfilerWindow", "Regression"))
+        self.lblRankRun.setText(_translate("ProfilerWindow", "MPI run"))
+        self.cmbRankRun.setToolTip(_translate("ProfilerWindow", "Measurements with the same paradigm and number of threads, one for each rank"))
+        self.RanksTable.setSortingEnabled(True)
+        self.lblCriticalPath.setText(_translate("ProfilerWindow", "Critical path of the network step"))
+        self.CriticalPathTable.setSortingEnabled(True)
+        self.AnalyzerWidget.setTabText(self.AnalyzerWidget.indexOf(self.RanksTab), _translate("ProfilerWindow", "MPI ranks"))
+        self.lblGpuBaseline.setText(_translate("ProfilerWindow", "Baseline"))
+        self.cmbGpuBaseline.setToolTip(_translate("ProfilerWindow", "Measurement of another paradigm the GPU measurements are compared with, e.g. OpenMP with the best number of threads"))
+        self.GpuTable.setSortingEnabled(True)
+        self.AnalyzerWidget.setTabText(self.AnalyzerWidget.indexOf(self.GpuTab), _translate("ProfilerWindow", "GPU"))
+        self.btnSizes.setToolTip(_translate("ProfilerWindow", "Read the number of neurons and synapses from a JSON file, e.g. {\"pop\": {\"pop0\": 1000}, \"proj\": {\"proj0\": 100000}}"))
+        self.btnSizes.setText(_translate("ProfilerWindow", "Load sizes ..."))
+        self.lblBandwidth.setText(_translate("ProfilerWindow", "Peak bandwidth (GB/s)"))
+        self.txtBandwidth.setToolTip(_translate("ProfilerWindow", "Memory bandwidth of the machine, e.g. measured by STREAM"))
+        self.lblGflops.setText(_translate("ProfilerWindow", "Peak GFLOP/s"))
+        self.btnThroughput.setText(_translate("ProfilerWindow", "Compute"))
+        self.ThroughputTable.setSortingEnabled(True)
+        self.AnalyzerWidget.setTabText(self.AnalyzerWidget.indexOf(self.ThroughputTab), _translate("ProfilerWindow", "Throughput"))
+        self.lblHistoryCommit.setText(_translate("ProfilerWindow", "Commit"))
+        self.txtHistoryCommit.setToolTip(_translate("ProfilerWindow", "Version of the added runs, e.g. a git commit"))
+        self.lblHistoryHost.setText(_translate("ProfilerWindow", "Host"))
+        self.txtHistoryHost.setToolTip(_translate("ProfilerWindow", "Machine of the added runs"))
+        self.btnHistoryIngest.setToolTip(_translate("ProfilerWindow", "Add profiling files to the history, files added before are skipped"))
+        self.btnHistoryIngest.setText(_translate("ProfilerWindow", "Add files ..."))
+        self.AnalyzerWidget.setTabText(self.AnalyzerWidget.indexOf(self.HistoryTab), _translate("ProfilerWindow", "History"))
+        self.menuStart.setTitle(_translate("ProfilerWindow", "Start"))
+        self.btnLoadData.setText(_translate("ProfilerWindow", "Load data"))
+        self.btnLoadData.setShortcut(_translate("ProfilerWindow", "Ctrl+O"))
+        self.btnRunMeasurement.setText(_translate("ProfilerWindow", "Run measurement"))
+        self.btnRunMeasurement.setShortcut(_translate("ProfilerWindow", "Ctrl+R"))
+        self.btnSave.setText(_translate("ProfilerWindow", "Save"))
+        self.btnSave.setShortcut(_translate("ProfilerWindow", "Ctrl+S"))
+from Charts import BarChartWidget, ErrorbarChartWidget, HistoryChartWidget, IcicleChartWidget, PieChartWidget, RooflineChartWidget, SpeedupChartWidget, TimelineChartWidget
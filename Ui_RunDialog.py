@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'RunDialog.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(590, 290)
+        self.gridLayout = QtWidgets.QGridLayout(Dialog)
+        self.gridLayout.setObjectName("gridLayout")
+        self.btnScript = QtWidgets.QPushButton(Dialog)
+        self.btnScript.setObjectName("btnScript")
+        self.gridLayout.addWidget(self.btnScript, 1, 2, 1, 1)
+        self.txtScript = QtWidgets.QLineEdit(Dialog)
+        self.txtScript.setObjectName("txtScript")
+        self.gridLayout.addWidget(self.txtScript, 1, 1, 1, 1)
+        self.lblPath_2 = QtWidgets.QLabel(Dialog)
+        self.lblPath_2.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.lblPath_2.setObjectName("lblPath_2")
+        self.gridLayout.addWidget(self.lblPath_2, 2, 0, 1, 1)
+        self.lblPath = QtWidgets.QLabel(Dialog)
+        self.lblPath.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.lblPath.setObjectName("lblPath")
+        self.gridLayout.addWidget(self.lblPath, 0, 0, 1, 1)
+        self.lblScript = QtWidgets.QLabel(Dialog)
+        self.lblScript.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.lblScript.setObjectName("lblScript")
+        self.gridLayout.addWidget(self.lblScript, 1, 0, 1, 1)
+        self.btnPath = QtWidgets.QPushButton(Dialog)
+        self.btnPath.setObjectName("btnPath")
+        self.gridLayout.addWidget(self.btnPath, 0, 2, 1, 1)
+        self.txtPath = QtWidgets.QLineEdit(Dialog)
+        self.txtPath.setObjectName("txtPath")
+        self.gridLayout.addWidget(self.txtPath, 0, 1, 1, 1)
+        self.txtArgs = QtWidgets.QLineEdit(Dialog)
+        self.txtArgs.setObjectName("txtArgs")
+        self.gridLayout.addWidget(self.txtArgs, 2, 1, 1, 1)
+        self.lblThreads = QtWidgets.QLabel(Dialog)
+        self.lblThreads.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.lblThreads.setObjectName("lblThreads")
+        self.gridLayout.addWidget(self.lblThreads, 3, 0, 1, 1)
+        self.txtThreads = QtWidgets.QLineEdit(Dialog)
+        self.txtThreads.setObjectName("txtThreads")
+        self.gridLayout.addWidget(self.txtThreads, 3, 1, 1, 1)
+        self.lblParadigm = QtWidgets.QLabel(Dialog)
+        self.lblParadigm.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.lblParadigm.setObjectName("lblParadigm")
+        self.gridLayout.addWidget(self.lblParadigm, 4, 0, 1, 1)
+        self.cmbParadigm = QtWidgets.QComboBox(Dialog)
+        self.cmbParadigm.setObjectName("cmbParadigm")
+        self.gridLayout.addWidget(self.cmbParadigm, 4, 1, 1, 1)
+        self.lblParallel = QtWidgets.QLabel(Dialog)
+        self.lblParallel.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.lblParallel.setObjectName("lblParallel")
+        self.gridLayout.addWidget(self.lblParallel, 5, 0, 1, 1)
+        self.spnParallel = QtWidgets.QSpinBox(Dialog)
+        self.spnParallel.setMaximum(256)
+        self.spnParallel.setObjectName("spnParallel")
+        self.gridLayout.addWidget(self.spnParallel, 5, 1, 1, 1)
+        self.buttonBox = QtWidgets.QDialogButtonBox(Dialog)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel|QtWidgets.QDialogButtonBox.Ok)
+        self.buttonBox.setObjectName("buttonBox")
+        self.gridLayout.addWidget(self.buttonBox, 6, 1, 1, 1)
+
+        self.retranslateUi(Dialog)
+        self.buttonBox.accepted.connect(Dialog.accept) # type: ignore
+        self.buttonBox.rejected.connect(Dialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Dialog"))
+        self.btnScript.setText(_translate("Dialog", "select script"))
+        self.lblPath_2.setText(_translate("Dialog", "arguments"))
+        self.lblPath.setText(_translate("Dialog", "working directory"))
+        self.lblScript.setText(_translate("Dialog", "script"))
+        self.btnPath.setText(_translate("Dialog", "select path"))
+        self.lblThreads.setText(_translate("Dialog", "threads"))
+        self.txtThreads.setText(_translate("Dialog", "1,2,4,8"))
+        self.txtThreads.setToolTip(_translate("Dialog", "Thread counts, e.g. 1,2,4 or 1-64"))
+        self.lblParadigm.setText(_translate("Dialog", "paradigm"))
+        self.lblParallel.setText(_translate("Dialog", "parallel runs"))
+        self.spnParallel.setSpecialValueText(_translate("Dialog", "automatic"))
+        self.spnParallel.setToolTip(_translate("Dialog", "Maximum number of runs at the same time, each run gets its own cores"))
@@ -0,0 +1,194 @@
+# ==============================================================================
+#
+#     Workers.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+import functools
+import traceback
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class WorkerSignals(QObject):
+    """
+    Signals of a Worker. They are emitted in the thread of the pool and
+    delivered in the GUI thread.
+    """
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+    progress = pyqtSignal(int, int)
+    intermediate = pyqtSignal(object)
+
+
+class Worker(QRunnable):
+    """
+    Executes a function in a thread of the QThreadPool. The result is
+    posted back by the finished signal.
+    """
+    def __init__(self, fn, *args, **kwargs):
+        """
+        Initialization.
+
+        Arguments:
+            * fn -- function to execute, it must not access Qt widgets
+            * args, kwargs -- arguments of fn
+        """
+        super(Worker, self).__init__()
+        self.setAutoDelete(False)
+
+        self.signals = WorkerSignals()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._cancelled = False
+
+    def cancel(self):
+        """
+        Mark the result of this worker as outdated. A running function is not
+        interrupted, but it can poll is_cancelled() to stop early.
+        """
+        self._cancelled = True
+
+    def is_cancelled(self):
+        """
+        Return true if the worker was cancelled.
+        """
+        return self._cancelled
+
+    def run(self):
+        """
+        Execute the function, called by the QThreadPool.
+        """
+        try:
+            result = self._fn(*self._args, **self._kwargs)
+        except Exception:
+            self.signals.error.emit(traceback.format_exc())
+            return
+
+        self.signals.finished.emit(result)
+
+
+class TaskManager(QObject):
+    """
+    Runs functions in background workers. There is at most one pending
+    request per channel (e.g. one per chart): submitting a new request
+    cancels the older one, so only the result of the latest selection
+    is delivered.
+    """
+    def __init__(self, parent=None, error=None):
+        """
+        Initialization.
+
+        Arguments:
+            * parent -- parent element of this object -- default = None
+            * error -- function called with the traceback of a failed request, see submit() -- default = print
+        """
+        super(TaskManager, self).__init__(parent)
+
+        self._error = error if error is not None else print
+        self._pool = QThreadPool.globalInstance()
+        self._workers = {}      # latest request of each channel
+        self._running = set()   # keeps the workers alive until they are done
+
+    def submit(self, channel, fn, callback, *args, progress=None, intermediate=None, cancellable=False, error=None,
+               **kwargs):
+        """
+        Execute fn(*args, **kwargs) in the background and call callback with the
+        result in the GUI thread. Returns the Worker.
+
+        If progress is given, fn is called with the additional keyword argument
+        progress, a function fn can call with (done, total) to report its progress.
+        The values are passed to the progress function in the GUI thread. In the
+        same way, fn gets the keyword argument intermediate if intermediate is
+        given, to deliver partial results before it is done. If cancellable is
+        true, fn gets the keyword argument cancelled, a function returning true
+        once the request is cancelled.
+
+        Arguments:
+            * channel (str) -- name of the request type, an older request of the same channel is cancelled
+            * fn -- function to execute
+            * callback -- function called with the result of fn
+            * progress -- function called with the progress of fn -- default = None
+            * intermediate -- function called with the partial results of fn -- default = None
+            * cancellable -- pass the cancelled function to fn -- default = False
+            * error -- function called with the traceback if fn raises an exception -- default = see __init__()
+        """
+        self.cancel(channel)
+
+        if progress is not None:
+            fn = functools.partial(fn, progress=lambda done, total: worker.signals.progress.emit(done, total))
+        if intermediate is not None:
+            fn = functools.partial(fn, intermediate=lambda result: worker.signals.intermediate.emit(result))
+        if cancellable:
+            fn = functools.partial(fn, cancelled=lambda: worker.is_cancelled())
+
+        worker = Worker(fn, *args, **kwargs)
+        if progress is not None:
+            worker.signals.progress.connect(progress)
+        if intermediate is not None:
+            worker.signals.intermediate.connect(lambda result: worker.is_cancelled() or intermediate(result))
+        worker.signals.finished.connect(lambda result: self._finished(channel, worker, callback, result))
+        worker.signals.error.connect(lambda msg: self._failed(channel, worker, error or self._error, msg))
+        self._workers[channel] = worker
+        self._running.add(worker)
+        self._pool.start(worker)
+
+        return worker
+
+    def cancel(self, channel):
+        """
+        Cancel the pending request of a channel.
+
+        Arguments:
+            * channel (str) -- name of the request type
+        """
+        worker = self._workers.pop(channel, None)
+        if worker is not None:
+            worker.cancel()
+            # not yet started workers are removed from the queue
+            if self._pool.tryTake(worker):
+                self._running.discard(worker)
+
+    def wait(self):
+        """
+        Block until all workers are done.
+        """
+        self._pool.waitForDone()
+
+    def _finished(self, channel, worker, callback, result):
+        """
+        Deliver the result of a worker if it is still the latest request of its channel.
+        """
+        self._running.discard(worker)
+        if worker.is_cancelled() or self._workers.get(channel) is not worker:
+            return
+
+        del self._workers[channel]
+        callback(result)
+
+    def _failed(self, channel, worker, error, msg):
+        """
+        Report an exception raised by a worker.
+        """
+        self._running.discard(worker)
+        if self._workers.get(channel) is worker:
+            del self._workers[channel]
+        error(msg)
@@ -23,9 +23,6 @@
 #==============================================================================
 import sys
 
-from PyQt5.QtWidgets import QApplication
-from ProfilerWindow import ProfilerWindow
-
 """
 ANNarchyProfiler is an extension for neuron simulator ANNarchy. This tool help to analyze
 the rim of a script. The data of the profiler will be shown in graph. So it is possible to
@@ -35,9 +32,23 @@ Start the tool with following command:
 
     $ python main.py
 
+Without display, e.g. on compute nodes, the data can be analyzed on the command line
+(see ProfilerCli.py), in this case PyQt5 is not imported:
+
+    $ python main.py report measurement.xml
+
 This tool is on github: https://github.com/hdinkelbach/ANNarchyProfiler
 """
 if __name__ == '__main__':
+    from ProfilerCli import COMMANDS
+
+    if len(sys.argv) > 1 and sys.argv[1] in COMMANDS:
+        from ProfilerCli import main
+        sys.exit(main(sys.argv[1:]))
+
+    from PyQt5.QtWidgets import QApplication
+    from ProfilerWindow import ProfilerWindow
+
     app = QApplication(sys.argv)
     window = ProfilerWindow()
     window.show()
@@ -0,0 +1,77 @@
+#==============================================================================
+#
+#     benchmark_startup.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#==============================================================================
+"""
+Measures the start time of the application, i.e. the time from the start of
+the interpreter until the main window is shown. Each run is a new process, so
+the imports are measured as well. Exits with 1 if the median exceeds the limit:
+
+    $ python benchmark_startup.py --runs 5 --limit 1.0
+
+Without display, the Qt platform "offscreen" is used.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+# executed in a new interpreter, prints the elapsed time
+STARTUP_SCRIPT = """
+import time
+start = time.time()
+
+import sys
+from PyQt5.QtWidgets import QApplication
+from ProfilerWindow import ProfilerWindow
+
+app = QApplication(sys.argv)
+window = ProfilerWindow()
+window.show()
+app.processEvents()
+
+print(time.time() - start)
+"""
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measure the start time of the ANNarchyProfiler.")
+    parser.add_argument("--runs", type=int, default=5, help="number of measurements -- default = 5")
+    parser.add_argument("--limit", type=float, default=1.0, help="maximum median start time in seconds -- default = 1.0")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if not "DISPLAY" in env and not "WAYLAND_DISPLAY" in env and sys.platform.startswith("linux"):
+        env["QT_QPA_PLATFORM"] = "offscreen"
+
+    path = os.path.dirname(os.path.abspath(__file__))
+    times = []
+    for _ in range(args.runs):
+        out = subprocess.check_output([sys.executable, "-c", STARTUP_SCRIPT], cwd=path, env=env)
+        times.append(float(out.decode().strip().splitlines()[-1]))
+
+    times.sort()
+    median = times[len(times) // 2]
+    print("start time: median %.3f s, min %.3f s, max %.3f s (%d runs)" % (median, times[0], times[-1], len(times)))
+
+    if median > args.limit:
+        print("start time exceeds the limit of %.3f s" % args.limit)
+        sys.exit(1)
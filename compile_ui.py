@@ -0,0 +1,45 @@
+#==============================================================================
+#
+#     compile_ui.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#==============================================================================
+"""
+Compiles the Qt Designer files (*.ui) into Python modules (Ui_*.py), so they
+need not be parsed at each start of the application. Run it after changing
+one of the *.ui files:
+
+    $ python compile_ui.py
+"""
+import os
+
+from PyQt5.uic import compileUi
+
+UI_FILES = ["ProfilerWindow", "RunDialog"]
+
+if __name__ == '__main__':
+    # relative file names, the name of the ui file is written into the module
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    for name in UI_FILES:
+        with open(name + ".ui") as ui_file:
+            with open("Ui_" + name + ".py", "w") as py_file:
+                compileUi(ui_file, py_file)
+        print("Compiled " + name + ".ui")
@@ -0,0 +1,71 @@
+# ==============================================================================
+#
+#     conftest.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+"""
+Shared fixtures of the tests. The modules of the profiler are imported from
+the directory above.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def profile_xml(datasets, paradigm="openmp", num_threads=1, rank="0", config=""):
+    """
+    Return the content of a profiling file.
+
+    Arguments:
+        * datasets -- list of tests, each a list of (obj_type, name, func, raw values) starting
+          with the function global_op of the network like in the files of ANNarchy, the
+          mean may follow as fifth value, e.g. for datasets without raw values
+        * paradigm, num_threads, rank -- configuration of the measurement
+        * config -- further entries of the configuration, e.g. "<device>V100</device>"
+    """
+    lines = ["<root>", "<config>", "<paradigm>%s</paradigm>" % paradigm,
+             "<num_threads>%d</num_threads>" % num_threads, "<rank>%s</rank>" % rank, config, "</config>"]
+    for test in datasets:
+        for obj_type, name, func, raw, *given in test:
+            mean = given[0] if given else sum(raw) / float(len(raw))
+            std = (sum((x - mean) ** 2 for x in raw) / float(len(raw))) ** 0.5 if len(raw) else 0.0
+            lines += ["<dataset>", "<obj_type>%s</obj_type>" % obj_type, "<name>%s</name>" % name,
+                      "<func>%s</func>" % func, "<mean>%r</mean>" % float(mean), "<std>%r</std>" % float(std),
+                      "<raw_data>%s</raw_data>" % " ".join(repr(float(x)) for x in raw), "</dataset>"]
+    lines.append("</root>")
+    return "\n".join(lines) + "\n"
+
+
+@pytest.fixture
+def write_profile(tmp_path):
+    """
+    Return a function which writes a profiling file into the temporary directory,
+    see profile_xml() for the arguments, and returns its path.
+    """
+    def write(fname, datasets, **kwargs):
+        path = str(tmp_path / fname)
+        with open(path, "w") as f:
+            f.write(profile_xml(datasets, **kwargs))
+        return path
+    return write
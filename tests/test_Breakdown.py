@@ -0,0 +1,101 @@
+# ==============================================================================
+#
+#     test_Breakdown.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+import numpy as np
+import pytest
+
+from Breakdown import Breakdown, OVERHEAD, stack_parts
+from DataContainer import DataContainer
+
+# proj1 is not measured in the second test
+DATASETS = [
+    [("net", "network", "global_op", [0.5]), ("net", "network", "step", [10.0]), ("net", "network", "psp", [4.0]),
+     ("net", "network", "neur_step", [3.0]), ("proj", "proj0", "psp", [1.5]), ("proj", "proj1", "psp", [2.0]),
+     ("pop", "pop0", "step", [1.0]), ("pop", "pop1", "step", [1.5])],
+    [("net", "network", "global_op", [0.5]), ("net", "network", "step", [8.0]), ("net", "network", "psp", [3.0]),
+     ("net", "network", "neur_step", [3.0]), ("proj", "proj0", "psp", [1.0]),
+     ("pop", "pop0", "step", [1.0]), ("pop", "pop1", "step", [1.5])],
+]
+
+LABELS = ["step", "global_op", "psp", "proj0", "proj1", OVERHEAD, "neur_step", "pop0", "pop1", OVERHEAD, OVERHEAD]
+
+
+@pytest.fixture
+def breakdown(write_profile):
+    data = DataContainer()
+    assert data.load_data(write_profile("profile.xml", DATASETS))
+    return Breakdown(data)
+
+
+def test_hierarchy(breakdown):
+    assert breakdown.labels == LABELS
+    np.testing.assert_array_equal(breakdown.parent, [-1, 0, 0, 2, 2, 2, 0, 6, 6, 6, 0])
+    np.testing.assert_array_equal(breakdown.depth, [0, 1, 1, 2, 2, 2, 1, 2, 2, 2, 1])
+    assert breakdown.children(2) == [3, 4, 5]
+    assert breakdown.node("pop", "pop1", "step") == 8
+    assert breakdown.series[5] is None
+    assert breakdown.path(8) == ["step", "neur_step", "pop1"]
+    assert breakdown.find(["step", "neur_step", "pop1"]) == 8
+    with pytest.raises(KeyError):
+        breakdown.find(["step", "pop1"])
+    np.testing.assert_array_equal(breakdown.subtree(2), [2, 3, 4, 5])
+
+
+def test_inclusive_exclusive(breakdown):
+    # step: 10 - 0.5 - 4 - 3, psp: 4 - 1.5 - 2, neur_step: 3 - 1 - 1.5
+    np.testing.assert_allclose(breakdown.inclusive[0], [10.0, 0.5, 4.0, 1.5, 2.0, 0.5, 3.0, 1.0, 1.5, 0.5, 2.5])
+    np.testing.assert_allclose(breakdown.exclusive[0], [2.5, 0.5, 0.5, 1.5, 2.0, 0.5, 0.5, 1.0, 1.5, 0.5, 2.5])
+
+    # a missing child counts as 0 in the exclusive time of its parent
+    np.testing.assert_allclose(breakdown.inclusive[1], [8.0, 0.5, 3.0, 1.0, np.nan, 2.0, 3.0, 1.0, 1.5, 0.5, 1.5])
+    np.testing.assert_allclose(breakdown.exclusive[1], [1.5, 0.5, 2.0, 1.0, np.nan, 2.0, 0.5, 1.0, 1.5, 0.5, 1.5])
+
+    np.testing.assert_allclose(breakdown.mean_inclusive()[[0, 4]], [9.0, 2.0])
+    assert breakdown.parts(0, 2) == [("proj0", 1.5), ("proj1", 2.0), (OVERHEAD, 0.5)]
+
+
+def test_spans(breakdown):
+    nodes, start, width, depth = breakdown.spans(2, breakdown.inclusive[1])
+
+    np.testing.assert_array_equal(nodes, [2, 3, 4, 5])
+    np.testing.assert_array_equal(depth, [0, 1, 1, 1])
+    np.testing.assert_allclose(width, [3.0, 1.0, 0.0, 2.0])
+    np.testing.assert_allclose(start, [0.0, 0.0, 1.0, 1.0])
+
+
+def test_stack_parts(breakdown):
+    parts, values = stack_parts([breakdown])
+
+    assert parts[-1] == OVERHEAD and "global_op" in parts
+    np.testing.assert_allclose(values[parts.index("psp"), 0], 3.5)
+    np.testing.assert_allclose(values[parts.index(OVERHEAD), 0], 2.0)
+
+
+def test_without_step(write_profile):
+    data = DataContainer()
+    assert data.load_data(write_profile("profile.xml", [[("net", "network", "global_op", [0.5])]]))
+    breakdown = Breakdown(data)
+
+    assert len(breakdown) == 0
+    with pytest.raises(KeyError):
+        breakdown.find(["step"])
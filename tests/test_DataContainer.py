@@ -0,0 +1,210 @@
+# ==============================================================================
+#
+#     test_DataContainer.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+import numpy as np
+import pytest
+from lxml import etree
+
+from DataContainer import DataContainer
+
+
+@pytest.mark.parametrize("text", ["", " ", "\n", " \n\t "])
+def test_convert_empty(text):
+    values = DataContainer()._convert_string_to_array(text)
+
+    assert values.dtype == np.float64
+    assert len(values) == 0
+
+
+def test_convert():
+    convert = DataContainer()._convert_string_to_array
+
+    np.testing.assert_array_equal(convert(" 1 2.5\n3e-1 "), [1.0, 2.5, 0.3])
+    # invalid tokens are skipped
+    np.testing.assert_array_equal(convert("abc 1 2 x1"), [1.0, 2.0])
+    assert np.isnan(convert("1 nan 2")[1])
+
+
+def test_empty_raw_data(tmp_path):
+    fname = str(tmp_path / "profile.xml")
+    with open(fname, "w") as f:
+        f.write("<root><config><paradigm>openmp</paradigm><num_threads>1</num_threads></config>"
+                "<dataset><obj_type>net</obj_type><name>network</name><func>global_op</func>"
+                "<mean>0.5</mean><std>0</std><raw_data> </raw_data></dataset>"
+                "<dataset><obj_type>net</obj_type><name>network</name><func>step</func>"
+                "<mean>1.5</mean><std>0.5</std><raw_data>\n</raw_data></dataset></root>")
+    data = DataContainer()
+
+    assert data.load_data(fname)
+    assert data.sample_counts().tolist() == [[0, 0]]
+    assert len(data.raw_values(0, data.column("net", "network", "step"))) == 0
+    np.testing.assert_array_equal(data.mean_values(), [[0.5, 1.5]])
+
+
+def test_load_data(write_profile):
+    # the dataset before the first global_op belongs to no test
+    fname = write_profile("profile.xml", [
+        [("pop", "pop0", "step", [9.0])],
+        [("net", "network", "global_op", [0.5]), ("net", "network", "step", [1.0, 3.0])],
+        [("net", "network", "global_op", [0.25]), ("net", "network", "step", [4.0])],
+    ], num_threads=4, rank="2")
+    data = DataContainer()
+
+    assert data.load_data(fname)
+    assert (data.paradigm(), data.num_threads(), data.rank()) == ("openmp", 4, "2")
+    assert data.num_tests() == 2
+    assert data.series() == [("net", "network", "global_op"), ("net", "network", "step")]
+    np.testing.assert_array_equal(data.raw_values(0, 1), [1.0, 3.0])
+    np.testing.assert_array_equal(data.raw_values(1, 1), [4.0])
+
+
+def test_load_data_huge_text(write_profile):
+    # more than the 10 MB text node limit of libxml2
+    raw = np.arange(2000000) % 7 + 0.125
+    fname = write_profile("huge.xml", [[("net", "network", "global_op", [0.5]), ("net", "network", "step", raw)]])
+    data = DataContainer()
+
+    assert data.load_data(fname)
+    np.testing.assert_array_equal(data.raw_values(0, 1), raw)
+
+
+def test_load_data_invalid(write_profile, tmp_path):
+    data = DataContainer()
+    assert not data.load_data(write_profile("threads.xml", [], num_threads=0))
+    assert not data.load_data(write_profile("paradigm.xml", [], paradigm=""))
+
+    fname = str(tmp_path / "broken.xml")
+    with open(fname, "w") as f:
+        f.write("<root><config><paradigm>openmp</paradigm>")
+    with pytest.raises(etree.XMLSyntaxError):
+        data.load_data(fname)
+
+
+def test_reload(write_profile):
+    data = DataContainer()
+    data.load_data(write_profile("a.xml", [[("net", "network", "global_op", [0.5]), ("pop", "pop0", "step", [1.0])]]))
+    data.load_data(write_profile("b.xml", [[("net", "network", "global_op", [0.25])]], num_threads=2))
+
+    assert data.num_threads() == 2
+    assert data.series() == [("net", "network", "global_op")]
+    np.testing.assert_array_equal(data.raw_values(0, 0), [0.25])
+
+
+# pop1 is not measured in the second test
+COLUMNS = [
+    [("net", "network", "global_op", [0.5]), ("pop", "pop0", "step", [1.0, 2.0]), ("pop", "pop1", "step", [3.0]),
+     ("proj", "proj0", "psp", [4.0, 6.0])],
+    [("net", "network", "global_op", [0.25]), ("pop", "pop0", "step", [5.0]), ("proj", "proj0", "psp", [8.0])],
+]
+
+
+@pytest.fixture
+def columns(write_profile):
+    data = DataContainer()
+    assert data.load_data(write_profile("columns.xml", COLUMNS))
+    return data
+
+
+def test_columns(columns):
+    assert columns.column("pop", "pop1", "step") == 2
+    with pytest.raises(KeyError):
+        columns.column("pop", "pop2", "step")
+    np.testing.assert_array_equal(columns.columns([("proj", "proj0", "psp"), ("pop", "pop2", "step")]), [3, -1])
+
+    np.testing.assert_array_equal(columns.mean_values(), [[0.5, 1.5, 3.0, 5.0], [0.25, 5.0, np.nan, 8.0]])
+    np.testing.assert_array_equal(columns.std_values()[:, 3], [1.0, 0.0])
+    np.testing.assert_array_equal(columns.sample_counts(), [[1, 2, 1, 2], [1, 1, 0, 1]])
+    assert not columns.mean_values().flags.writeable
+    assert not columns.raw_values(0, 1).flags.writeable
+
+
+def test_values(columns):
+    np.testing.assert_array_equal(columns.values_each_test("pop", "pop0", "step", "mean"), [1.5, 5.0])
+    raw = columns.values_each_test("proj", "proj0", "psp", "raw")
+    assert [r.tolist() for r in raw] == [[4.0, 6.0], [8.0]]
+
+    by_function = columns.values_by_function(1, "pop", "step")
+    assert list(by_function) == ["pop0"]
+    assert by_function["pop0"]["mean"] == 5.0 and by_function["pop0"]["raw"].tolist() == [5.0]
+
+    by_type = columns.values_by_type(0, "pop")
+    assert sorted(by_type) == ["pop0", "pop1"]
+    assert by_type["pop1"]["step"]["raw"].tolist() == [3.0]
+    assert columns.unique_function_names("pop") == ["pop0 - step", "pop1 - step"]
+
+
+def test_arrays(columns):
+    restored = DataContainer()
+    restored.from_arrays(columns.to_arrays(), np.array(columns.raw_buffer()))
+
+    assert restored.key() == columns.key() and restored.series() == columns.series()
+    np.testing.assert_array_equal(restored.mean_values(), columns.mean_values())
+    np.testing.assert_array_equal(restored.sample_counts(), columns.sample_counts())
+    for col in range(4):
+        np.testing.assert_array_equal(restored.raw_values(0, col), columns.raw_values(0, col))
+
+
+KERNELS = """<device>V100</device><threads_per_block>128</threads_per_block><kernels>
+<kernel><obj_type>proj</obj_type><name>proj0</name><func>psp</func><blocks>80</blocks><threads_per_block>192</threads_per_block></kernel>
+<kernel><obj_type>pop</obj_type><name>pop0</name><func>step</func><blocks>4</blocks></kernel>
+</kernels>"""
+
+
+def _cuda(write_profile, fname, config):
+    data = DataContainer()
+    assert data.load_data(write_profile(fname, [[("net", "network", "global_op", [0.5])]], paradigm="cuda", config=config))
+    return data
+
+
+def test_cuda_config(write_profile):
+    data = _cuda(write_profile, "cuda.xml", KERNELS)
+
+    assert data.is_gpu() and data.device() == "V100" and data.num_threads() == 128
+    assert data.launch_configuration("proj", "proj0", "psp") == (80, 192)
+    # the threads per block of a kernel default to the ones of the measurement
+    assert data.launch_configuration("pop", "pop0", "step") == (4, 128)
+    assert data.launch_configuration("net", "network", "step") == (0, 128)
+    assert data.key().startswith("cuda0-V100/128/")
+    assert data.label().startswith("cuda0 - V100 - 128 threads per block - kernels ")
+
+    # other kernels are another configuration
+    other = _cuda(write_profile, "other.xml", KERNELS.replace("<blocks>80</blocks>", "<blocks>160</blocks>"))
+    assert other.key() != data.key() and other.key()[:15] == data.key()[:15]
+
+    restored = DataContainer()
+    restored.from_arrays(data.to_arrays(), data.raw_buffer())
+    assert restored.key() == data.key() and restored.kernels() == data.kernels()
+
+
+def test_cuda_defaults(write_profile):
+    # neither device, block size nor kernels, num_threads is ignored
+    data = _cuda(write_profile, "cuda.xml", "")
+
+    assert data.num_threads() == 32 and data.device() == "" and data.kernels() == {}
+    assert data.key() == "cuda0-GPU/32"
+    assert data.label(rank=False) == "cuda - GPU - 32 threads per block"
+
+    openmp = DataContainer()
+    assert openmp.load_data(write_profile("openmp.xml", [[("net", "network", "global_op", [0.5])]], num_threads=4,
+                                          config="<device>V100</device>"))
+    assert not openmp.is_gpu() and openmp.key() == "openmp0-4"
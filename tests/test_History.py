@@ -0,0 +1,128 @@
+# ==============================================================================
+#
+#     test_History.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+import sqlite3
+
+import numpy as np
+import pytest
+
+from History import History
+from ProfilerCli import main
+
+
+def _test(step):
+    return [[("net", "network", "global_op", [0.5]), ("net", "network", "step", [step, step])]]
+
+
+@pytest.fixture
+def history(tmp_path):
+    db = History(str(tmp_path / "history.sqlite"))
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def ranks(write_profile):
+    return [write_profile("rank0.xml", _test(1.0), num_threads=4, rank="0"),
+            write_profile("rank1.xml", _test(2.0), num_threads=4, rank="1")]
+
+
+def test_ingest(history, ranks, write_profile, tmp_path, capsys):
+    broken = str(tmp_path / "broken.xml")
+    with open(broken, "w") as f:
+        f.write("<root>")
+
+    added = history.ingest(ranks + [ranks[0], str(tmp_path / "missing.xml"), broken], commit="abc", date=100.0)
+
+    assert added == 2 and history.num_runs() == 2
+    assert "missing.xml" in capsys.readouterr().out
+    assert history.functions() == [("net", "network", "global_op"), ("net", "network", "step")]
+    # known files are skipped
+    assert history.ingest(ranks) == 0
+
+
+def test_ranks_are_separate(history, ranks):
+    history.ingest(ranks, date=100.0)
+
+    assert history.configurations("net", "network", "step") == [("openmp", 4, "0", ""), ("openmp", 4, "1", "")]
+    values = history.series("net", "network", "step", "openmp", 4, rank="1")
+    np.testing.assert_array_equal(values["mean"], [2.0])
+    assert values["commit"] == [None] and values["rank"] == ["1"]
+
+    values = history.series("net", "network", "step", "openmp", 4)
+    assert sorted(values["rank"]) == ["0", "1"]
+    assert len(history.series("net", "network", "step", "openmp", 4, since=200.0)["date"]) == 0
+
+
+def test_devices_are_separate(history, write_profile):
+    fnames = [write_profile("v100.xml", _test(1.0), paradigm="cuda", config="<device>V100</device>"),
+              write_profile("a100.xml", _test(0.5), paradigm="cuda", config="<device>A100</device>")]
+    history.ingest(fnames)
+
+    assert history.configurations("net", "network", "step") == [("cuda", 32, "0", "A100"), ("cuda", 32, "0", "V100")]
+    values = history.series("net", "network", "step", "cuda", 32, device="A100")
+    np.testing.assert_array_equal(values["mean"], [0.5])
+
+
+def test_cancel(history, ranks):
+    assert history.ingest(ranks, cancelled=lambda: True) == 0
+    assert history.num_runs() == 0 and history.functions() == []
+
+
+def test_migration(tmp_path):
+    # a database written before rank and device were stored
+    fname = str(tmp_path / "old.sqlite")
+    db = sqlite3.connect(fname)
+    db.executescript("""
+        CREATE TABLE runs (id INTEGER PRIMARY KEY, source TEXT NOT NULL, size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL, paradigm TEXT, rank TEXT, num_threads INTEGER, num_tests INTEGER,
+            commit_id TEXT, host TEXT, date REAL NOT NULL, UNIQUE (source, size, mtime_ns));
+        CREATE TABLE functions (id INTEGER PRIMARY KEY, obj_type TEXT NOT NULL, name TEXT NOT NULL,
+            func TEXT NOT NULL, UNIQUE (obj_type, name, func));
+        CREATE TABLE measurements (function_id INTEGER NOT NULL, paradigm TEXT, num_threads INTEGER,
+            date REAL NOT NULL, run_id INTEGER NOT NULL, mean REAL, std REAL, samples INTEGER);
+        CREATE INDEX measurements_series ON measurements (function_id, paradigm, num_threads, date);
+        INSERT INTO runs VALUES (1, 'a.xml', 1, 1, 'openmp', '1', 2, 1, NULL, NULL, 10.0);
+        INSERT INTO functions VALUES (1, 'net', 'network', 'step');
+        INSERT INTO measurements VALUES (1, 'openmp', 2, 10.0, 1, 3.0, 0.0, 5);
+    """)
+    db.commit()
+    db.close()
+
+    history = History(fname)
+    try:
+        assert history.configurations("net", "network", "step") == [("openmp", 2, "1", "")]
+        np.testing.assert_array_equal(history.series("net", "network", "step", "openmp", 2, rank="1")["mean"], [3.0])
+    finally:
+        history.close()
+
+
+def test_show(tmp_path, ranks, capsys):
+    database = str(tmp_path / "cli.sqlite")
+    assert main(["history", "--database", database, "ingest", "--no-cache"] + ranks) == 0
+
+    show = ["history", "--database", database, "show", "--threads", "4", "net", "network", "step"]
+    assert main(show) == 2
+    assert "--rank" in capsys.readouterr().err
+    assert main(show + ["--rank", "1"]) == 0
+    assert main(show + ["--rank", "2"]) == 1
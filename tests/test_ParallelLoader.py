@@ -0,0 +1,61 @@
+# ==============================================================================
+#
+#     test_ParallelLoader.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+import numpy as np
+import pytest
+
+from ParallelLoader import ParallelLoader
+from ProfileCache import ProfileCache
+
+
+@pytest.fixture
+def fnames(write_profile, tmp_path):
+    good = [write_profile("profile%d.xml" % i, [[("net", "network", "global_op", [0.5]),
+                                                 ("net", "network", "step", [float(i)])]]) for i in range(2)]
+    # a dataset without mean and a file ending in the middle
+    missing_mean = write_profile("missing_mean.xml", [[("net", "network", "global_op", [0.5])]])
+    with open(missing_mean) as f:
+        content = f.read().replace("<mean>0.5</mean>", "")
+    with open(missing_mean, "w") as f:
+        f.write(content)
+    truncated = str(tmp_path / "truncated.xml")
+    with open(truncated, "w") as f:
+        f.write("<root><config>")
+
+    return [good[0], missing_mean, truncated, good[1]]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+@pytest.mark.parametrize("cached", [False, True])
+def test_broken_files(fnames, tmp_path, capsys, max_workers, cached):
+    cache = ProfileCache(str(tmp_path / "cache")) if cached else None
+
+    results = ParallelLoader(cache, max_workers).load(fnames)
+
+    assert [fname for fname, _ in results] == fnames
+    assert results[1][1] is None and results[2][1] is None
+    for i in (0, 3):
+        data = results[i][1]
+        np.testing.assert_array_equal(data.raw_values(0, data.column("net", "network", "step")), [i // 3])
+    if max_workers == 1:
+        assert capsys.readouterr().out.count("Could not load") == 2
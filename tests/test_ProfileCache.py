@@ -0,0 +1,159 @@
+# ==============================================================================
+#
+#     test_ProfileCache.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+import os
+import time
+
+import numpy as np
+import pytest
+from lxml import etree
+
+from DataContainer import DataContainer
+from ProfileCache import ORPHAN_AGE, ProfileCache
+
+DATASETS = [
+    [("net", "network", "global_op", [0.125]), ("net", "network", "step", [1.0, 2.0, 3.0]),
+     ("pop", "pop0", "step", [0.5, 0.25])],
+    [("net", "network", "global_op", [0.125]), ("net", "network", "step", [4.0, 5.0]),
+     ("pop", "pop0", "step", [0.75])],
+]
+
+
+def _count_parses(monkeypatch):
+    """
+    Count the calls of DataContainer.load_data().
+    """
+    calls = []
+    load_data = DataContainer.load_data
+
+    def counted(self, *args, **kwargs):
+        calls.append(args[0])
+        return load_data(self, *args, **kwargs)
+
+    monkeypatch.setattr(DataContainer, "load_data", counted)
+    return calls
+
+
+def _check_values(data):
+    """
+    The container holds DATASETS.
+    """
+    col = data.column("net", "network", "step")
+    np.testing.assert_array_equal(data.raw_values(0, col), [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(data.raw_values(1, col), [4.0, 5.0])
+    np.testing.assert_array_equal(data.raw_values(1, data.column("pop", "pop0", "step")), [0.75])
+    np.testing.assert_allclose(data.mean_values()[:, col], [2.0, 4.5])
+
+
+def test_hit(tmp_path, write_profile, monkeypatch):
+    fname = write_profile("profile.xml", DATASETS)
+    cache = ProfileCache(str(tmp_path / "cache"))
+    calls = _count_parses(monkeypatch)
+
+    _check_values(cache.load(fname))
+    data = cache.load(fname)
+
+    assert len(calls) == 1
+    _check_values(data)
+    assert data.key() == "openmp0-1"
+
+
+def test_miss_after_touch(tmp_path, write_profile, monkeypatch):
+    fname = write_profile("profile.xml", DATASETS)
+    cache = ProfileCache(str(tmp_path / "cache"))
+    cache.load(fname)
+
+    stat = os.stat(fname)
+    os.utime(fname, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    calls = _count_parses(monkeypatch)
+
+    assert cache.get(fname) is None
+    _check_values(cache.load(fname))
+    assert len(calls) == 1
+    assert cache.get(fname) is not None
+
+
+def test_parse_failure_leaves_no_files(tmp_path, write_profile):
+    fname = write_profile("broken.xml", DATASETS)
+    with open(fname) as f:
+        content = f.read()
+    with open(fname, "w") as f:
+        f.write(content[:len(content) // 2])
+    cache = ProfileCache(str(tmp_path / "cache"))
+
+    with pytest.raises(etree.XMLSyntaxError):
+        cache.load(fname)
+    assert os.listdir(str(tmp_path / "cache")) == []
+
+    with pytest.raises(OSError):
+        cache.load(str(tmp_path / "missing.xml"))
+    assert os.listdir(str(tmp_path / "cache")) == []
+
+
+def test_unwritable_cache(tmp_path, write_profile, capsys):
+    fname = write_profile("profile.xml", DATASETS)
+    # a file in place of the cache directory
+    (tmp_path / "cache").write_text("")
+    cache = ProfileCache(str(tmp_path / "cache"))
+
+    _check_values(cache.load(fname))
+    assert "Could not write cache entry" in capsys.readouterr().out
+
+
+def test_write_error_while_parsing(tmp_path, write_profile, monkeypatch, capsys):
+    fname = write_profile("profile.xml", DATASETS)
+    cache = ProfileCache(str(tmp_path / "cache"))
+
+    # the disk gets full after some datasets were written to the raw file
+    load_dataset = DataContainer._load_dataset
+    calls = []
+
+    def failing(self, dataset):
+        calls.append(dataset)
+        if self._raw_file is not None and len(calls) == 4:
+            raise OSError(28, "No space left on device")
+        return load_dataset(self, dataset)
+
+    monkeypatch.setattr(DataContainer, "_load_dataset", failing)
+
+    _check_values(cache.load(fname))
+    assert "Could not write cache entry" in capsys.readouterr().out
+    assert os.listdir(str(tmp_path / "cache")) == []
+
+
+def test_evict_removes_orphans(tmp_path, write_profile):
+    fname = write_profile("profile.xml", DATASETS)
+    cache = ProfileCache(str(tmp_path / "cache"))
+    cache.load(fname)
+    orphan = tmp_path / "cache" / "orphan.raw"
+    orphan.write_bytes(b"\0" * 8)
+    old = time.time() - ORPHAN_AGE - 1
+    os.utime(str(orphan), (old, old))
+    # may be written by another process right now
+    (tmp_path / "cache" / "writing.raw").write_bytes(b"\0" * 8)
+
+    cache.evict()
+
+    assert not orphan.exists()
+    assert (tmp_path / "cache" / "writing.raw").exists()
+    _check_values(cache.get(fname))
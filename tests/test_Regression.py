@@ -0,0 +1,94 @@
+# ==============================================================================
+#
+#     test_Regression.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+import numpy as np
+import pytest
+
+from DataContainer import DataContainer
+from ProfilerCli import main
+from Regression import (ADDED, compare_containers, IMPROVEMENT, REGRESSION, REGRESSION_COLUMNS, regressions,
+                        REMOVED, UNCHANGED)
+
+NOISE = np.random.default_rng(0).normal(1.0, 0.02, 50)
+
+
+def _profile(write_profile, fname, factors, raw=True):
+    """
+    Write a profiling file with one test, the pop functions take factor * NOISE,
+    without raw data only its mean is given.
+    """
+    test = [("net", "network", "global_op", [0.5])]
+    for name, factor in factors:
+        test.append(("pop", name, "step", factor * NOISE) if raw else ("pop", name, "step", [], factor))
+    return write_profile(fname, [test])
+
+
+def _load(fname):
+    data = DataContainer()
+    assert data.load_data(fname)
+    return data
+
+
+@pytest.fixture
+def measurements(write_profile):
+    baseline = _profile(write_profile, "baseline.xml", [("slower", 1.0), ("same", 1.0), ("faster", 1.0),
+                                                        ("small", 1.0), ("removed", 1.0)])
+    candidate = _profile(write_profile, "candidate.xml", [("slower", 1.5), ("same", 1.0), ("faster", 0.5),
+                                                          ("small", 1.02), ("added", 1.0)])
+    return baseline, candidate
+
+
+def test_compare_containers(measurements):
+    rows = compare_containers(_load(measurements[0]), _load(measurements[1]))
+    status = dict((row[1], row[-1]) for row in rows)
+
+    assert status == {"network": UNCHANGED, "slower": REGRESSION, "same": UNCHANGED, "faster": IMPROVEMENT,
+                      "small": UNCHANGED, "removed": REMOVED, "added": ADDED}
+    assert all(len(row) == len(REGRESSION_COLUMNS) for row in rows)
+    # sorted by the relative change, largest slowdown first
+    assert [row[1] for row in rows[:1]] == ["slower"]
+    np.testing.assert_allclose(rows[0][6], 50.0)
+    assert rows[0][7] < 0.05
+    assert [row[1] for row in regressions(rows)] == ["slower"]
+
+
+def test_without_raw_data(write_profile):
+    baseline = _load(_profile(write_profile, "baseline.xml", [("slower", 1.0), ("same", 1.0)], raw=False))
+    candidate = _load(_profile(write_profile, "candidate.xml", [("slower", 1.5), ("same", 1.0)], raw=False))
+
+    rows = compare_containers(baseline, candidate)
+    status = dict((row[1], row[-1]) for row in rows)
+
+    # no test possible, the threshold decides
+    assert status["slower"] == REGRESSION and status["same"] == UNCHANGED
+    assert np.isnan(rows[0][7])
+
+
+def test_exit_code(measurements, capsys):
+    baseline, candidate = measurements
+
+    assert main(["compare", "--no-cache", baseline, candidate]) == 1
+    assert "1 regressions" in capsys.readouterr().out
+    assert main(["compare", "--no-cache", candidate, candidate]) == 0
+    assert main(["compare", "--no-cache", "--threshold", "60", baseline, candidate]) == 0
+    assert main(["compare", "--no-cache", baseline, baseline + ".missing"]) == 2
@@ -0,0 +1,91 @@
+# ==============================================================================
+#
+#     test_Scaling.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+import numpy as np
+
+from DataContainer import DataContainer
+from Scaling import amdahl, fit_scaling, gustafson, ScalingFit, usl
+
+THREADS = np.array([1.0, 2.0, 4.0, 8.0, 16.0])
+
+
+def test_exact_models():
+    speedups = np.vstack([usl(THREADS, 0.05, 0.002), amdahl(THREADS, 0.1), gustafson(THREADS, 0.2)])
+    fit = ScalingFit(THREADS, speedups)
+
+    np.testing.assert_allclose(fit.sigma[0], 0.05, rtol=1e-9)
+    np.testing.assert_allclose(fit.kappa[0], 0.002, rtol=1e-9)
+    np.testing.assert_allclose(fit.serial[1], 0.1, rtol=1e-9)
+    np.testing.assert_allclose(fit.gustafson_serial[2], 0.2, rtol=1e-9)
+    assert fit.error["usl"][0] < 1e-9
+    assert fit.error["amdahl"][1] < 1e-9
+    assert fit.error["gustafson"][2] < 1e-9
+
+
+def test_peak():
+    fit = ScalingFit(THREADS, usl(THREADS, 0.05, 0.002)[None, :])
+
+    peak = np.sqrt(0.95 / 0.002)
+    np.testing.assert_allclose(fit.peak[0], peak)
+    np.testing.assert_allclose(fit.peak_speedup[0], usl(peak, 0.05, 0.002))
+    assert fit.recommended_threads(0) == 22
+    assert fit.recommended_threads(0, max_threads=16) == 16
+
+
+def test_no_coherence():
+    # Amdahl's law is the USL without coherence
+    fit = ScalingFit(THREADS, amdahl(THREADS, 0.1)[None, :])
+
+    np.testing.assert_allclose(fit.sigma[0], 0.1, rtol=1e-9)
+    assert fit.kappa[0] == 0.0
+    assert np.isinf(fit.peak[0])
+    np.testing.assert_allclose(fit.peak_speedup[0], 10.0)
+
+
+def test_without_speedups():
+    fit = ScalingFit(THREADS, np.full((1, len(THREADS)), np.nan))
+
+    assert np.isnan(fit.sigma[0]) and np.isnan(fit.serial[0])
+    assert fit.recommended_threads(0) is None
+
+
+def test_fit_scaling(write_profile):
+    data = {}
+    for threads in THREADS.astype(int):
+        step = 10.0 / usl(threads, 0.05, 0.002)
+        fname = write_profile("openmp_%d.xml" % threads, [[("net", "network", "global_op", [0.5]),
+                                                          ("net", "network", "step", [step])]],
+                              num_threads=threads)
+        container = DataContainer()
+        assert container.load_data(fname)
+        data[container.key()] = container
+
+    series, threads, fit = fit_scaling(data)["openmp0"]
+
+    np.testing.assert_array_equal(threads, THREADS)
+    row = series.index(("net", "network", "step"))
+    np.testing.assert_allclose(fit.sigma[row], 0.05, rtol=1e-9)
+    np.testing.assert_allclose(fit.kappa[row], 0.002, rtol=1e-9)
+    # no speedup at all
+    row = series.index(("net", "network", "global_op"))
+    assert fit.sigma[row] == 1.0
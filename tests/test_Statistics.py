@@ -0,0 +1,167 @@
+# ==============================================================================
+#
+#     test_Statistics.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+import math
+
+import numpy as np
+import pytest
+
+from Statistics import bootstrap, bootstrap_distribution, mann_whitney, split_phases
+
+
+def test_mann_whitney():
+    # U = 0, z = (4.5 - 0.5) / sqrt(3 * 3 * 7 / 12)
+    u, p = mann_whitney([1.0, 2.0, 3.0], [4.0, 5.0, 6.0])
+    assert u == 0.0
+    np.testing.assert_allclose(p, math.erfc(4.0 / math.sqrt(5.25) / math.sqrt(2.0)))
+    np.testing.assert_allclose(p, 0.0808555983700523)
+
+    u, p_reverse = mann_whitney([4.0, 5.0, 6.0, np.nan], [1.0, 2.0, 3.0])
+    assert u == 9.0
+    assert p_reverse == p
+
+
+def test_mann_whitney_ties():
+    # ranks of x: 1, 3, 3, 5.5, ties of 3 and 2 values reduce the variance to 16 / 12 * (9 - 30 / 56)
+    u, p = mann_whitney([1.0, 2.0, 2.0, 3.0], [2.0, 3.0, 4.0, 5.0])
+    assert u == 2.5
+    np.testing.assert_allclose(p, math.erfc(5.0 / math.sqrt(16.0 / 12.0 * (9.0 - 30.0 / 56.0)) / math.sqrt(2.0)))
+
+    assert mann_whitney([1.0, 1.0], [1.0, 1.0]) == (2.0, 1.0)
+
+
+def test_mann_whitney_empty():
+    u, p = mann_whitney([np.nan], [1.0, 2.0])
+    assert np.isnan(u) and np.isnan(p)
+
+
+def test_bootstrap_constant():
+    estimate, lower, upper = bootstrap([np.full(50, 2.5), np.zeros(0)], "median", 1000, seed=0)
+
+    np.testing.assert_array_equal(estimate[:1], [2.5])
+    np.testing.assert_array_equal(lower[:1], [2.5])
+    np.testing.assert_array_equal(upper[:1], [2.5])
+    assert np.isnan(estimate[1]) and np.isnan(lower[1]) and np.isnan(upper[1])
+
+
+def test_bootstrap_reproducible():
+    sample = np.random.default_rng(1).normal(1.0, 0.1, 200)
+
+    first = bootstrap([sample], "mean", 2000, seed=3)
+    second = bootstrap([sample], "mean", 2000, seed=3)
+
+    np.testing.assert_array_equal(np.array(first), np.array(second))
+
+
+@pytest.mark.parametrize("distinct, max_categories", [(20, 1024), (20, 10), (2000, 10)])
+def test_bootstrap_distribution_of_mean(distinct, max_categories):
+    # drawn as counts or, above max_categories distinct values, as indices
+    sample = np.random.default_rng(1).lognormal(0.0, 1.0, distinct)
+    sample = np.repeat(sample, 2000 // distinct)
+    rng = np.random.default_rng(0)
+
+    distribution = bootstrap_distribution(sample, "mean", 20000, rng, max_categories)
+
+    # the standard error of the mean
+    np.testing.assert_allclose(distribution.mean(), sample.mean(), rtol=0.01)
+    np.testing.assert_allclose(distribution.std(), sample.std() / math.sqrt(len(sample)), rtol=0.05)
+
+
+@pytest.mark.parametrize("statistic", ["mean", "median"])
+def test_bootstrap_contains_estimate(statistic):
+    # skewed, all values distinct, more than max_categories
+    sample = np.random.default_rng(2).lognormal(0.0, 1.0, 2000)
+
+    estimate, lower, upper = bootstrap([sample], statistic, 2000, seed=0, max_categories=100)
+
+    func = np.mean if statistic == "mean" else np.median
+    assert estimate[0] == func(sample)
+    assert lower[0] < estimate[0] < upper[0]
+
+
+@pytest.mark.parametrize("statistic", ["mean", "median"])
+def test_bootstrap_bins(statistic):
+    # the interval of 32 bins is close to the exact one of 500 distinct values
+    sample = np.random.default_rng(3).lognormal(0.0, 1.0, 500)
+
+    _, exact_lower, exact_upper = bootstrap([sample], statistic, 10000, seed=0, max_categories=500)
+    _, lower, upper = bootstrap([sample], statistic, 10000, seed=0, max_categories=32)
+
+    width = exact_upper[0] - exact_lower[0]
+    assert abs(lower[0] - exact_lower[0]) < 0.05 * width
+    assert abs(upper[0] - exact_upper[0]) < 0.05 * width
+
+
+def test_bootstrap_unknown_statistic():
+    with pytest.raises(ValueError):
+        bootstrap([np.ones(3)], "mode")
+
+
+def test_split_phases():
+    # a warm-up of 10 slow steps, a constant series, an alternating series and an empty one
+    raw = np.concatenate((np.full(10, 10.0), np.ones(90), np.full(5, 3.0), [5.0, 1.0, 5.0, 1.0]))
+
+    phases = split_phases(raw, [[0, 100], [105, 0]], [[100, 5], [4, 0]])
+
+    np.testing.assert_array_equal(phases["warmup"], [[10, 0], [0, 0]])
+    np.testing.assert_allclose(phases["warmup_mean"][0, 0], 10.0)
+    np.testing.assert_allclose(phases["warmup_std"][0, 0], 0.0, atol=1e-6)
+    np.testing.assert_allclose(phases["steady_mean"], [[1.0, 3.0], [3.0, np.nan]])
+    np.testing.assert_allclose(phases["steady_std"], [[0.0, 0.0], [2.0, np.nan]])
+    assert np.isnan(phases["warmup_mean"][0, 1])
+
+
+def test_split_phases_noise():
+    # a step of 0.1 is below the noise of the alternating values
+    raw = 5.0 + (-1.0) ** np.arange(100)
+    raw[:10] += 0.1
+
+    phases = split_phases(raw, [0], [100])
+    assert phases["warmup"][0] == 0
+    np.testing.assert_allclose(phases["steady_mean"][0], raw.mean())
+
+    # without the noise it is a warm-up
+    phases = split_phases(np.concatenate((np.full(10, 5.1), np.full(90, 5.0))), [0], [100])
+    assert phases["warmup"][0] == 10
+
+
+def test_split_phases_max_fraction():
+    raw = np.concatenate((np.full(30, 2.0), np.ones(70)))
+
+    assert split_phases(raw, [0], [100])["warmup"][0] == 30
+    assert split_phases(raw, [0], [100], max_fraction=0.2)["warmup"][0] <= 20
+
+
+@pytest.mark.parametrize("bad", [np.nan, np.inf])
+def test_split_phases_non_finite(bad):
+    # a non-finite value in the second series does not affect the others
+    series = np.concatenate((np.full(10, 5.0), np.ones(90)))
+    raw = np.concatenate((series, series, series))
+    raw[150] = bad
+
+    phases = split_phases(raw, [0, 100, 200], [100, 100, 100])
+
+    np.testing.assert_array_equal(phases["warmup"][[0, 2]], [10, 10])
+    np.testing.assert_allclose(phases["warmup_mean"][[0, 2]], [5.0, 5.0])
+    np.testing.assert_allclose(phases["steady_mean"][[0, 2]], [1.0, 1.0])
+    assert np.isnan(phases["steady_mean"][1])
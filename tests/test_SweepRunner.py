@@ -0,0 +1,132 @@
+# ==============================================================================
+#
+#     test_SweepRunner.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+import os
+import shutil
+import time
+
+import pytest
+
+import SweepRunner
+from SweepRunner import parse_threads
+
+# stands in for an ANNarchy script: logs its affinity and the time it ran, writes a
+# profiling file for the number of threads and optionally starts a child and hangs
+SCRIPT = '''
+import argparse, os, subprocess, sys, time
+parser = argparse.ArgumentParser()
+parser.add_argument("-j", type=int, default=1)
+parser.add_argument("--profile", action="store_true")
+parser.add_argument("--profile_out")
+parser.add_argument("--hang", action="store_true")
+args = parser.parse_args()
+print("affinity", ",".join(str(core) for core in sorted(os.sched_getaffinity(0))))
+if args.hang:
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+    print("child", child.pid, flush=True)
+    time.sleep(60)
+start = time.time()
+time.sleep(0.3)
+with open(args.profile_out, "w") as f:
+    f.write("<root><config><paradigm>openmp</paradigm><num_threads>%d</num_threads></config>"
+            "<dataset><obj_type>net</obj_type><name>network</name><func>global_op</func>"
+            "<mean>1</mean><std>0</std><raw_data>1</raw_data></dataset></root>" % args.j)
+print("time", start, time.time())
+'''
+
+
+def _log(run, key):
+    """
+    Return the values of the line of the log starting with key.
+    """
+    with open(run.log) as f:
+        for line in f:
+            if line.startswith(key + " "):
+                return line.split()[1:]
+    return None
+
+
+@pytest.fixture
+def script(tmp_path):
+    with open(str(tmp_path / "script.py"), "w") as f:
+        f.write(SCRIPT)
+    return "script.py"
+
+
+def test_parse_threads():
+    assert parse_threads("1,2,4-6") == [1, 2, 4, 5, 6]
+    assert parse_threads(" 8, 1-2 ,2,") == [1, 2, 8]
+    assert parse_threads("3") == [3]
+
+    for text in ["", "a", "0", "1-x", "3-1", "0-2"]:
+        with pytest.raises(ValueError):
+            parse_threads(text)
+
+
+def test_pinned():
+    assert SweepRunner._pinned(["python"], None) == ["python"]
+    assert SweepRunner._pinned(["python", "a.py"], [0, 2, 3]) == ["taskset", "-c", "0,2,3", "python", "a.py"]
+
+
+@pytest.mark.skipif(shutil.which("taskset") is None, reason="needs taskset")
+def test_pinned_to_cores(tmp_path, script):
+    runner = SweepRunner.SweepRunner(script, str(tmp_path), threads=[1], out_dir=str(tmp_path))
+
+    run, = runner.run()
+
+    assert run.succeeded() and run.returncode == 0
+    assert [int(core) for core in _log(run, "affinity")] == run.cores
+    assert run.cores == SweepRunner.available_cores()[:1]
+
+
+def test_schedule(tmp_path, script, monkeypatch):
+    # pretend six cores, the commands are not pinned as the machine may have less
+    monkeypatch.setattr(SweepRunner, "available_cores", lambda: list(range(6)))
+    monkeypatch.setattr(SweepRunner, "_pinned", lambda command, cores: command)
+    runner = SweepRunner.SweepRunner(script, str(tmp_path), threads=[1, 2, 3], out_dir=str(tmp_path))
+
+    runs = runner.run()
+
+    assert [run.num_threads for run in runs] == [1, 2, 3]
+    assert all(run.succeeded() for run in runs)
+    assert [run.data.num_threads() for run in runs] == [1, 2, 3]
+    assert [len(run.cores) for run in runs] == [1, 2, 3]
+
+    times = dict((run.num_threads, [float(t) for t in _log(run, "time")]) for run in runs)
+    # the first run compiles the network and runs alone
+    assert times[1][1] <= min(times[2][0], times[3][0])
+    # the others run at the same time on disjoint cores
+    assert times[2][0] < times[3][1] and times[3][0] < times[2][1]
+    assert set(runs[1].cores).isdisjoint(runs[2].cores)
+
+
+def test_timeout_kills_children(tmp_path, script):
+    runner = SweepRunner.SweepRunner(script, str(tmp_path), args="--hang", threads=[1], out_dir=str(tmp_path),
+                                     timeout=1)
+
+    run, = runner.run()
+
+    assert run.returncode < 0 and not run.succeeded()
+    child = int(_log(run, "child")[0])
+    time.sleep(0.2)
+    assert not os.path.exists("/proc/%d" % child) or open("/proc/%d/stat" % child).read().split()[2] == "Z"
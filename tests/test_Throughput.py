@@ -0,0 +1,116 @@
+# ==============================================================================
+#
+#     test_Throughput.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+import json
+
+import numpy as np
+import pytest
+
+from DataContainer import DataContainer, read_sizes
+from ProfileCache import ProfileCache
+from Throughput import parse_cost, Roofline, roofline_points, throughput_table
+
+# the second object has no size and the third no name, both are skipped
+SIZES = """<sizes>
+<object><obj_type>pop</obj_type><name>pop0</name><size>1000</size></object>
+<object><obj_type>proj</obj_type><name>proj0</name></object>
+<object><obj_type>proj</obj_type><size>10</size></object>
+</sizes>"""
+
+DATASETS = [[("net", "network", "global_op", [0.5]), ("pop", "pop0", "step", [2.0]), ("proj", "proj0", "psp", [4.0])]]
+
+
+@pytest.fixture
+def profile(write_profile):
+    return write_profile("profile.xml", DATASETS, num_threads=2, config=SIZES)
+
+
+def test_sizes(profile):
+    data = DataContainer()
+    assert data.load_data(profile)
+
+    assert data.sizes() == {("pop", "pop0"): 1000}
+    data.set_sizes({("proj", "proj0"): 250000, ("pop", "pop0"): 500})
+    assert data.sizes() == {("pop", "pop0"): 500, ("proj", "proj0"): 250000}
+
+
+def test_sizes_cached(profile, tmp_path):
+    cache = ProfileCache(str(tmp_path / "cache"))
+    cache.load(profile)
+
+    assert cache.load(profile).sizes() == {("pop", "pop0"): 1000}
+
+
+def test_read_sizes(tmp_path):
+    fname = tmp_path / "sizes.json"
+    fname.write_text(json.dumps({"pop": {"pop0": 1000}, "proj": {"proj0": 250000}}))
+    assert read_sizes(fname) == {("pop", "pop0"): 1000, ("proj", "proj0"): 250000}
+
+    data = DataContainer()
+    data.load_sizes(str(fname))
+    assert data.sizes()[("proj", "proj0")] == 250000
+
+
+@pytest.mark.parametrize("content", ['["pop0"]', '{"pop": 1000}', '{"pop": {"pop0": "many"}}', '{"pop": '])
+def test_read_sizes_invalid(tmp_path, content):
+    fname = tmp_path / "sizes.json"
+    fname.write_text(content)
+
+    with pytest.raises(ValueError):
+        read_sizes(fname)
+
+
+def test_parse_cost():
+    assert parse_cost("proj:psp=2:12") == (("proj", "psp"), (2.0, 12.0))
+    with pytest.raises(ValueError):
+        parse_cost("proj:psp=2")
+
+
+def test_throughput_table(profile):
+    data = DataContainer()
+    assert data.load_data(profile)
+    data.set_sizes({("proj", "proj0"): 250000})
+    roofline = Roofline(100.0, 1000.0)
+
+    rows = throughput_table({data.key(): data}, roofline=roofline)
+
+    # 1000 neurons in 2 ms, 10 FLOP and 40 bytes each
+    assert [row[2:6] for row in rows] == [["pop", "pop0", "step", 1000], ["proj", "proj0", "psp", 250000]]
+    np.testing.assert_allclose(rows[0][7:10], [5e5, 5e-3, 2e-2])
+    np.testing.assert_allclose(rows[0][10], 100.0 * 5e-3 / 25.0)
+    assert rows[0][11] == "memory"
+
+    label, threads, intensity, gflops = roofline_points({data.key(): data})[0]
+    assert label == "pop step (openmp0)"
+    np.testing.assert_array_equal(threads, [2])
+    np.testing.assert_allclose(intensity, [0.25])
+
+
+def test_roofline():
+    roofline = Roofline(100.0, 1000.0)
+
+    assert roofline.ridge() == 10.0
+    np.testing.assert_allclose(roofline.attainable([1.0, 100.0]), [100.0, 1000.0])
+    assert roofline.bound(20.0) == "compute"
+    with pytest.raises(ValueError):
+        Roofline(0.0, 1000.0)
@@ -0,0 +1,93 @@
+# ==============================================================================
+#
+#     test_Timeline.py
+#
+#     This file is part of ANNarchyProfiler.
+#
+#     Copyright (C) 2016-2019  Toni Freitag <tfreitag93@gmail.com>,
+#     Helge Uelo Dinkelbach <helge.dinkelbach@gmail.com>
+#
+#     This program is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     ANNarchyProfiler is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ==============================================================================
+import numpy as np
+
+from Timeline import LEVEL_FACTOR, MinMaxPyramid
+
+
+def test_levels():
+    pyramid = MinMaxPyramid(np.arange(100.0))
+
+    # 100, 25, 7, 2 and 1 buckets
+    assert len(pyramid) == 100
+    assert pyramid.num_levels() == 5
+    assert pyramid.limits() == (0.0, 99.0)
+    assert MinMaxPyramid(np.zeros(0)).num_levels() == 1
+    assert np.isnan(MinMaxPyramid(np.zeros(0)).limits()[0])
+
+
+def test_envelope_level_0():
+    values = np.arange(100.0)
+    level, x, minimum, maximum = MinMaxPyramid(values).envelope(10, 20, 200)
+
+    assert level == 0
+    np.testing.assert_array_equal(x, np.arange(10, 20))
+    np.testing.assert_array_equal(minimum, values[10:20])
+    np.testing.assert_array_equal(maximum, values[10:20])
+
+
+def test_envelope_buckets():
+    level, x, minimum, maximum = MinMaxPyramid(np.arange(100.0)).envelope(0, 100, 10)
+
+    # 100 samples need buckets of 16 for at most 10 points per 4 buckets
+    assert level == 2 and LEVEL_FACTOR ** level == 16
+    np.testing.assert_array_equal(x, np.arange(7) * 16 + 7.5)
+    np.testing.assert_array_equal(minimum, np.arange(7) * 16)
+    np.testing.assert_array_equal(maximum, [15, 31, 47, 63, 79, 95, 99])
+
+
+def test_envelope_keeps_spikes():
+    values = np.zeros(10000)
+    values[5371] = 5.0
+    values[8000] = -2.0
+    pyramid = MinMaxPyramid(values)
+
+    for max_points in (10, 100, 1000, 20000):
+        level, x, minimum, maximum = pyramid.envelope(0, len(values), max_points)
+        assert len(x) <= max_points or level == 0
+        assert maximum.max() == 5.0 and minimum.min() == -2.0
+
+        size = LEVEL_FACTOR ** level
+        np.testing.assert_allclose(x[np.argmax(maximum)], (5371 // size + 0.5) * size - 0.5)
+
+
+def test_envelope_clipped():
+    pyramid = MinMaxPyramid(np.arange(100.0))
+
+    level, x, minimum, maximum = pyramid.envelope(-5.5, 1e9, 1000)
+    assert level == 0 and len(x) == 100
+
+    level, x, minimum, maximum = pyramid.envelope(50, 50, 10)
+    assert len(x) == 0 and len(minimum) == 0 and len(maximum) == 0
+
+
+def test_line():
+    pyramid = MinMaxPyramid(np.arange(8.0))
+
+    x, y = pyramid.line(0, 8, 2)
+    np.testing.assert_array_equal(x, [1.5, 1.5, 5.5, 5.5])
+    np.testing.assert_array_equal(y, [0.0, 3.0, 4.0, 7.0])
+
+    x, y = pyramid.line(0, 8, 8)
+    np.testing.assert_array_equal(y, np.arange(8.0))